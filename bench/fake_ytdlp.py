@@ -0,0 +1,136 @@
+"""Kıyaslama için sahte yt-dlp.
+
+Motorun verdiği argümanları (-o, --progress-template, --load-info-json,
+--dump-single-json) anlar, medyayı yerel sentetik sunucudan (media_server.py)
+indirir ve gerçek yt-dlp'ye benzeyen çıktı ile ilerleme satırları yazar.
+
+Davranış ortam değişkenleriyle ayarlanır:
+    FAKE_YTDLP_PROGRESS_HZ  saniyedeki en fazla ilerleme satırı (varsayılan 10)
+    FAKE_YTDLP_SLEEP        indirmeden önce bekleme, bilgi çıkarma süresi (sn)
+    FAKE_YTDLP_FAIL_RATE    hata verecek URL oranı, 0-1 (URL'ye göre sabittir)
+    FAKE_YTDLP_FAIL_KIND    bu hataların türü: permanent | network | throttled
+    FAKE_YTDLP_DISCARD      1 ise indirilen veri diske yazılmaz (büyük kuyruklar için)
+
+URL'deki fail=<tür> parametresi o öğeyi her zaman başarısız yapar.
+"""
+import http.client
+import json
+import os
+import sys
+import time
+import urllib.parse
+import zlib
+
+VERSION = "2099.01.01-bench"
+PROGRESS_PREFIX = "[ytd-progress]"
+FAILURE_MESSAGES = {
+    "permanent": "ERROR: [generic] {name}: Video unavailable",
+    "network": "ERROR: [generic] Unable to download webpage: <urlopen error timed out>",
+    "throttled": "ERROR: unable to download video data: HTTP Error 429: Too Many Requests",
+}
+
+
+def option_value(args, name):
+    if name in args:
+        return args[args.index(name) + 1]
+    return None
+
+
+def fail_kind(url):
+    """Bu URL başarısız olacaksa hata türünü döndürür."""
+    query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+    if "fail" in query:
+        return query["fail"] if query["fail"] in FAILURE_MESSAGES else "permanent"
+    rate = float(os.environ.get("FAKE_YTDLP_FAIL_RATE", 0))
+    if rate and zlib.crc32(url.encode()) % 10000 < rate * 10000:
+        return os.environ.get("FAKE_YTDLP_FAIL_KIND", "permanent")
+    return None
+
+
+def media_name(url):
+    return os.path.splitext(os.path.basename(urllib.parse.urlsplit(url).path))[0] or "media"
+
+
+def open_media(url, method="GET"):
+    parsed = urllib.parse.urlsplit(url)
+    connection = http.client.HTTPConnection(parsed.netloc, timeout=30)
+    path = parsed.path + ("?" + parsed.query if parsed.query else "")
+    connection.request(method, path)
+    return connection, connection.getresponse()
+
+
+def dump_json(url):
+    connection, response = open_media(url, "HEAD")
+    size = int(response.getheader("Content-Length") or 0)
+    connection.close()
+    name = media_name(url)
+    print(json.dumps({
+        "id": name, "title": name, "ext": "mp4", "extractor": "generic",
+        "extractor_key": "Generic", "webpage_url": url, "filesize": size,
+        # Süre boyuta bağlı tutulur: en kısa iş önce sıralaması sınanabilsin
+        "duration": max(1, size // 16384),
+    }))
+    return 0
+
+
+def download(url, output_template):
+    name = media_name(url)
+    print(f"[generic] Extracting URL: {url}")
+    print(f"[generic] {name}: Downloading webpage", flush=True)
+    time.sleep(float(os.environ.get("FAKE_YTDLP_SLEEP", 0)))
+    kind = fail_kind(url)
+    if kind:
+        print(FAILURE_MESSAGES[kind].format(name=name), flush=True)
+        return 1
+
+    filename = output_template.replace("%(title)s", name).replace("%(ext)s", "mp4")
+    print(f"[info] {name}: Downloading 1 format(s): 18")
+    print(f"[download] Destination: {filename}", flush=True)
+    interval = 1.0 / max(float(os.environ.get("FAKE_YTDLP_PROGRESS_HZ", 10)), 0.001)
+    connection, response = open_media(url)
+    if response.status != 200:
+        print(f"ERROR: unable to download video data: HTTP Error {response.status}: {response.reason}")
+        return 1
+    total = int(response.getheader("Content-Length") or 0)
+    started = last = time.monotonic()
+    downloaded = 0
+    discard = os.environ.get("FAKE_YTDLP_DISCARD") == "1"
+    with open(os.devnull if discard else filename + ".part", "wb") as f:
+        while True:
+            chunk = response.read(16384)
+            if not chunk:
+                break
+            f.write(chunk)
+            downloaded += len(chunk)
+            now = time.monotonic()
+            if now - last >= interval:
+                last = now
+                speed = downloaded / max(now - started, 1e-6)
+                eta = int((total - downloaded) / speed) if total else "NA"
+                print(f"{PROGRESS_PREFIX} {downloaded} {total or 'NA'} NA {speed:.1f} {eta}", flush=True)
+    connection.close()
+    if not discard:
+        os.replace(filename + ".part", filename)
+    elapsed = max(time.monotonic() - started, 1e-6)
+    print(f"{PROGRESS_PREFIX} {downloaded} {downloaded} NA {downloaded / elapsed:.1f} 0")
+    print(f"[download] 100% of {downloaded}B in {elapsed:.2f}s", flush=True)
+    return 0
+
+
+def main(args):
+    if "--version" in args:
+        print(VERSION)
+        return 0
+    info_path = option_value(args, "--load-info-json")
+    if info_path:
+        with open(info_path, "r", encoding="utf-8") as f:
+            url = json.load(f)["webpage_url"]
+    else:
+        url = args[-1]
+    if "--dump-single-json" in args:
+        return dump_json(url)
+    return download(url, option_value(args, "-o") or "%(title)s.%(ext)s")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
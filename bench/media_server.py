@@ -0,0 +1,96 @@
+"""Kıyaslama için sentetik medya sunan yerel HTTP sunucusu.
+
+GET /media/<ad>.mp4?size=<bayt>&rate=<bayt/sn>&status=<kod>
+    size   : gövde boyutu (varsayılan 64 KiB)
+    rate   : saniyede gönderilecek en fazla bayt (0 = sınırsız)
+    status : 200 dışında bir kod verilirse gövdesiz o kodla yanıtlar
+
+Tek başına da çalıştırılabilir: python bench/media_server.py --port 8765
+"""
+import argparse
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_MEDIA_SIZE = 64 * 1024
+CHUNK_SIZE = 16 * 1024
+# Tüm yanıtlarda tekrar eden sabit içerik (üretim maliyeti ölçüme karışmasın)
+CHUNK = bytes(range(256)) * (CHUNK_SIZE // 256)
+
+
+class SyntheticMediaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _params(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        return parsed.path, query
+
+    def _send_headers(self):
+        path, query = self._params()
+        if not path.startswith("/media/"):
+            self.send_error(404)
+            return None
+        status = int(query.get("status", 200))
+        if status != 200:
+            self.send_error(status)
+            return None
+        size = int(query.get("size", DEFAULT_MEDIA_SIZE))
+        self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        return size, int(query.get("rate", 0))
+
+    def do_HEAD(self):
+        self._send_headers()
+
+    def do_GET(self):
+        result = self._send_headers()
+        if result is None:
+            return
+        size, rate = result
+        started = time.monotonic()
+        sent = 0
+        try:
+            while sent < size:
+                chunk = CHUNK[:min(CHUNK_SIZE, size - sent)]
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                if rate:
+                    # Hız sınırı: gönderilen miktarın gerektirdiği süreye kadar bekle
+                    delay = sent / rate - (time.monotonic() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        # Kıyaslama çıktısını istek satırlarıyla kirletme
+        pass
+
+
+def start_server(host="127.0.0.1", port=0):
+    """Sunucuyu arka plan iş parçacığında başlatır; (sunucu, temel URL) döndürür."""
+    server = ThreadingHTTPServer((host, port), SyntheticMediaHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik medya sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer((args.host, args.port), SyntheticMediaHandler)
+    print(f"http://{args.host}:{args.port}/media/ornek.mp4 adresinde dinleniyor")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
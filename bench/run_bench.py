@@ -0,0 +1,363 @@
+"""Uygulamanın kendi yükünü ölçen çevrimdışı kıyaslama.
+
+yt-dlp yerine sahte bir yt-dlp (fake_ytdlp.py) ve yerel sentetik medya sunucusu
+(media_server.py) kullanılır; ağ ve site davranışı sabit tutulduğu için
+ölçülen fark motorun, kuyruğun ve arayüz döngüsünün maliyetidir.
+
+Her kuyruk boyutu ayrı bir süreçte çalıştırılır ve şunlar raporlanır:
+    items_per_min         dakikada biten öğe
+    enqueue_ms            URL'lerin tekilleştirilip kuyruğa eklenme süresi
+    stall_p50/p95/p99/max ana döngü gecikmesi (ms)
+    peak_rss_mb           en yüksek bellek kullanımı
+    cpu_ms_per_job        uygulamanın öğe başına CPU süresi
+    child_cpu_ms_per_job  yt-dlp işlemlerinin öğe başına CPU süresi (başlatma dahil)
+
+Örnekler:
+    python bench/run_bench.py                          # 10, 1k ve 50k öğe
+    python bench/run_bench.py --sizes 10,1000 -j 8 -o sonuc.json
+    python bench/run_bench.py --baseline sonuc.json    # önceki sonuçla karşılaştır
+    python bench/run_bench.py --gui --sizes 1000       # Tk arayüzüyle (ekran gerekir)
+"""
+import argparse
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+
+try:
+    import resource
+except ImportError:  # Windows: bellek ve alt işlem CPU ölçümü yapılmaz
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from downloader_core import DownloadEngine, JobStore, parse_rate, video_key  # noqa: E402
+from media_server import start_server  # noqa: E402
+
+DEFAULT_SIZES = "10,1000,50000"
+# Ana döngü gecikme ölçümünün aralığı (sn)
+TICK_SECONDS = 0.01
+# Arayüzdeki ilerleme yenileme aralığının karşılığı (sn)
+PROGRESS_REFRESH_SECONDS = 0.25
+CONSOLE_MAX_LINES = 2000
+# (alan, büyük değer daha iyi mi) - karşılaştırma tablosunda kullanılır
+METRICS = [
+    ("items_per_min", True),
+    ("enqueue_ms", False),
+    ("stall_p50_ms", False),
+    ("stall_p95_ms", False),
+    ("stall_p99_ms", False),
+    ("stall_max_ms", False),
+    ("peak_rss_mb", False),
+    ("cpu_ms_per_job", False),
+    ("child_cpu_ms_per_job", False),
+]
+
+
+def write_launcher(directory):
+    """Motorun tek bir çalıştırılabilir yol olarak başlatacağı sahte yt-dlp sarmalayıcısı."""
+    fake = os.path.join(BENCH_DIR, "fake_ytdlp.py")
+    if sys.platform == "win32":
+        path = os.path.join(directory, "yt-dlp.cmd")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'@"{sys.executable}" -S "{fake}" %*\n')
+    else:
+        path = os.path.join(directory, "yt-dlp")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" -S "{fake}" "$@"\n')
+        os.chmod(path, 0o755)
+    return path
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def make_urls(base_url, count, args):
+    query = f"size={parse_rate(args.media_size)}"
+    if args.media_rate:
+        query += f"&rate={parse_rate(args.media_rate)}"
+    return [f"{base_url}/media/item{index:06d}.mp4?{query}" for index in range(count)]
+
+
+def resource_usage():
+    """(uygulama CPU sn, alt işlemler CPU sn, en yüksek RSS MB)"""
+    cpu = time.process_time()
+    if resource is None:
+        return cpu, None, None
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KiB, macOS'ta bayt
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    return cpu, children.ru_utime + children.ru_stime, peak_mb
+
+
+def run_engine(urls, args, work_dir, launcher):
+    """Motoru arayüzsüz çalıştırır; ana iş parçacığı arayüz döngüsünün işini taklit eder."""
+    download_dir = os.path.join(work_dir, "downloads")
+    os.makedirs(download_dir)
+    ui_queue = queue.SimpleQueue()
+    finished = threading.Event()
+    summary = {}
+
+    def on_finished(result):
+        summary.update(result)
+        finished.set()
+
+    job_store = JobStore(os.path.join(work_dir, "jobs.db"))
+    engine = DownloadEngine(
+        launcher,
+        job_store=job_store,
+        log=lambda message: ui_queue.put(("log", str(message))),
+        on_item_state=lambda key, state: ui_queue.put(("state", key, state)),
+        on_finished=on_finished,
+        backend="subprocess",
+        per_host_limit=args.jobs,
+        max_retries=args.retries,
+    )
+    options = {
+        "download_dir": download_dir,
+        "format": "mp4",
+        "download_both": False,
+        "quality": "high",
+        "performance_args": [],
+    }
+
+    # Arayüzdeki add_urls'in karşılığı: tekilleştirme ve kalıcı kuyruğa yazma
+    started = time.perf_counter()
+    items = {}
+    for url in urls:
+        items.setdefault(video_key(url), url)
+    job_store.add_many(list(items.items()))
+    engine.set_order(list(items.values()))
+    enqueue_ms = (time.perf_counter() - started) * 1000
+
+    console = deque(maxlen=CONSOLE_MAX_LINES)
+    states = {}
+    stalls = []
+    engine.start(list(items.values()), options, args.jobs)
+    next_tick = time.perf_counter()
+    next_progress = next_tick
+    while not finished.is_set():
+        next_tick += TICK_SECONDS
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        now = time.perf_counter()
+        stalls.append(max(0.0, now - next_tick) * 1000)
+        if now - next_tick > TICK_SECONDS:
+            # Geride kalındıysa birikmiş tikler atlanır (Tk'nin after davranışı)
+            next_tick = now
+        while True:
+            try:
+                item = ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "log":
+                console.append(item[1])
+            else:
+                states[item[1]] = item[2]
+        if now >= next_progress:
+            next_progress = now + PROGRESS_REFRESH_SECONDS
+            engine.progress_snapshot()
+    engine.shutdown()
+    job_store.conn.close()
+    return summary, enqueue_ms, stalls
+
+
+def run_gui(urls, args, work_dir, launcher):
+    """Aynı ölçümü gerçek Tk arayüzüyle yapar (listbox, konsol, ilerleme yenileme dahil)."""
+    import tkinter as tk
+    import youtube_downloader
+
+    download_dir = os.path.join(work_dir, "downloads")
+    os.makedirs(download_dir)
+    config_path = os.path.join(work_dir, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "download_dir": download_dir,
+            "max_concurrent_downloads": args.jobs,
+            "per_host_limit": args.jobs,
+            "max_retries": args.retries,
+            "backend": "subprocess",
+            "prefetch_metadata": False,
+            "use_download_archive": False,
+            "auto_update_ytdlp": False,
+        }, f)
+    # Kullanıcının config.json, jobs.db ve yt-dlp'sine dokunulmaz
+    youtube_downloader.get_config_path = lambda: config_path
+    youtube_downloader.get_default_ytdlp_path = lambda: launcher
+
+    root = tk.Tk()
+    app = youtube_downloader.YoutubeDownloader(root)
+    summary = {}
+    stalls = []
+    timing = {}
+    on_batch_finished = app._on_batch_finished
+
+    def finish(result):
+        on_batch_finished(result)
+        summary.update(result)
+        root.quit()
+
+    app._on_batch_finished = finish
+
+    def tick(scheduled):
+        now = time.perf_counter()
+        stalls.append(max(0.0, now - scheduled) * 1000)
+        root.after(int(TICK_SECONDS * 1000), tick, now + TICK_SECONDS)
+
+    def begin():
+        started = time.perf_counter()
+        app.add_urls(urls)
+        timing["enqueue_ms"] = (time.perf_counter() - started) * 1000
+        app.start_download()
+        tick(time.perf_counter())
+
+    root.after(200, begin)
+    root.mainloop()
+    app.engine.shutdown()
+    root.destroy()
+    return summary, timing.get("enqueue_ms", 0.0), stalls
+
+
+def run_single(args):
+    """Tek bir kuyruk boyutunu ölçer ve sonucu JSON satırı olarak yazar."""
+    os.environ.update({
+        "FAKE_YTDLP_PROGRESS_HZ": str(args.progress_hz),
+        "FAKE_YTDLP_SLEEP": str(args.fake_sleep),
+        "FAKE_YTDLP_FAIL_RATE": str(args.fail_rate),
+        "FAKE_YTDLP_DISCARD": "0" if args.keep_files else "1",
+    })
+    work_dir = tempfile.mkdtemp(prefix="ytd-bench-")
+    try:
+        launcher = write_launcher(work_dir)
+        urls = make_urls(args.base_url, args.single, args)
+        cpu_before, children_before, _ = resource_usage()
+        started = time.perf_counter()
+        runner = run_gui if args.gui else run_engine
+        summary, enqueue_ms, stalls = runner(urls, args, work_dir, launcher)
+        wall = time.perf_counter() - started
+        cpu_after, children_after, peak_mb = resource_usage()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    count = max(args.single, 1)
+    result = {
+        "size": args.single,
+        "mode": "gui" if args.gui else "engine",
+        "jobs": args.jobs,
+        "done": summary.get("done", 0),
+        "failed": len(summary.get("failed", [])),
+        "retries": summary.get("retries", 0),
+        "wall_s": round(wall, 3),
+        "items_per_min": round(summary.get("done", 0) / wall * 60, 1),
+        "enqueue_ms": round(enqueue_ms, 2),
+        "stall_p50_ms": round(percentile(stalls, 0.50), 2),
+        "stall_p95_ms": round(percentile(stalls, 0.95), 2),
+        "stall_p99_ms": round(percentile(stalls, 0.99), 2),
+        "stall_max_ms": round(max(stalls, default=0.0), 2),
+        "peak_rss_mb": round(peak_mb, 1) if peak_mb is not None else None,
+        "cpu_ms_per_job": round((cpu_after - cpu_before) * 1000 / count, 3),
+        "child_cpu_ms_per_job": (round((children_after - children_before) * 1000 / count, 3)
+                                 if children_after is not None else None),
+    }
+    print(json.dumps(result))
+    return 0
+
+
+def format_table(results, baseline=None):
+    """Sonuçları boyut başına bir satır olarak biçimlendirir; varsa temel ölçüme göre farkı ekler."""
+    baseline_by_size = {item["size"]: item for item in (baseline or {}).get("results", [])}
+    lines = []
+    for result in results:
+        lines.append(f"--- {result['size']} öğe ({result['mode']}, {result['jobs']} yuva): "
+                     f"{result['done']} bitti, {result['failed']} başarısız, {result['wall_s']} sn")
+        previous = baseline_by_size.get(result["size"])
+        for name, higher_is_better in METRICS:
+            value = result.get(name)
+            line = f"  {name:<22} {value if value is not None else '-':>12}"
+            old = previous.get(name) if previous else None
+            if value is not None and old:
+                change = (value - old) / old * 100
+                better = change > 0 if higher_is_better else change < 0
+                line += f"   {old:>12} → {change:+.1f}%{' (daha iyi)' if better and abs(change) >= 1 else ''}"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="YouTube Downloader çevrimdışı performans kıyaslaması")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Kuyruk boyutları, virgülle ayrılmış")
+    parser.add_argument("-j", "--jobs", type=int, default=4, help="Eşzamanlı indirme sayısı")
+    parser.add_argument("--retries", type=int, default=0, help="Geçici hatalarda yeniden deneme sayısı")
+    parser.add_argument("--media-size", default="64K", help="Öğe başına sentetik medya boyutu")
+    parser.add_argument("--media-rate", default="", help="Sunucunun öğe başına hız sınırı (ör. 1M; boş = sınırsız)")
+    parser.add_argument("--progress-hz", type=float, default=10, help="Sahte yt-dlp'nin saniyedeki ilerleme satırı")
+    parser.add_argument("--fake-sleep", type=float, default=0, help="Sahte bilgi çıkarma süresi (sn)")
+    parser.add_argument("--fail-rate", type=float, default=0, help="Başarısız olacak öğe oranı (0-1)")
+    parser.add_argument("--keep-files", action="store_true", help="İndirilen sentetik dosyaları diske yaz")
+    parser.add_argument("--gui", action="store_true", help="Tk arayüzüyle ölç (ekran gerekir)")
+    parser.add_argument("-o", "--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single is not None:
+        return run_single(args)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    server, base_url = start_server()
+    forwarded = [arg for arg in (argv if argv is not None else sys.argv[1:])]
+    results = []
+    try:
+        for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+            print(f"{size} öğe ölçülüyor...", flush=True)
+            # Her boyut ayrı süreçte: en yüksek RSS ve alt işlem CPU'su birbirine karışmaz
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), *forwarded,
+                 "--single", str(size), "--base-url", base_url],
+                stdout=subprocess.PIPE, text=True
+            )
+            lines = completed.stdout.strip().splitlines()
+            if completed.returncode != 0 or not lines:
+                print(f"{size} öğe ölçülemedi (çıkış kodu {completed.returncode})")
+                continue
+            results.append(json.loads(lines[-1]))
+    finally:
+        server.shutdown()
+
+    print(format_table(results, baseline))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {
+                    "time": round(time.time()),
+                    "python": sys.version.split()[0],
+                    "platform": sys.platform,
+                    "settings": {name: getattr(args, name) for name in (
+                        "jobs", "retries", "media_size", "media_rate", "progress_hz",
+                        "fake_sleep", "fail_rate", "gui")},
+                },
+                "results": results,
+            }, f, indent=2)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2762 @@
+"""YouTube Downloader indirme motoru.
+
+Tk'den bağımsız çekirdek: URL normalleştirme, yt-dlp ilerleme ayrıştırma,
+indirme arşivi, kalıcı iş kuyruğu ve çok yuvalı indirme motoru. Hem masaüstü
+arayüzü (youtube_downloader.py) hem de arayüzsüz komut satırı modu
+(python -m downloader_core) bu modülü kullanır.
+"""
+import os
+import sys
+import subprocess
+import threading
+import queue
+import re
+import json
+import time
+import shutil
+import glob
+import argparse
+import tempfile
+import urllib.parse
+import sqlite3
+import itertools
+import contextlib
+import hashlib
+import random
+import heapq
+from collections import Counter, OrderedDict
+import importlib.util
+import multiprocessing
+import platform
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# yt-dlp ilerleme satırlarını ayırt etmek için önek ve şablon (--progress-template)
+PROGRESS_PREFIX = "[ytd-progress]"
+PROGRESS_TEMPLATE = (
+    "download:" + PROGRESS_PREFIX +
+    " %(progress.downloaded_bytes)s %(progress.total_bytes)s"
+    " %(progress.total_bytes_estimate)s %(progress.speed)s %(progress.eta)s"
+)
+
+# yt-dlp satır önekleri ve karşılık gelen aşamalar (indirme aşaması ilerleme şablonundan gelir)
+PHASE_MARKERS = {
+    "[Merger]": "merge",
+    "[ExtractAudio]": "extract",
+}
+
+
+def _parse_number(value, cast=float):
+    """yt-dlp şablon değerini sayıya çevirir; "NA" gibi değerler için None döner."""
+    try:
+        return cast(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_progress_line(line):
+    """yt-dlp çıktı satırını yapılandırılmış bir ilerleme olayına çevirir.
+
+    İlerleme şablonu satırları için indirilen/toplam bayt, hız, kalan süre ve
+    yüzde içeren bir sözlük; aşama satırları ([Merger], [ExtractAudio]) için
+    yalnızca aşama bilgisi döner. Diğer satırlar için None döner.
+    """
+    if line.startswith(PROGRESS_PREFIX):
+        fields = line[len(PROGRESS_PREFIX):].split()
+        if len(fields) != 5:
+            return None
+        downloaded = _parse_number(fields[0], int)
+        total = _parse_number(fields[1], int) or _parse_number(fields[2], int)
+        percent = None
+        if downloaded is not None and total:
+            percent = min(100.0, downloaded * 100.0 / total)
+        return {
+            "phase": "download",
+            "downloaded": downloaded,
+            "total": total,
+            "speed": _parse_number(fields[3]),
+            "eta": _parse_number(fields[4], int),
+            "percent": percent,
+        }
+
+    for marker, phase in PHASE_MARKERS.items():
+        if line.startswith(marker):
+            return {"phase": phase, "downloaded": None, "total": None,
+                    "speed": None, "eta": None, "percent": None}
+    return None
+
+
+# Desteklenen platformlar için (extractor, sunucular, yol deseni) tablosu.
+# Desen "id" grubunu yakalar; sorgu parametresi gereken durumlar video_key içinde ele alınır.
+URL_PATTERNS = [
+    ("youtube", ("youtube.com", "music.youtube.com", "youtube-nocookie.com"),
+     re.compile(r'^/(?:shorts|embed|live|v|e)/(?P<id>[0-9A-Za-z_-]{11})')),
+    ("youtube", ("youtu.be",),
+     re.compile(r'^/(?P<id>[0-9A-Za-z_-]{11})')),
+    ("tiktok", ("tiktok.com",),
+     re.compile(r'^/(?:@[^/]+/video|v|embed(?:/v2)?)/(?P<id>\d+)')),
+    ("instagram", ("instagram.com",),
+     re.compile(r'^/(?:[^/]+/)?(?:p|reels?|tv)/(?P<id>[0-9A-Za-z_-]+)')),
+    ("twitter", ("twitter.com", "x.com"),
+     re.compile(r'^/[^/]+/status(?:es)?/(?P<id>\d+)')),
+    ("facebook", ("facebook.com", "web.facebook.com"),
+     re.compile(r'^/(?:[^/]+/videos/(?:[^/]+/)?|reel/|video/)(?P<id>\d+)')),
+    ("facebook", ("fb.watch",),
+     re.compile(r'^/(?P<id>[0-9A-Za-z_-]+)')),
+    ("reddit", ("reddit.com", "old.reddit.com", "new.reddit.com"),
+     re.compile(r'^/r/[^/]+/comments/(?P<id>[0-9a-z]+)')),
+    ("reddit", ("redd.it",),
+     re.compile(r'^/(?P<id>[0-9a-z]+)$')),
+    ("twitch:vod", ("twitch.tv",),
+     re.compile(r'^/(?:[^/]+/)?videos?/(?P<id>\d+)')),
+    ("twitch:clips", ("twitch.tv",),
+     re.compile(r'^/[^/]+/clip/(?P<id>[0-9A-Za-z_-]+)')),
+    ("twitch:clips", ("clips.twitch.tv",),
+     re.compile(r'^/(?P<id>[0-9A-Za-z_-]+)')),
+    ("vimeo", ("vimeo.com", "player.vimeo.com"),
+     re.compile(r'^/(?:video/|channels/[^/]+/|groups/[^/]+/videos/)?(?P<id>\d+)')),
+    ("dailymotion", ("dailymotion.com",),
+     re.compile(r'^/(?:embed/)?video/(?P<id>[0-9a-zA-Z]+)')),
+    ("dailymotion", ("dai.ly",),
+     re.compile(r'^/(?P<id>[0-9a-zA-Z]+)')),
+]
+
+# Anahtar oluşturulurken atılan, videoyu değiştirmeyen izleme/konum parametreleri
+IGNORED_QUERY_PARAMS = {"t", "start", "si", "feature", "pp",
+                        "fbclid", "igshid", "igsh", "ref_src"}
+
+
+def _strip_host_prefix(host):
+    for prefix in ("www.", "m.", "mobile."):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def video_key(url):
+    """URL'yi kararlı bir (extractor, id) anahtarına çevirir.
+
+    youtu.be, m.youtube.com, &t= / &list= gibi varyantlar aynı anahtarı üretir;
+    tekilleştirme, arşiv ve önbellek bu anahtarı kullanır. Tanınmayan URL'ler
+    için ("generic", normalleştirilmiş URL) döner. Boş veya sunucu adı
+    olmayan URL'ler için ValueError fırlatır.
+    """
+    original = url
+    url = url.strip()
+    if not url:
+        raise ValueError("Boş URL")
+    if "://" not in url:
+        url = "https://" + url
+    parsed = urllib.parse.urlsplit(url)
+    host = _strip_host_prefix(parsed.netloc.lower().rsplit("@", 1)[-1].split(":", 1)[0])
+    if not host:
+        raise ValueError(f"Geçersiz URL (sunucu adı yok): {original}")
+    path = parsed.path or "/"
+    query = urllib.parse.parse_qs(parsed.query)
+
+    # YouTube izleme sayfası: kimlik v= parametresindedir
+    if host in ("youtube.com", "music.youtube.com") and path.rstrip("/") == "/watch":
+        video_id = query.get("v", [""])[0]
+        if re.fullmatch(r'[0-9A-Za-z_-]{11}', video_id):
+            return ("youtube", video_id)
+    # Facebook izleme sayfası: /watch/?v=ID
+    if host == "facebook.com" and path.rstrip("/") == "/watch":
+        video_id = query.get("v", [""])[0]
+        if video_id.isdigit():
+            return ("facebook", video_id)
+
+    for extractor, hosts, pattern in URL_PATTERNS:
+        if host in hosts:
+            match = pattern.match(path)
+            if match:
+                return (extractor, match.group("id"))
+
+    # Genel: şema/sunucu küçük harf, parça ve izleme parametreleri atılır
+    kept_query = sorted(
+        (name, value) for name, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if name not in IGNORED_QUERY_PARAMS and not name.startswith("utm_")
+    )
+    normalized = urllib.parse.urlunsplit((
+        parsed.scheme.lower(), host, path.rstrip("/") or "/",
+        urllib.parse.urlencode(kept_query), ""
+    ))
+    return ("generic", normalized)
+
+
+class DownloadArchive:
+    """Tamamlanan indirmelerin kalıcı kaydı (SQLite).
+
+    Kayıtlar (extractor, id, format, kalite) ile anahtarlanır; arşivde olan ve
+    dosyası hâlâ diskte duran öğeler için yt-dlp hiç başlatılmaz.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS downloads ("
+                " extractor TEXT NOT NULL,"
+                " video_id TEXT NOT NULL,"
+                " format TEXT NOT NULL,"
+                " quality TEXT NOT NULL,"
+                " filepath TEXT,"
+                " completed_at REAL,"
+                " PRIMARY KEY (extractor, video_id, format, quality))"
+            )
+
+    def is_downloaded(self, key, format_choice, quality):
+        """Öğe bu format/kalitede indirildiyse ve dosyası duruyorsa True döner."""
+        if format_choice == "mp4+mp3":
+            return (self.is_downloaded(key, "mp4", quality) and
+                    self.is_downloaded(key, "mp3", quality))
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT filepath FROM downloads"
+                " WHERE extractor = ? AND video_id = ? AND format = ? AND quality = ?",
+                (key[0], key[1], format_choice, quality)
+            ).fetchone()
+        if row is None:
+            return False
+        # Dosya yolu bilinmiyorsa arşive güven; biliniyorsa dosya silinmiş olabilir
+        return not row[0] or os.path.exists(row[0])
+
+    def record(self, key, format_choice, quality, filepath):
+        """Tamamlanan indirmeyi arşive yazar."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO downloads"
+                " (extractor, video_id, format, quality, filepath, completed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key[0], key[1], format_choice, quality, filepath or "", time.time())
+            )
+
+
+class JobStore:
+    """İndirme listesinin ve iş durumlarının kalıcı kaydı (SQLite, WAL).
+
+    Her öğe için liste sırası, öncelik, durum (pending, running, done,
+    failed), deneme sayısı ve son hata saklanır; uygulama çöktüğünde veya kapatıldığında liste ve hangi
+    öğelerin bittiği kaybolmaz.
+    """
+
+    STATES = ("pending", "running", "done", "failed", "paused", "cancelled")
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " extractor TEXT NOT NULL,"
+                " video_id TEXT NOT NULL,"
+                " url TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " state TEXT NOT NULL DEFAULT 'pending',"
+                " retries INTEGER NOT NULL DEFAULT 0,"
+                " error TEXT,"
+                " updated_at REAL,"
+                " priority INTEGER NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (extractor, video_id))"
+            )
+            # Öncelik sütunu olmayan eski veritabanları
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+            if "priority" not in columns:
+                self.conn.execute("ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+
+    def load(self):
+        """Kayıtlı işleri liste sırasıyla [(anahtar, url, durum, deneme, öncelik)] olarak döndürür."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT extractor, video_id, url, state, retries, priority FROM jobs ORDER BY position"
+            ).fetchall()
+        return [((extractor, video_id), url, state, retries, priority)
+                for extractor, video_id, url, state, retries, priority in rows]
+
+    def add_many(self, items):
+        """[(anahtar, url)] öğelerini listenin sonuna 'pending' olarak ekler."""
+        with self.lock, self.conn:
+            position = self.conn.execute("SELECT COALESCE(MAX(position), 0) FROM jobs").fetchone()[0]
+            now = time.time()
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (extractor, video_id, url, position, state, updated_at)"
+                " VALUES (?, ?, ?, ?, 'pending', ?)",
+                [(key[0], key[1], url, position + i, now) for i, (key, url) in enumerate(items, 1)]
+            )
+
+    def remove(self, key):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM jobs WHERE extractor = ? AND video_id = ?", key)
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM jobs")
+
+    def reorder(self, keys):
+        """Liste sırasını verilen anahtar sırasıyla değiştirir."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET position = ? WHERE extractor = ? AND video_id = ?",
+                [(position, key[0], key[1]) for position, key in enumerate(keys, 1)]
+            )
+
+    def set_priority(self, key, priority):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET priority = ? WHERE extractor = ? AND video_id = ?",
+                (priority, key[0], key[1])
+            )
+
+    def set_state(self, key, state, error=None, count_retry=False):
+        """Öğenin durumunu günceller; count_retry ise deneme sayısını artırır."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET state = ?, error = ?, updated_at = ?,"
+                " retries = retries + ? WHERE extractor = ? AND video_id = ?",
+                (state, error, time.time(), 1 if count_retry else 0, key[0], key[1])
+            )
+
+    def set_states(self, keys, state):
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET state = ?, error = NULL, updated_at = ?"
+                " WHERE extractor = ? AND video_id = ?",
+                [(state, time.time(), key[0], key[1]) for key in keys]
+            )
+
+
+# Bilgi JSON önbelleğinin varsayılan geçerlilik süresi (sn). Format URL'leri
+# sitelerde birkaç saat içinde geçersizleştiği için kısa tutulur.
+DEFAULT_INFO_CACHE_TTL = 3600
+DEFAULT_PREFETCH_WORKERS = 4
+PREFETCH_TIMEOUT_SECONDS = 120
+
+
+def summarize_info(info):
+    """yt-dlp bilgi sözlüğünden listede gösterilecek özeti çıkarır."""
+    size = info.get("filesize") or info.get("filesize_approx")
+    if not size and info.get("requested_formats"):
+        size = sum((f.get("filesize") or f.get("filesize_approx") or 0)
+                   for f in info["requested_formats"]) or None
+    return {
+        "title": info.get("title"),
+        "duration": info.get("duration"),
+        "size": size,
+    }
+
+
+class MetadataCache:
+    """yt-dlp bilgi JSON'larının diskteki önbelleği (--dump-single-json çıktısı).
+
+    Dosyalar (extractor, id) anahtarından türetilen adlarla saklanır ve
+    değiştirilme zamanına göre TTL uygulanır. İndirme sırasında taze bir kayıt
+    varsa yt-dlp'ye --load-info-json ile verilir; böylece extractor tekrar
+    çalıştırılmaz (kayıttaki format URL'leri geçersizse yt-dlp kendisi web
+    sayfası URL'sine geri döner).
+    """
+
+    def __init__(self, cache_dir, ttl=DEFAULT_INFO_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, key):
+        digest = hashlib.sha1(f"{key[0]}\0{key[1]}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key[0]}_{digest}.info.json")
+
+    def fresh_path(self, key):
+        """Süresi dolmamış kaydın yolunu, yoksa None döndürür."""
+        path = self.path_for(key)
+        try:
+            if time.time() - os.path.getmtime(path) < self.ttl:
+                return path
+        except OSError:
+            pass
+        return None
+
+    def load_summary(self, key):
+        """Taze kayıt varsa özetini döndürür."""
+        path = self.fresh_path(key)
+        if not path:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return summarize_info(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, info_json):
+        """Bilgi JSON metnini atomik olarak yazar (yarım dosya okunmaz)."""
+        path = self.path_for(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(info_json)
+        os.replace(temp_path, path)
+        return path
+
+    def prune(self):
+        """Süresi dolmuş kayıtları siler."""
+        now = time.time()
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if now - os.path.getmtime(path) >= self.ttl:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+class MetadataPrefetcher:
+    """İndirmelerden önce, paralel olarak video bilgilerini çeker ve önbelleğe yazar.
+
+    use_module verilirse (gömülü arka uç) ve yt_dlp modülü kuruluysa
+    extract_info(download=False) iş parçacığı başına bir YoutubeDL ile süreç
+    içinde çalıştırılır, değilse yt-dlp --dump-single-json ayrı işlemde
+    kullanılır. Her öğe için on_info(anahtar, özet) iş parçacığından çağrılır.
+    scheduler (HostScheduler) verilirse geri çekilmedeki hostlara istek
+    atılmaz ve ön yüklemede alınan 429/403 o hostu indirmeler için de geri çeker.
+    ytdlp_manager (YtDlpManager) verilirse yt-dlp işlemleri çalışırken güncelleme kurulmaz.
+    """
+
+    def __init__(self, yt_dlp_path, cache, on_info=None, log=print,
+                 workers=DEFAULT_PREFETCH_WORKERS, use_module=False, scheduler=None,
+                 ytdlp_manager=None):
+        self.yt_dlp_path = yt_dlp_path
+        self.ytdlp_manager = ytdlp_manager
+        self.scheduler = scheduler
+        self.cache = cache
+        self.on_info = on_info
+        self.log = log
+        self.worker_count = max(1, workers)
+        self.use_module = use_module and importlib.util.find_spec("yt_dlp") is not None
+        self.jobs = queue.Queue()
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.threads = []
+        self.local = threading.local()
+
+    def submit(self, items):
+        """[(anahtar, url)] öğelerini bilgi çekme kuyruğuna ekler."""
+        with self.lock:
+            for key, url in items:
+                if key in self.pending:
+                    continue
+                self.pending.add(key)
+                self.jobs.put((key, url))
+            # İş parçacıkları ilk işte başlatılır
+            while len(self.threads) < self.worker_count:
+                thread = threading.Thread(target=self._worker, daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def _worker(self):
+        while True:
+            key, url = self.jobs.get()
+            try:
+                summary = self.cache.load_summary(key)
+                if summary is None:
+                    self._wait_for_host(url)
+                    summary = self._fetch(key, url)
+                if summary and self.on_info:
+                    self.on_info(key, summary)
+            except Exception as e:
+                self.log(f"Video bilgisi alınamadı: {url} - {e}")
+            finally:
+                with self.lock:
+                    self.pending.discard(key)
+
+    def _wait_for_host(self, url):
+        # Host indirmeler (veya başka bir ön yükleme) yüzünden geri çekildiyse süre dolana kadar beklenir
+        if self.scheduler is None:
+            return
+        while True:
+            remaining = self.scheduler.backoff_remaining(url)
+            if not remaining:
+                return
+            time.sleep(min(remaining, 5.0))
+
+    def _note_failure(self, url, message):
+        if self.scheduler is not None and classify_failure(message.splitlines()) == "throttled":
+            delay = self.scheduler.throttle(url)
+            self.log(f"{host_for(url)} istekleri kısıtladı (429/403), "
+                     f"bu siteden {format_duration(delay)} boyunca yeni istek atılmayacak")
+
+    def _fetch(self, key, url):
+        if self.use_module:
+            ydl = getattr(self.local, "ydl", None)
+            if ydl is None:
+                import yt_dlp
+                ydl = self.local.ydl = yt_dlp.YoutubeDL({
+                    "quiet": True,
+                    "no_warnings": True,
+                    "noplaylist": True,
+                    "skip_download": True,
+                    "logger": _LineLogger({"on_line": lambda line: None}),
+                })
+            try:
+                info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+            except Exception as e:
+                self.log(f"Video bilgisi alınamadı: {url} - {e}")
+                self._note_failure(url, str(e))
+                return None
+            info_json = json.dumps(info, ensure_ascii=False)
+        else:
+            try:
+                with ytdlp_running(self.ytdlp_manager):
+                    result = subprocess.run(
+                        [self.yt_dlp_path, "--dump-single-json", "--no-warnings", "--no-playlist", url],
+                        capture_output=True, text=True, encoding='utf-8', errors='replace',
+                        timeout=PREFETCH_TIMEOUT_SECONDS
+                    )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                self.log(f"Video bilgisi alınamadı: {url} - {e}")
+                return None
+            if result.returncode != 0 or not result.stdout.strip():
+                self._note_failure(url, result.stderr)
+                return None
+            info_json = result.stdout
+            info = json.loads(info_json)
+        self.cache.store(key, info_json)
+        return summarize_info(info)
+
+
+def format_bytes(size):
+    """Bayt değerini okunabilir biçime çevirir (ör. 12.3 MiB)."""
+    if size is None:
+        return "?"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+def format_duration(seconds):
+    """Saniyeyi s:dd:ss / d:ss biçimine çevirir."""
+    if seconds is None:
+        return "?"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def parse_rate(value):
+    """"2M", "500K", "1.5m" veya bayt sayısını bayt/sn'ye çevirir; boş/0 sınırsız (0) demektir."""
+    if value in (None, ""):
+        return 0
+    if isinstance(value, (int, float)):
+        return max(0, int(value))
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?(?:/s)?\s*', str(value), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Geçersiz hız değeri: {value}")
+    multiplier = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}[match.group(2).upper()]
+    return int(float(match.group(1)) * multiplier)
+
+
+def get_app_dir():
+    """Uygulama klasörünü döndürür (PyInstaller ile derlenmişse exe'nin yanı)."""
+    if getattr(sys, 'frozen', False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def get_config_path():
+    """Yapılandırma dosyasının yolunu döndürür."""
+    return os.path.join(get_app_dir(), "config.json")
+
+
+def get_default_ytdlp_path():
+    """Paketlenmiş yt-dlp'nin yolunu döndürür (appdata/bin)."""
+    # Türkçe karakter sorununu önlemek için ASCII karakterli klasör adı kullanılır
+    name = "yt-dlp.exe" if sys.platform == "win32" else "yt-dlp"
+    return os.path.join(get_app_dir(), "appdata", "bin", name)
+
+
+# yt-dlp sürüm dosyalarının indirildiği varsayılan adres (ytdlp_mirror ile değiştirilebilir)
+DEFAULT_YTDLP_MIRROR = "https://github.com/yt-dlp/yt-dlp/releases/latest/download"
+YTDLP_CHECKSUMS_FILE = "SHA2-256SUMS"
+YTDLP_DOWNLOAD_TIMEOUT = 30
+YTDLP_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def get_ytdlp_artifact(system=None, machine=None):
+    """Bu işletim sistemi ve mimari için yt-dlp sürüm dosyasının adını döndürür."""
+    system = (system or platform.system()).lower()
+    machine = (machine or platform.machine()).lower()
+    if system == "windows":
+        if machine in ("arm64", "aarch64"):
+            return "yt-dlp_arm64.exe"
+        if machine in ("x86", "i386", "i686"):
+            return "yt-dlp_x86.exe"
+        return "yt-dlp.exe"
+    if system == "darwin":
+        return "yt-dlp_macos"
+    if system == "linux":
+        if machine in ("aarch64", "arm64"):
+            return "yt-dlp_linux_aarch64"
+        if machine.startswith("armv7"):
+            return "yt-dlp_linux_armv7l"
+        if machine in ("x86_64", "amd64"):
+            return "yt-dlp_linux"
+    # Diğer sistemler: Python ile çalışan zipimport paketi
+    return "yt-dlp"
+
+
+def parse_checksums(text):
+    """SHA2-256SUMS içeriğini {dosya adı: sha256} sözlüğüne çevirir."""
+    checksums = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            checksums[parts[1].lstrip("*")] = parts[0].lower()
+    return checksums
+
+
+def file_sha256(path):
+    """Dosyanın SHA-256 özetini döndürür."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(YTDLP_DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class YtDlpManager:
+    """yt-dlp ikili dosyasını kurar ve günceller.
+
+    Sürüm dosyası işletim sistemine göre seçilir, SHA2-256SUMS ile doğrulanır ve
+    önce "<yol>.new" olarak hazırlanır. Kurulu dosya ancak apply_update ile
+    os.replace kullanılarak atomik olarak değiştirilir; o ana kadar mevcut dosya
+    kullanılmaya devam eder. yt-dlp'yi başlatan her kod (indirme yuvaları, bilgi
+    ön yükleyicisi, playlist içe aktarımı) işlemi running() içinde çalıştırır;
+    değiştirme yalnızca çalışan işlem yokken yapılır, son işlem bittiğinde
+    bekleyen güncelleme kurulur.
+    """
+
+    def __init__(self, path, mirror=None, log=print):
+        self.path = path
+        self.mirror = (mirror or DEFAULT_YTDLP_MIRROR).rstrip("/")
+        self.log = log
+        self.artifact = get_ytdlp_artifact()
+        self.staged_path = path + ".new"
+        self.lock = threading.Lock()
+        # Dosya kullanımdayken (Windows) erteleme her denemede tekrar loglanmasın
+        self.deferred = False
+        # Çalışan yt-dlp işlemi sayısı; değiştirme sırasında yeni işlem başlatılmaz
+        self.usage = threading.Condition()
+        self.users = 0
+        self.replacing = False
+
+    def _open(self, name):
+        return urllib.request.urlopen(f"{self.mirror}/{name}", timeout=YTDLP_DOWNLOAD_TIMEOUT)
+
+    def fetch_checksum(self):
+        """Yansıdaki SHA2-256SUMS'tan bu sistemin dosyasının özetini döndürür."""
+        with self._open(YTDLP_CHECKSUMS_FILE) as response:
+            checksums = parse_checksums(response.read().decode("utf-8", "replace"))
+        if self.artifact not in checksums:
+            raise ValueError(f"{YTDLP_CHECKSUMS_FILE} içinde {self.artifact} yok")
+        return checksums[self.artifact]
+
+    def _download(self, expected, progress=None):
+        """Sürüm dosyasını indirip doğrular ve staged_path olarak hazırlar."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        part_path = self.path + ".part"
+        digest = hashlib.sha256()
+        try:
+            with self._open(self.artifact) as response, open(part_path, 'wb') as f:
+                total = _parse_number(response.headers.get("Content-Length"), int)
+                downloaded = 0
+                for chunk in iter(lambda: response.read(YTDLP_DOWNLOAD_CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    downloaded += len(chunk)
+                    if progress:
+                        progress(downloaded, total)
+            if digest.hexdigest() != expected:
+                raise ValueError(f"{self.artifact} özeti {YTDLP_CHECKSUMS_FILE} ile uyuşmuyor")
+            if sys.platform != "win32":
+                os.chmod(part_path, 0o755)
+            os.replace(part_path, self.staged_path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    def stage_update(self, progress=None):
+        """Yansıda farklı bir sürüm varsa indirip hazırlar; hazırlandıysa True döner."""
+        with self.lock:
+            expected = self.fetch_checksum()
+            if os.path.exists(self.staged_path) and file_sha256(self.staged_path) == expected:
+                return True
+            if os.path.exists(self.path) and file_sha256(self.path) == expected:
+                return False
+            self.log(f"yt-dlp indiriliyor: {self.mirror}/{self.artifact}")
+            self._download(expected, progress)
+            return True
+
+    def has_staged_update(self):
+        return os.path.exists(self.staged_path)
+
+    def acquire(self):
+        """yt-dlp başlatılmadan önce çağrılır; dosya o an değiştiriliyorsa bitmesini bekler."""
+        with self.usage:
+            while self.replacing:
+                self.usage.wait()
+            self.users += 1
+
+    def release(self):
+        """yt-dlp işlemi bitince çağrılır; son işlem bittiyse hazırlanan güncelleme kurulur."""
+        with self.usage:
+            self.users -= 1
+            idle = not self.users
+        if idle and self.has_staged_update():
+            self.apply_update()
+
+    @contextlib.contextmanager
+    def running(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def apply_update(self):
+        """Hazırlanan sürümü kurulu dosyanın yerine koyar.
+
+        Çalışan yt-dlp işlemi varsa güncelleme son işlem bitince release ile
+        kurulur; dosya başka bir programca kullanılıyorsa (Windows) bir sonraki
+        denemeye kalır.
+        """
+        with self.usage:
+            if self.users or self.replacing or not os.path.exists(self.staged_path):
+                return False
+            self.replacing = True
+        try:
+            return self._replace_staged()
+        finally:
+            with self.usage:
+                self.replacing = False
+                self.usage.notify_all()
+
+    def _replace_staged(self):
+        # Sürüm hazırlanırken (.new yeniden yazılıyor) beklenmez; stage_update bitince tekrar denenir
+        if not self.lock.acquire(blocking=False):
+            return False
+        try:
+            if not os.path.exists(self.staged_path):
+                return False
+            try:
+                os.replace(self.staged_path, self.path)
+            except OSError as e:
+                if not self.deferred:
+                    self.deferred = True
+                    self.log(f"yt-dlp güncellemesi ertelendi: {e}")
+                return False
+            self.deferred = False
+        finally:
+            self.lock.release()
+        self.log(f"yt-dlp güncellendi: {self.path}")
+        return True
+
+    def install(self, progress=None):
+        """yt-dlp'yi kurar veya günceller; başarılıysa True döner."""
+        try:
+            self.stage_update(progress)
+        except (OSError, ValueError) as e:
+            self.log(f"Hata: yt-dlp indirilemedi: {e}")
+            return False
+        self.apply_update()
+        return os.path.exists(self.path)
+
+    def update_in_background(self, on_staged=None):
+        """Güncellemeyi arka planda denetler; yeni sürüm hazırlanınca on_staged çağrılır."""
+        def run():
+            try:
+                if self.stage_update() and on_staged:
+                    on_staged()
+            except (OSError, ValueError) as e:
+                self.log(f"yt-dlp güncelleme denetimi başarısız: {e}")
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+
+def ytdlp_running(manager):
+    """manager verilirse yt-dlp işlemini güncellemeye karşı kaydeden bağlam; yoksa etkisiz."""
+    return manager.running() if manager else contextlib.nullcontext()
+
+
+def get_quality_params(format_choice, quality):
+    """Seçilen format ve kaliteye göre yt-dlp parametrelerini döndür"""
+    if format_choice == "mp4+mp3":
+        # Tek indirme: video bir kez çekilir, MP3 birleştirilmiş MP4'ten yerelde çıkarılır.
+        # -k, ses çıkarıldıktan sonra MP4'ün silinmesini engeller.
+        return (get_quality_params("mp4", quality) +
+                get_quality_params("mp3", quality) + ["-k"])
+    elif format_choice == "mp3":
+        if quality == "high":
+            return ["-x", "--audio-format", "mp3", "--audio-quality", "0"]
+        elif quality == "medium":
+            return ["-x", "--audio-format", "mp3", "--audio-quality", "5"]
+        else:  # low
+            return ["-x", "--audio-format", "mp3", "--audio-quality", "9"]
+    else:  # mp4
+        if quality == "high":
+            return ["-f", "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"]
+        elif quality == "medium":
+            return ["-f", "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]/best"]
+        else:  # low
+            return ["-f", "bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480][ext=mp4]/best"]
+
+
+# Performans profilleri: "default" yt-dlp'nin tek bağlantılı varsayılanıdır,
+# "fast" parçaları (-N) paralel ve büyük tamponla indirir, "aria2c" dosya başına
+# birden çok bağlantı açan harici indiriciyi kullanır.
+PERFORMANCE_PROFILES = ("default", "fast", "aria2c")
+DEFAULT_CONCURRENT_FRAGMENTS = 4
+DEFAULT_ARIA2C_CONNECTIONS = 8
+# Tek parça (DASH olmayan) http indirmelerini aralıklı isteklere böler; bazı
+# siteler tek uzun isteği yavaşlattığı için hız kazandırır
+DEFAULT_HTTP_CHUNK_SIZE = "10M"
+DEFAULT_BUFFER_SIZE = "1M"
+
+
+def get_default_aria2c_path():
+    """Paketlenmiş aria2c'nin yolunu döndürür (appdata/bin, yt-dlp'nin yanı)."""
+    name = "aria2c.exe" if os.name == "nt" else "aria2c"
+    return os.path.join(get_app_dir(), "appdata", "bin", name)
+
+
+def find_aria2c(settings):
+    """Ayardaki, paketlenmiş veya PATH'teki aria2c'yi döndürür; yoksa None."""
+    for path in (settings.get("aria2c_path"), get_default_aria2c_path()):
+        if path and os.path.isfile(path):
+            return path
+    return shutil.which("aria2c")
+
+
+def get_performance_args(profile, settings, log=print):
+    """Performans profili için yt-dlp parametrelerini döndürür."""
+    if profile not in PERFORMANCE_PROFILES or profile == "default":
+        return []
+    fragments = get_int_setting(settings, "concurrent_fragments", DEFAULT_CONCURRENT_FRAGMENTS, 1)
+    args = ["-N", str(fragments), "--buffer-size", str(settings.get("buffer_size", DEFAULT_BUFFER_SIZE))]
+    if profile == "aria2c":
+        aria2c = find_aria2c(settings)
+        if aria2c:
+            connections = get_int_setting(settings, "aria2c_connections", DEFAULT_ARIA2C_CONNECTIONS, 1)
+            return args + [
+                "--downloader", aria2c,
+                "--downloader-args",
+                f"aria2c:-x {connections} -s {connections} -k 1M --file-allocation=none",
+            ]
+        log("aria2c bulunamadı, 'hızlı' performans profili kullanılıyor")
+    return args + ["--http-chunk-size", str(settings.get("http_chunk_size", DEFAULT_HTTP_CHUNK_SIZE))]
+
+
+# Sitenin bizi kısıtladığını gösteren yt-dlp çıktıları
+# YouTube'un bot doğrulaması ("Sign in to confirm you're not a bot") da kısıtlama sayılır:
+# aynı hosta bir süre istek göndermemek gerekir
+THROTTLE_PATTERN = re.compile(
+    r'HTTP Error (?:429|403)|Too Many Requests|rate[- ]limit|'
+    r'Sign in to confirm you.re not a bot',
+    re.IGNORECASE)
+
+# İşçi havuzunda yt-dlp işçisi çöktüğünde yazılan hata satırı ("crashed" sınıfı)
+WORKER_CRASH_MESSAGE = "yt-dlp işçi süreci beklenmedik şekilde sonlandı"
+
+# Hata sınıfları: "throttled", "network" ve "crashed" yeniden denenir, "permanent" denenmez.
+# Sıra önemlidir: ilk eşleşen sınıf kullanılır.
+FAILURE_PATTERNS = [
+    ("throttled", THROTTLE_PATTERN),
+    ("crashed", re.compile(re.escape(WORKER_CRASH_MESSAGE))),
+    ("permanent", re.compile(
+        r'Video unavailable|Private video|has been removed|is not available|'
+        r'account (?:associated|has been terminated)|members[- ]only|Join this channel|'
+        r'Sign in to confirm your age|age[- ]restricted|copyright|Unsupported URL|'
+        r'is not a valid URL|HTTP Error 40[0145]|HTTP Error 410|'
+        r'Requested format is not available|live event will begin|Premieres in|'
+        r'ffmpeg (?:and ffprobe )?not found|ffprobe and ffmpeg not found|No space left',
+        re.IGNORECASE)),
+    ("network", re.compile(
+        r'timed out|timeout|Connection (?:reset|refused|aborted)|Remote end closed|'
+        r'Temporary failure in name resolution|Name or service not known|getaddrinfo failed|'
+        r'Network is unreachable|HTTP Error 5\d\d|IncompleteRead|'
+        r'fragment \d+ not found|Giving up after \d+ fragment retries|'
+        r'Unable to download (?:webpage|JSON|video data)|SSL|EOF occurred', re.IGNORECASE)),
+]
+
+
+def classify_failure(error_lines):
+    """yt-dlp hata satırlarını sınıflandırır: throttled, crashed, permanent, network veya unknown.
+
+    Bilinmeyen hatalar geçici kabul edilir (yeniden deneme bütçesiyle sınırlıdır).
+    """
+    for failure_class, pattern in FAILURE_PATTERNS:
+        for line in error_lines:
+            if pattern.search(line):
+                return failure_class
+    return "unknown"
+
+
+RETRYABLE_FAILURES = ("throttled", "crashed", "network", "unknown")
+
+
+class OutputTracker:
+    """yt-dlp çıktısından son dosya yollarını ve aktarılan bayt miktarını takip eder."""
+
+    def __init__(self):
+        # -k ile birleştirme öncesi parça dosyaları (ör. .f137.mp4, .f140.m4a) da kalır;
+        # başarılı birleştirmeden sonra bunları temizlemek için yollarını topla.
+        self.downloaded_paths = []
+        self.merged_path = None
+        # Arşive yazılacak son dosya yolları
+        self.video_path = None
+        self.audio_path = None
+        self.last_event = None
+        self.total_bytes = 0
+        # Hata sınıflandırması için yt-dlp'nin ERROR satırları
+        self.error_lines = []
+
+    def feed_event(self, event):
+        if event["downloaded"] is not None:
+            self.last_event = event
+
+    def feed_line(self, line):
+        destination = re.match(r'\[download\] Destination: (.+)$', line)
+        if destination:
+            self.downloaded_paths.append(destination.group(1))
+            # Önceki akış bitti; boyutunu toplama ekle
+            self.finish()
+            self.video_path = destination.group(1)
+        existing = re.match(r'\[download\] (.+) has already been downloaded$', line)
+        if existing:
+            self.video_path = existing.group(1)
+        merge = re.match(r'\[Merger\] Merging formats into "(.+)"$', line)
+        if merge:
+            self.merged_path = merge.group(1)
+            self.video_path = self.merged_path
+        audio = (re.match(r'\[ExtractAudio\] Destination: (.+)$', line) or
+                 re.match(r'\[ExtractAudio\] Not converting audio (.+?);', line))
+        if audio:
+            self.audio_path = audio.group(1)
+        if line.startswith("ERROR:"):
+            self.error_lines.append(line)
+
+    def finish(self):
+        """Son akışın boyutunu toplama ekler."""
+        if self.last_event:
+            self.total_bytes += self.last_event["downloaded"]
+            self.last_event = None
+
+
+# Gömülü modda post-processor adlarının karşılık geldiği aşamalar
+POSTPROCESSOR_PHASES = {
+    "Merger": "merge",
+    "ExtractAudio": "extract",
+}
+
+
+class _LineLogger:
+    """yt-dlp logger arayüzü: mesajları satır satır geri çağırmaya iletir."""
+
+    def __init__(self, context):
+        self.context = context
+
+    def _emit(self, message):
+        for line in str(message).splitlines():
+            line = line.strip()
+            if line:
+                self.context["on_line"](line)
+
+    def debug(self, message):
+        # yt-dlp ekran çıktısını da debug ile gönderir; gerçek hata ayıklama satırları atlanır
+        if not str(message).startswith("[debug] "):
+            self._emit(message)
+
+    info = _emit
+    warning = _emit
+    error = _emit
+
+
+class EmbeddedBackend:
+    """yt-dlp'yi yt_dlp.YoutubeDL ile aynı süreçte çalıştırır.
+
+    Her yuva için aynı seçeneklerle oluşturulmuş bir YoutubeDL örneği sıcak
+    tutulur; böylece her öğe için işlem başlatma ve extractor kayıt defterini
+    yeniden yükleme maliyeti ödenmez. İlerleme stdout yerine hook'larla alınır.
+    """
+
+    def __init__(self, module):
+        self.yt_dlp = module
+        # {slot: (seçenek imzası, YoutubeDL, bağlam)}
+        self.instances = {}
+        # Yuva başına hız sınırı (bayt/sn, None = sınırsız); argümanlardan ayrı tutulur
+        # ki değiştiğinde sıcak örnek yeniden oluşturulmasın
+        self.ratelimits = {}
+
+    @classmethod
+    def load(cls):
+        """yt_dlp modülü kuruluysa bir arka uç döndürür, değilse None."""
+        try:
+            import yt_dlp
+        except ImportError:
+            return None
+        if not hasattr(yt_dlp, "parse_options"):
+            return None
+        return cls(yt_dlp)
+
+    def _get_instance(self, slot, args):
+        signature = tuple(args)
+        cached = self.instances.get(slot)
+        if cached and cached[0] == signature:
+            return cached[1], cached[2]
+
+        context = {}
+        ydl_opts = self.yt_dlp.parse_options(list(args)).ydl_opts
+        ydl_opts.update({
+            "logger": _LineLogger(context),
+            "noprogress": True,
+            "ignoreerrors": False,
+            "progress_hooks": [lambda d: self._progress_hook(context, d)],
+            "postprocessor_hooks": [lambda d: self._postprocessor_hook(context, d)],
+        })
+        ydl_opts["ratelimit"] = self.ratelimits.get(slot)
+        ydl = self.yt_dlp.YoutubeDL(ydl_opts)
+        self.instances[slot] = (signature, ydl, context)
+        return ydl, context
+
+    def set_ratelimit(self, slot, ratelimit):
+        """Yuvanın hız sınırını değiştirir; yürüyen indirmede bir sonraki veri bloğunda geçerli olur."""
+        self.ratelimits[slot] = ratelimit or None
+        cached = self.instances.get(slot)
+        if cached:
+            # HTTP indiricisi sınırı her blokta YoutubeDL.params'tan okur
+            cached[1].params["ratelimit"] = ratelimit or None
+
+    def _progress_hook(self, context, d):
+        if context["is_cancelled"]():
+            raise self.yt_dlp.utils.DownloadCancelled("İndirme durduruldu")
+        if d.get("status") not in ("downloading", "finished"):
+            return
+        downloaded = d.get("downloaded_bytes")
+        total = d.get("total_bytes") or d.get("total_bytes_estimate")
+        percent = None
+        if downloaded is not None and total:
+            percent = min(100.0, downloaded * 100.0 / total)
+        context["on_event"]({
+            "phase": "download",
+            "downloaded": downloaded,
+            "total": total,
+            "speed": d.get("speed"),
+            "eta": d.get("eta"),
+            "percent": percent,
+        })
+
+    def _postprocessor_hook(self, context, d):
+        phase = POSTPROCESSOR_PHASES.get(d.get("postprocessor"))
+        if phase and d.get("status") == "started":
+            context["on_event"]({"phase": phase, "downloaded": None, "total": None,
+                                 "speed": None, "eta": None, "percent": None})
+
+    def download(self, slot, args, on_line, on_event, is_cancelled):
+        """Argümanlardaki (son öğe URL veya --load-info-json dosyası) videoyu indirir.
+
+        Başarılıysa 0, hata varsa 1, iptal edildiyse None döner.
+        """
+        info_file = len(args) > 1 and args[-2] == "--load-info-json"
+        ydl, context = self._get_instance(slot, args[:-2] if info_file else args[:-1])
+        context.update(on_line=on_line, on_event=on_event, is_cancelled=is_cancelled)
+        try:
+            if info_file:
+                ydl.download_with_info_file(args[-1])
+            else:
+                ydl.download([args[-1]])
+            return 0
+        except self.yt_dlp.utils.DownloadCancelled:
+            # Yarıda kesilen örnek yeniden kullanılmaz
+            self.instances.pop(slot, None)
+            return None
+        except self.yt_dlp.utils.DownloadError:
+            # Hata mesajı logger üzerinden zaten iletildi
+            return 1
+        except Exception as e:
+            on_line(f"ERROR: {e}")
+            self.instances.pop(slot, None)
+            return 1
+
+
+def _pool_worker_main(conn):
+    """Havuz işçi sürecinin ana döngüsü.
+
+    yt_dlp süreç başlarken bir kez içe aktarılır; ardından borudan gelen
+    ("download", iş no, argümanlar) mesajları sırayla işlenir. Satırlar,
+    ilerleme olayları ve sonuç aynı borudan ana sürece gönderilir.
+    """
+    backend = EmbeddedBackend.load()
+    state = {"job": None, "cancelled": False}
+
+    def is_cancelled():
+        # İptal mesajları sadece yürüyen işe aitse dikkate alınır
+        while not state["cancelled"] and conn.poll():
+            message = conn.recv()
+            if message[0] == "cancel" and message[1] == state["job"]:
+                state["cancelled"] = True
+            elif message[0] == "ratelimit" and backend:
+                backend.set_ratelimit(0, message[1])
+            elif message[0] == "exit":
+                state["cancelled"] = True
+        return state["cancelled"]
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == "exit":
+            return
+        if message[0] == "ratelimit" and backend:
+            backend.set_ratelimit(0, message[1])
+        if message[0] != "download":
+            continue
+        state.update(job=message[1], cancelled=False)
+        if backend is None:
+            conn.send(("line", "ERROR: yt_dlp modülü işçi sürecinde yüklenemedi"))
+            conn.send(("result", 1))
+            continue
+        returncode = backend.download(
+            0, message[2],
+            lambda line: conn.send(("line", line)),
+            lambda event: conn.send(("event", event)),
+            is_cancelled
+        )
+        conn.send(("result", returncode))
+
+
+class WorkerPoolBackend:
+    """yt-dlp'yi uzun ömürlü işçi süreçlerinde çalıştırır.
+
+    Her yuvanın yt_dlp'yi önceden içe aktarmış kendi süreci vardır; işler
+    boru (Pipe) üzerinden gönderilir, ilerleme ve sonuç yapılandırılmış
+    mesajlarla geri gelir. Böylece her öğe için yorumlayıcı başlatma maliyeti
+    ödenmez, işler birden çok çekirdeğe yayılır ve çöken bir extractor
+    arayüz sürecini etkilemez (süreç bir sonraki işte yeniden başlatılır).
+    """
+
+    # İptal mesajından sonra işçinin kendiliğinden durması için beklenen süre
+    CANCEL_GRACE_SECONDS = 5
+
+    def __init__(self):
+        # fork, iş parçacıklı bir Tk sürecinde güvenli değildir
+        self.context = multiprocessing.get_context("spawn")
+        # {slot: (Process, Connection)}
+        self.workers = {}
+        self.job_ids = itertools.count(1)
+        # Borulara indirme ve hız sınırı mesajları farklı iş parçacıklarından yazılır
+        self.send_lock = threading.Lock()
+        self.ratelimits = {}
+
+    @classmethod
+    def load(cls):
+        """yt_dlp modülü kuruluysa bir havuz döndürür, değilse None."""
+        if importlib.util.find_spec("yt_dlp") is None:
+            return None
+        return cls()
+
+    def warm_up(self, worker_count):
+        """İşçi süreçlerini ilk işten önce başlatır (yt_dlp içe aktarımı arka planda yapılır)."""
+        for slot in range(worker_count):
+            self._get_worker(slot)
+
+    def _get_worker(self, slot):
+        worker = self.workers.get(slot)
+        if worker and worker[0].is_alive():
+            return worker
+        self._discard(slot)
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_pool_worker_main, args=(child_conn,),
+            name=f"yt-dlp-worker-{slot + 1}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.workers[slot] = (process, parent_conn)
+        if self.ratelimits.get(slot):
+            self._send(parent_conn, ("ratelimit", self.ratelimits[slot]))
+        return self.workers[slot]
+
+    def _send(self, conn, message):
+        with self.send_lock:
+            conn.send(message)
+
+    def set_ratelimit(self, slot, ratelimit):
+        """Yuvanın işçi sürecine yeni hız sınırını iletir (yürüyen indirmeye de uygulanır)."""
+        self.ratelimits[slot] = ratelimit or None
+        worker = self.workers.get(slot)
+        if worker:
+            try:
+                self._send(worker[1], ("ratelimit", ratelimit or None))
+            except OSError:
+                pass
+
+    def _discard(self, slot):
+        worker = self.workers.pop(slot, None)
+        if not worker:
+            return
+        process, conn = worker
+        if process.is_alive():
+            process.terminate()
+        process.join(1)
+        conn.close()
+
+    def download(self, slot, args, on_line, on_event, is_cancelled):
+        """EmbeddedBackend.download ile aynı sözleşme: 0 / 1 / None (iptal)."""
+        process, conn = self._get_worker(slot)
+        job_id = next(self.job_ids)
+        try:
+            self._send(conn, ("download", job_id, list(args)))
+        except OSError as e:
+            self._discard(slot)
+            on_line(f"ERROR: yt-dlp işçi sürecine iş gönderilemedi: {e}")
+            return 1
+
+        cancel_deadline = None
+        while True:
+            if cancel_deadline is None and is_cancelled():
+                try:
+                    self._send(conn, ("cancel", job_id))
+                except OSError:
+                    pass
+                cancel_deadline = time.time() + self.CANCEL_GRACE_SECONDS
+            elif cancel_deadline is not None and time.time() > cancel_deadline:
+                # İlerleme hook'una ulaşmayan (ör. extractor'da takılan) işçi sonlandırılır
+                self._discard(slot)
+                return None
+            try:
+                if not conn.poll(0.2):
+                    if not process.is_alive():
+                        raise EOFError
+                    continue
+                message = conn.recv()
+            except (EOFError, OSError):
+                self._discard(slot)
+                if cancel_deadline is not None:
+                    return None
+                on_line(f"ERROR: {WORKER_CRASH_MESSAGE} (kod: {process.exitcode})")
+                return 1
+            if message[0] == "line":
+                on_line(message[1])
+            elif message[0] == "event":
+                on_event(message[1])
+            elif message[0] == "result":
+                return message[1]
+
+    def shutdown(self):
+        """Tüm işçi süreçlerini kapatır."""
+        for slot, (process, conn) in list(self.workers.items()):
+            try:
+                self._send(conn, ("exit",))
+            except OSError:
+                pass
+            process.join(1)
+            self._discard(slot)
+
+
+# Host başına varsayılan eşzamanlı indirme sayısı ve dakikada en fazla başlatma (0 = sınırsız);
+# eşzamanlılık sınırı verilmezse tek sınır yuva sayısıdır (tek siteli listelerde yuvalar boş kalmaz)
+DEFAULT_PER_HOST_LIMIT = 0
+DEFAULT_PER_HOST_STARTS_PER_MINUTE = 0
+# 429/403 sonrası host bekleme süresi: 30 sn'den başlayıp her seferinde ikiye katlanır
+THROTTLE_BACKOFF_BASE = 30
+THROTTLE_BACKOFF_MAX = 900
+# Geçici hatalarda öğe başına varsayılan yeniden deneme sayısı ve bekleme süresi
+# (10 sn'den başlayıp her denemede ikiye katlanır, en fazla 5 dk)
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 10
+RETRY_BACKOFF_MAX = 300
+
+
+def host_for(url):
+    """URL'nin zamanlama grubunu döndürür: bilinen sitelerde extractor, diğerlerinde sunucu adı.
+
+    Bilinen bir sitenin video olmayan sayfaları (ör. YouTube playlist) da o
+    sitenin grubuna girer; 429/403 geri çekilmesi tüm siteye uygulanır.
+    """
+    extractor, video_id = video_key(url)
+    if extractor != "generic":
+        return extractor
+    host = urllib.parse.urlsplit(video_id).hostname
+    for extractor, hosts, _ in URL_PATTERNS:
+        if host in hosts:
+            return extractor
+    return host
+
+
+class HostScheduler:
+    """Host (extractor/sunucu) bazında gruplanmış öncelikli indirme kuyruğu.
+
+    Her host için eşzamanlı indirme ve dakikalık başlatma sınırı uygulanır.
+    Yuvalar, uygun hostlar arasında sıralama anahtarı (sort_key) en küçük
+    olan işi alır; eşitlikte en uzun süredir hizmet almamış host seçilir.
+    Böylece karışık listelerde tüm yuvalar dolu kalırken tek bir site
+    yüklenmez. Site 429/403 döndürdüğünde o host, rastgele sapmalı (jitter)
+    ve üstel artan bir süre boyunca yeni iş vermez.
+
+    Tek bir işin anahtarı değiştiğinde (update) yığın yeniden kurulmaz: işe
+    yeni bir girdi eklenir, eski girdi yığında kalır ve sıra geldiğinde
+    atlanır (tembel geçersizleştirme).
+    """
+
+    def __init__(self, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 starts_per_minute=DEFAULT_PER_HOST_STARTS_PER_MINUTE, sort_key=None):
+        self.per_host_limit = max(0, per_host_limit)
+        self.min_interval = 60.0 / starts_per_minute if starts_per_minute else 0
+        # url -> karşılaştırılabilir anahtar; küçük olan önce indirilir
+        self.sort_key = sort_key or (lambda url: 0)
+        self.cond = threading.Condition()
+        # {host: [(anahtar, sıra no, url)] yığını} - sözlük sırası hostların hizmet alma sırasıdır
+        self.queues = OrderedDict()
+        self.entry_ids = itertools.count()
+        # Kuyruktaki her işin geçerli girdisinin sıra numarası {url: sıra no}
+        self.live_entries = {}
+        self.active = Counter()
+        self.pending = 0
+        self.next_start = {}
+        self.backoff_until = {}
+        self.backoff_level = Counter()
+        # Yeniden denenecek işler: [(hazır olma zamanı, sıra no, url)]
+        self.delayed = []
+
+    def __len__(self):
+        with self.cond:
+            return self.pending
+
+    def _push(self, url):
+        entry_id = next(self.entry_ids)
+        self.live_entries[url] = entry_id
+        heapq.heappush(self.queues.setdefault(host_for(url), []), (self.sort_key(url), entry_id, url))
+
+    def _head(self, host):
+        """Hostun en öndeki geçerli girdisini döndürür; eskimiş girdileri atar."""
+        entries = self.queues[host]
+        while entries and self.live_entries.get(entries[0][2]) != entries[0][1]:
+            heapq.heappop(entries)
+        return entries[0] if entries else None
+
+    def put(self, url, delay=0):
+        """URL'yi hostunun kuyruğuna ekler; delay verilirse o kadar saniye sonra uygun olur."""
+        with self.cond:
+            if url in self.live_entries:
+                # Zaten kuyrukta: ikinci kez indirilmez
+                return
+            if delay > 0:
+                heapq.heappush(self.delayed, (time.monotonic() + delay, next(self.entry_ids), url))
+            else:
+                self._push(url)
+            self.pending += 1
+            self.cond.notify()
+
+    def remove(self, url):
+        """Bekleyen (veya yeniden denemeyi bekleyen) işi kuyruktan çıkarır; bulunduysa True."""
+        with self.cond:
+            if self.live_entries.pop(url, None) is not None:
+                # Yığındaki girdi eskimiş sayılır ve sırası geldiğinde atlanır
+                self.pending -= 1
+                return True
+            for index, entry in enumerate(self.delayed):
+                if entry[2] == url:
+                    self.delayed.pop(index)
+                    heapq.heapify(self.delayed)
+                    self.pending -= 1
+                    return True
+            return False
+
+    def update(self, url):
+        """Tek bir işin sıralama anahtarı değiştiğinde işi yeniden konumlar (O(log n))."""
+        with self.cond:
+            if url in self.live_entries:
+                self._push(url)
+
+    def resort(self):
+        """Toplu değişikliklerde (öncelik, sıra, mod) tüm kuyrukları yeniden düzenler; eskimiş girdiler atılır."""
+        with self.cond:
+            for host, entries in self.queues.items():
+                self.queues[host] = [(self.sort_key(url), entry_id, url) for _, entry_id, url in entries
+                                     if self.live_entries.get(url) == entry_id]
+                heapq.heapify(self.queues[host])
+
+    def clear(self):
+        """Bekleyen tüm işleri atar ve bekleyen yuvaları uyandırır."""
+        with self.cond:
+            self.queues.clear()
+            self.live_entries.clear()
+            self.delayed.clear()
+            self.pending = 0
+            self.cond.notify_all()
+
+    def get(self, should_continue):
+        """Sıradaki uygun URL'yi döndürür; uygun iş yoksa bekler.
+
+        Kuyruk boşsa ve çalışan iş yoksa (geri konacak iş kalmadıysa) veya
+        should_continue() False dönerse None döner.
+        """
+        with self.cond:
+            while should_continue():
+                if not self.pending and not sum(self.active.values()):
+                    return None
+                now = time.monotonic()
+                # Bekleme süresi dolan yeniden denemeler hostlarının kuyruğuna geçer
+                while self.delayed and self.delayed[0][0] <= now:
+                    self._push(heapq.heappop(self.delayed)[2])
+                wait = self.delayed[0][0] - now if self.delayed else None
+                best_host = best_head = None
+                empty_hosts = []
+                for host in self.queues:
+                    head = self._head(host)
+                    if head is None:
+                        empty_hosts.append(host)
+                        continue
+                    if self.per_host_limit and self.active[host] >= self.per_host_limit:
+                        continue
+                    ready_at = max(self.next_start.get(host, 0), self.backoff_until.get(host, 0))
+                    if ready_at > now:
+                        wait = ready_at - now if wait is None else min(wait, ready_at - now)
+                        continue
+                    if best_head is None or head[0] < best_head[0]:
+                        best_host, best_head = host, head
+                for host in empty_hosts:
+                    del self.queues[host]
+                if best_host is not None:
+                    url = heapq.heappop(self.queues[best_host])[2]
+                    del self.live_entries[url]
+                    # Bu host sıranın sonuna geçer
+                    if self._head(best_host) is not None:
+                        self.queues.move_to_end(best_host)
+                    else:
+                        del self.queues[best_host]
+                    self.pending -= 1
+                    self.active[best_host] += 1
+                    if self.min_interval:
+                        self.next_start[best_host] = now + self.min_interval
+                    return url
+                # Zaman aşımı should_continue()'nun düzenli kontrolü içindir
+                self.cond.wait(min(wait, 1.0) if wait is not None else 1.0)
+            return None
+
+    def task_done(self, url, success=False, throttled=False, requeue_delay=None):
+        """Yuva işi bitirdiğinde çağrılır; kısıtlandıysa hostun bekleme süresini döndürür.
+
+        requeue_delay verilirse iş, geri çekilme süresiyle aynı kilit altında
+        (o kadar saniye sonra) kuyruğa geri eklenir; böylece başka bir yuva
+        kısıtlanan hosta bekleme süresi yazılmadan önce istek atamaz.
+        """
+        host = host_for(url)
+        delay = 0
+        with self.cond:
+            self.active[host] -= 1
+            if throttled:
+                delay = self._throttle(host)
+            elif success:
+                self.backoff_level.pop(host, None)
+            if requeue_delay is not None:
+                if requeue_delay > 0:
+                    heapq.heappush(self.delayed, (time.monotonic() + requeue_delay, next(self.entry_ids), url))
+                else:
+                    self._push(url)
+                self.pending += 1
+            self.cond.notify_all()
+        return delay
+
+    def _throttle(self, host):
+        self.backoff_level[host] += 1
+        delay = min(THROTTLE_BACKOFF_MAX, THROTTLE_BACKOFF_BASE * 2 ** (self.backoff_level[host] - 1))
+        # Jitter: aynı anda kısıtlanan hostlar aynı anda geri dönmesin
+        delay = random.uniform(delay / 2, delay)
+        self.backoff_until[host] = max(self.backoff_until.get(host, 0), time.monotonic() + delay)
+        return delay
+
+    def throttle(self, url):
+        """Kuyruk dışından (ör. bilgi ön yükleme) gelen 429/403 için hostu geri çeker; süreyi döndürür."""
+        with self.cond:
+            return self._throttle(host_for(url))
+
+    def backoff_remaining(self, url):
+        """URL'nin hostu geri çekilmedeyse kalan süreyi (sn), değilse 0 döndürür."""
+        with self.cond:
+            return max(0.0, self.backoff_until.get(host_for(url), 0) - time.monotonic())
+
+
+# İş başına uygulanacak en düşük hız (bayt/sn); çok sayıda yuvada sınır sıfıra yaklaşmasın
+MIN_JOB_RATE = 32 * 1024
+# Zaman çizelgesi geçişleri için sınırın yeniden kontrol edilme aralığı (sn)
+BANDWIDTH_CHECK_SECONDS = 1.0
+# Alt işlem arka ucunda sınır değişince yt-dlp yeniden başlatılmadan önce en az çalışma süresi (sn);
+# yuvalar art arda başlarken her indirme tekrar tekrar kesilmesin
+RATE_RESTART_MIN_SECONDS = 5.0
+# Komut satırı modunda config.json değişikliklerinin kontrol aralığı (sn)
+CONFIG_WATCH_SECONDS = 2.0
+
+
+def rate_restart_needed(current, target, allow_raise=True):
+    """Alt işlemin başlangıçtaki sınırı (current) yeni sınırdan (target) yeniden başlatmaya değecek kadar farklı mı?
+
+    0/None sınırsız demektir. Bütçe %25'ten fazla aşılıyorsa True döner; sınır
+    en az iki kat gevşediyse sadece allow_raise ile True döner. Küçük farklar
+    için indirme kesilmez.
+    """
+    if not current:
+        return bool(target)
+    if not target:
+        return allow_raise
+    return current > target * 1.25 or (allow_raise and target >= current * 2)
+
+
+class BandwidthManager:
+    """Toplam bant genişliği bütçesi ve günün saatine göre çizelge.
+
+    Ayarlar: bandwidth_limit ("2M", "500K", 0 = sınırsız) ve isteğe bağlı
+    bandwidth_schedule: [{"from": "09:00", "to": "18:00", "limit": "1M"}, ...].
+    Gece yarısını aşan aralıklar ("22:00" - "06:00") desteklenir; ilk eşleşen
+    aralık geçerlidir, hiçbiri eşleşmezse bandwidth_limit kullanılır.
+    """
+
+    def __init__(self, settings=None):
+        self.limit = 0
+        self.schedule = []
+        self.update(settings or {})
+
+    @staticmethod
+    def _parse_time(value):
+        hours, minutes = str(value).split(":", 1)
+        return int(hours) * 60 + int(minutes)
+
+    def update(self, settings):
+        """Ayarları yeniden okur; geçersiz değerler ValueError fırlatır."""
+        limit = parse_rate(settings.get("bandwidth_limit", 0))
+        schedule = []
+        for entry in settings.get("bandwidth_schedule") or []:
+            try:
+                schedule.append((self._parse_time(entry["from"]), self._parse_time(entry["to"]),
+                                 parse_rate(entry.get("limit", 0))))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Geçersiz bant genişliği çizelgesi: {entry} - {e}")
+        self.limit = limit
+        self.schedule = schedule
+
+    def current_limit(self, now=None):
+        """Şu an geçerli toplam sınırı (bayt/sn, 0 = sınırsız) döndürür."""
+        local = time.localtime(now)
+        minute = local.tm_hour * 60 + local.tm_min
+        for start, end, limit in self.schedule:
+            if start <= end:
+                inside = start <= minute < end
+            else:
+                inside = minute >= start or minute < end
+            if inside:
+                return limit
+        return self.limit
+
+    def per_job_limit(self, active_jobs, now=None):
+        """Toplam bütçeyi aktif işler arasında eşit böler; sınırsızsa 0 döner."""
+        total = self.current_limit(now)
+        if not total:
+            return 0
+        return max(MIN_JOB_RATE, total // max(1, active_jobs))
+
+
+# JSON anlık görüntü dosyasının varsayılan yazılma aralığı (sn)
+DEFAULT_METRICS_SNAPSHOT_INTERVAL = 10
+# Metrik adlarının öneki (ytd_active_jobs, ytd_items_total, ...)
+METRICS_PREFIX = "ytd"
+
+
+class EngineMetrics:
+    """İndirme motorunun süreç boyunca biriken sayaçları.
+
+    Öğe sonuçları, hata sınıfları, yeniden denemeler, indirilen bayt ve aşama
+    süreleri (prepare: başlatma ve bilgi çıkarma, download, merge, extract)
+    yuva iş parçacıklarından güncellenir. Anlık göstergeler (aktif iş, kuyruk
+    derinliği, toplam hız) DownloadEngine.metrics_snapshot içinde eklenir.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.items = Counter()
+        self.failures = Counter()
+        self.retries = 0
+        self.bytes_downloaded = 0
+        self.phase_seconds = Counter()
+        self.phase_count = Counter()
+        # Yuva başına son görülen bayt ve açık aşama: {yuva: bayt}, {yuva: (aşama, başlangıç)}
+        self.slot_bytes = {}
+        self.slot_phases = {}
+
+    def _close_phase(self, slot, now):
+        phase = self.slot_phases.pop(slot, None)
+        if phase:
+            self.phase_seconds[phase[0]] += now - phase[1]
+            self.phase_count[phase[0]] += 1
+
+    def start_item(self, slot):
+        with self.lock:
+            self.slot_bytes[slot] = 0
+            self.slot_phases[slot] = ("prepare", time.monotonic())
+
+    def observe(self, slot, event):
+        """Bir ilerleme/aşama olayını aşama sürelerine ve bayt sayacına işler."""
+        with self.lock:
+            now = time.monotonic()
+            current = self.slot_phases.get(slot)
+            if current is None or current[0] != event["phase"]:
+                self._close_phase(slot, now)
+                self.slot_phases[slot] = (event["phase"], now)
+            downloaded = event["downloaded"]
+            if downloaded is not None:
+                previous = self.slot_bytes.get(slot, 0)
+                # Sayaç küçüldüyse yeni bir akış (ör. videodan sonra ses) başlamıştır
+                self.bytes_downloaded += downloaded - previous if downloaded >= previous else downloaded
+                self.slot_bytes[slot] = downloaded
+
+    def finish_item(self, slot, result, failure_class=None):
+        """Bir denemenin sonucunu kaydeder (done, failed, retried, paused, cancelled, stopped)."""
+        with self.lock:
+            self._close_phase(slot, time.monotonic())
+            self.slot_bytes.pop(slot, None)
+            self.items[result] += 1
+            if failure_class:
+                self.failures[failure_class] += 1
+            if result == "retried":
+                self.retries += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "items_total": dict(self.items),
+                "failures_total": dict(self.failures),
+                "retries_total": self.retries,
+                "bytes_downloaded_total": self.bytes_downloaded,
+                "phase_seconds": {
+                    phase: {"sum": round(self.phase_seconds[phase], 3), "count": self.phase_count[phase]}
+                    for phase in self.phase_count
+                },
+            }
+
+
+def escape_label_value(value):
+    """Prometheus etiket değerindeki ters bölü, çift tırnak ve satır sonlarını kaçışlar."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_metrics(snapshot):
+    """metrics_snapshot çıktısını Prometheus metin biçimine (0.0.4) çevirir."""
+    lines = []
+
+    def add(name, kind, help_text, samples):
+        name = f"{METRICS_PREFIX}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{escape_label_value(label)}"' for key, label in labels.items())
+            lines.append(f"{name}{suffix}{{{label_text}}} {value}" if label_text else f"{name}{suffix} {value}")
+
+    add("active_jobs", "gauge", "Çalışan indirmeler", [("", {}, snapshot["active_jobs"])])
+    add("queue_depth", "gauge", "Kuyrukta bekleyen öğeler", [("", {}, snapshot["queue_depth"])])
+    add("throughput_bytes_per_second", "gauge", "Çalışan indirmelerin toplam hızı",
+        [("", {}, snapshot["throughput_bytes_per_second"])])
+    add("batch_items", "gauge", "Geçerli turdaki öğeler",
+        [("", {"state": "total"}, snapshot["batch_total"]), ("", {"state": "done"}, snapshot["batch_done"])])
+    add("bandwidth_limit_bytes_per_second", "gauge", "Toplam hız sınırı (0 = sınırsız)",
+        [("", {}, snapshot["bandwidth_limit"])])
+    add("bytes_downloaded_total", "counter", "İndirilen bayt",
+        [("", {}, snapshot["bytes_downloaded_total"])])
+    add("items_total", "counter", "Sonuca göre biten indirme denemeleri",
+        [("", {"result": result}, count) for result, count in sorted(snapshot["items_total"].items())])
+    add("failures_total", "counter", "Hata sınıfına göre başarısız denemeler",
+        [("", {"class": failure}, count) for failure, count in sorted(snapshot["failures_total"].items())])
+    add("retries_total", "counter", "Yeniden denenen indirmeler", [("", {}, snapshot["retries_total"])])
+    phase_samples = []
+    for phase, values in sorted(snapshot["phase_seconds"].items()):
+        phase_samples.append(("_sum", {"phase": phase}, values["sum"]))
+        phase_samples.append(("_count", {"phase": phase}, values["count"]))
+    add("phase_duration_seconds", "summary", "İndirme aşamalarında geçen süre", phase_samples)
+    add("uptime_seconds", "gauge", "Motorun çalışma süresi", [("", {}, snapshot["uptime_seconds"])])
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Motor metriklerini localhost HTTP uç noktasında ve/veya periyodik JSON dosyasında yayınlar.
+
+    GET /metrics Prometheus metin biçimini, GET /metrics.json anlık görüntüyü döndürür.
+    Sunucu yalnızca 127.0.0.1'e bağlanır.
+    """
+
+    def __init__(self, engine, port=None, snapshot_file=None,
+                 snapshot_interval=DEFAULT_METRICS_SNAPSHOT_INTERVAL, log=print):
+        self.engine = engine
+        self.port = port
+        self.snapshot_file = snapshot_file
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.log = log
+        self.server = None
+        self.write_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.writer_thread = None
+
+    def start(self):
+        if self.port:
+            exporter = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    path = self.path.split("?", 1)[0]
+                    if path == "/metrics":
+                        body = format_metrics(exporter.engine.metrics_snapshot()).encode("utf-8")
+                        content_type = "text/plain; version=0.0.4; charset=utf-8"
+                    elif path == "/metrics.json":
+                        body = json.dumps(exporter.engine.metrics_snapshot()).encode("utf-8")
+                        content_type = "application/json"
+                    else:
+                        self.send_error(404)
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            try:
+                self.server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+            except OSError as e:
+                self.log(f"Metrik sunucusu başlatılamadı (port {self.port}): {e}")
+            else:
+                self.server.daemon_threads = True
+                threading.Thread(target=self.server.serve_forever, daemon=True).start()
+                self.log(f"Metrikler: http://127.0.0.1:{self.server.server_address[1]}/metrics")
+        if self.snapshot_file:
+            self.writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+            self.writer_thread.start()
+        return self
+
+    def write_snapshot(self):
+        """Anlık görüntüyü benzersiz adlı geçici dosya üzerinden atomik olarak yazar.
+
+        Yazıcı iş parçacığı ile stop() aynı anda yazabilir; kilit, stop()'un son
+        görüntüsünün eski bir görüntüyle ezilmesini önler.
+        """
+        with self.write_lock:
+            temp_path = None
+            try:
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', delete=False, suffix=".tmp",
+                                                 dir=os.path.dirname(self.snapshot_file) or ".",
+                                                 prefix=os.path.basename(self.snapshot_file) + ".") as f:
+                    temp_path = f.name
+                    json.dump(self.engine.metrics_snapshot(), f, indent=2)
+                os.replace(temp_path, self.snapshot_file)
+            except OSError as e:
+                self.log(f"Metrik dosyası yazılamadı: {e}")
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def _write_loop(self):
+        while not self.stop_event.wait(self.snapshot_interval):
+            self.write_snapshot()
+
+    def stop(self):
+        """Sunucuyu kapatır ve son anlık görüntüyü yazar."""
+        self.stop_event.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.snapshot_file:
+            self.write_snapshot()
+
+
+def create_metrics_exporter(engine, settings, base_dir, port=None, snapshot_file=None, log=print):
+    """Ayarlara göre (metrics_port, metrics_snapshot_file) metrik yayınını başlatır; kapalıysa None.
+
+    Göreli anlık görüntü yolu base_dir'e (config.json'un klasörü) göre çözülür.
+    """
+    port = port if port is not None else get_int_setting(settings, "metrics_port", 0)
+    snapshot_file = snapshot_file or settings.get("metrics_snapshot_file")
+    if not port and not snapshot_file:
+        return None
+    if snapshot_file:
+        snapshot_file = os.path.join(base_dir, snapshot_file)
+    return MetricsExporter(
+        engine, port, snapshot_file,
+        get_int_setting(settings, "metrics_snapshot_interval", DEFAULT_METRICS_SNAPSHOT_INTERVAL, 1),
+        log=log
+    ).start()
+
+
+class DownloadEngine:
+    """Çok yuvalı indirme motoru.
+
+    Her yuva (slot) kendi iş parçacığında kuyruktan URL alır ve kendi yt-dlp
+    işlemini çalıştırır. Motor Tk'ye dokunmaz; log, öğe durumu ve bitiş
+    bildirimleri geri çağırmalarla (callback) iletilir ve bunlar yuva iş
+    parçacıklarından çağrılır.
+    """
+
+    def __init__(self, yt_dlp_path, archive=None, job_store=None, log=print,
+                 on_item_state=None, on_progress=None, on_finished=None, backend="auto",
+                 metadata_cache=None, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 per_host_starts_per_minute=DEFAULT_PER_HOST_STARTS_PER_MINUTE,
+                 max_retries=DEFAULT_MAX_RETRIES, bandwidth=None, ytdlp_manager=None):
+        self.yt_dlp_path = yt_dlp_path
+        # Hazırlanan yt-dlp güncellemesi (YtDlpManager) çalışan yt-dlp işlemi kalmayınca kurulur
+        self.ytdlp_manager = ytdlp_manager
+        # Ön yüklenmiş bilgi JSON'ları (MetadataCache); varsa extractor atlanır
+        self.metadata_cache = metadata_cache
+        # "auto": yt_dlp modülü varsa işçi havuzu, yoksa alt işlem;
+        # "subprocess" / "embedded" (süreç içi) / "pool" (işçi süreç havuzu)
+        self.backend = backend
+        # Süreç içi / havuz arka ucu ilk kullanımda yüklenir (None = henüz denenmedi, False = yok)
+        self.runner = None
+        self.archive = archive
+        self.job_store = job_store
+        self.log = log
+        self.on_item_state = on_item_state
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+
+        # Sıralama: kullanıcı önceliği (büyük önce), isteğe bağlı en kısa iş önce
+        # (ön yüklenen süreye göre) ve listedeki sıra. Anahtarlar URL'dir.
+        self.priorities = {}
+        self.positions = {}
+        self.costs = {}
+        self.shortest_job_first = False
+        # Host bazlı kuyruk: site başına eşzamanlılık/hız sınırı ve 429/403 geri çekilmesi
+        self.scheduler = HostScheduler(per_host_limit, per_host_starts_per_minute, self._sort_key)
+        self.is_downloading = False
+        # stop() her çağrıldığında artar: yuva, öğeyi aldığı andaki değerle karşılaştırarak
+        # öğenin durdurma ile kesildiğini anlar (hemen ardından yeni tur başlasa bile)
+        self.stop_generation = 0
+        self.threads = []
+        # Her yuvanın kendi yt-dlp işlemi vardır: {slot: Popen}
+        self.current_processes = {}
+        self.lock = threading.Lock()
+        self.active_workers = 0
+        # Turda açılabilecek en fazla yuva (canlı eklemelerde boş yuvalar açılır)
+        self.max_workers = 1
+        # Yuvaların işlediği URL'ler ve öğe bazında durdurma istekleri {url: "paused"|"cancelled"}
+        self.slot_urls = {}
+        self.interrupts = {}
+        # Yuvaların son ilerleme olayları - arayüz bunları sabit aralıkla okur
+        self.progress_events = {}
+        self.batch_total = 0
+        self.batch_done = 0
+        self.succeeded = 0
+        self.failed_urls = []
+        # Toplam bant genişliği bütçesi; aktif yuvalar arasında eşit bölünür
+        self.bandwidth = bandwidth or BandwidthManager()
+        # İndirme yapan yuvalar ve onlara en son uygulanan sınır
+        self.running_slots = set()
+        self.applied_rate = None
+        self.last_bandwidth_check = 0
+        # Alt işlem arka ucu: yuvadaki yt-dlp'nin -r sınırı, başlama zamanı ve o andaki toplam
+        # bütçe {slot: (sınır, zaman, bütçe)}
+        # ile sınır değiştiği için yeniden başlatılacak yuvalar
+        self.slot_rates = {}
+        self.rate_restarts = set()
+        # Yuvaların son başarısız indirmesinin sınıfı ve hata mesajı: {slot: (sınıf, mesaj)}
+        self.slot_failures = {}
+        # Öğe başına yapılan yeniden deneme sayısı ve tur sonu raporu için kalıcı hatalar
+        self.max_retries = max_retries
+        self.retry_counts = Counter()
+        self.failures = []
+        # Tur başında alınan indirme seçenekleri (download_dir, format, download_both, quality,
+        # performance_args)
+        self.options = {}
+        # Sayaçlar (MetricsExporter ile dışarı verilir)
+        self.metrics = EngineMetrics()
+
+    def _sort_key(self, url):
+        cost = self.costs.get(url, float("inf")) if self.shortest_job_first else 0
+        return (-self.priorities.get(url, 0), cost, self.positions.get(url, len(self.positions)))
+
+    def set_order(self, urls):
+        """Liste sırasını (sürükle-bırak sonrası) kuyruğa yansıtır."""
+        self.positions = {url: index for index, url in enumerate(urls)}
+        self.scheduler.resort()
+
+    def set_priority(self, url, priority):
+        """Öğenin önceliğini değiştirir; büyük değer önce indirilir (varsayılan 0)."""
+        if priority:
+            self.priorities[url] = priority
+        else:
+            self.priorities.pop(url, None)
+        self.scheduler.update(url)
+
+    def set_cost(self, url, cost):
+        """En kısa iş önce modunda kullanılacak tahmini süreyi (sn) kaydeder."""
+        self.costs[url] = cost
+        if self.shortest_job_first:
+            # Her ön yükleme sonucu için tüm kuyruk değil, sadece bu iş yeniden konumlanır
+            self.scheduler.update(url)
+
+    def set_shortest_job_first(self, enabled):
+        self.shortest_job_first = bool(enabled)
+        self.scheduler.resort()
+
+    def add(self, urls):
+        """Yürüyen tura yeni URL'ler ekler; tur çalışmıyorsa False döner (start kullanılmalı)."""
+        with self.lock:
+            if not self.is_downloading:
+                return False
+            for url in urls:
+                self.positions.setdefault(url, len(self.positions))
+                self.scheduler.put(url)
+            self.batch_total += len(urls)
+            # Tur az sayıda öğeyle başladıysa boş yuvalar açılır
+            new_slots = range(len(self.threads), min(self.max_workers, len(self.threads) + len(urls)))
+            self.active_workers += len(new_slots)
+        for slot in new_slots:
+            self._start_worker(slot)
+        return True
+
+    def pause(self, url):
+        """Öğeyi duraklatır: kuyruktan çıkarılır veya indirmesi durdurulur (.part korunur).
+
+        Öğe bu turda değilse False döner.
+        """
+        return self._interrupt(url, "paused")
+
+    def cancel(self, url):
+        """Öğeyi iptal eder: kuyruktan çıkarılır veya indirmesi durdurulup yarım dosyası silinir."""
+        return self._interrupt(url, "cancelled")
+
+    def resume(self, url):
+        """Duraklatılan öğeyi yürüyen tura geri ekler; tur çalışmıyorsa False döner."""
+        if not self.add([url]):
+            return False
+        self.set_item_state(video_key(url), "pending")
+        return True
+
+    def _interrupt(self, url, state):
+        if self.scheduler.remove(url):
+            with self.lock:
+                self.batch_total -= 1
+            self.set_item_state(video_key(url), state)
+            return True
+        with self.lock:
+            slot = next((slot for slot, slot_url in self.slot_urls.items() if slot_url == url), None)
+            if slot is None:
+                return False
+            self.interrupts[url] = state
+            process = self.current_processes.get(slot)
+        # Gömülü/havuz arka uçları isteği ilerleme hook'unda görür
+        if process and process.poll() is None:
+            process.terminate()
+        return True
+
+    def _start_worker(self, slot):
+        runner = self.runner or None
+        if isinstance(runner, WorkerPoolBackend):
+            runner.warm_up(slot + 1)
+        thread = threading.Thread(target=self._worker, args=(slot,))
+        thread.daemon = True
+        thread.start()
+        self.threads.append(thread)
+
+    def start(self, urls, options, worker_count):
+        """URL'leri kuyruğa ekler ve worker_count kadar indirme yuvası başlatır.
+
+        Tur sürerken çağrılamaz (add kullanılmalı); durdurulan turun yuvaları
+        bitene kadar bekler, böylece eski yuvalar yeni kuyruktan iş almaz.
+        """
+        if self.is_downloading:
+            raise RuntimeError("Önceki indirme turu hâlâ sürüyor")
+        self.wait()
+        # Önceki turdan kalmış olabilecek işler atılır
+        self.scheduler.clear()
+        for url in urls:
+            self.positions.setdefault(url, len(self.positions))
+            self.scheduler.put(url)
+
+        self.options = dict(options)
+        self.batch_total = len(self.scheduler)
+        self.batch_done = 0
+        self.succeeded = 0
+        self.failed_urls = []
+        self.slot_failures.clear()
+        self.retry_counts.clear()
+        self.failures = []
+        with self.lock:
+            self.progress_events.clear()
+        self.is_downloading = True
+
+        # Arka uç yuvalardan önce yüklenir ki ilk işlere de hız sınırı uygulanabilsin
+        self.max_workers = max(1, worker_count)
+        worker_count = max(1, min(worker_count, self.batch_total))
+        runner = self.get_runner()
+        if isinstance(runner, WorkerPoolBackend):
+            runner.warm_up(worker_count)
+
+        # İndirme yuvalarını (iş parçacıklarını) başlat
+        self.active_workers = worker_count
+        self.threads = []
+        for slot in range(worker_count):
+            self._start_worker(slot)
+
+        self.log(f"{worker_count} eşzamanlı indirme yuvası başlatıldı")
+        return worker_count
+
+    def stop(self):
+        """Kuyruğu boşaltır ve tüm yuvalardaki işlemleri sonlandırır."""
+        with self.lock:
+            self.stop_generation += 1
+        self.is_downloading = False
+
+        # Kuyruk temizle - yuvalar yeni iş almasın
+        self.scheduler.clear()
+
+        with self.lock:
+            processes = list(self.current_processes.values())
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+
+    def wait(self):
+        """Tüm yuvalar bitene kadar bekler."""
+        for thread in self.threads:
+            while thread.is_alive():
+                thread.join(0.5)
+
+    def progress_snapshot(self):
+        """(yuva olayları, biten öğe sayısı, toplam öğe sayısı) döndürür."""
+        with self.lock:
+            return list(self.progress_events.values()), self.batch_done, self.batch_total
+
+    def metrics_snapshot(self):
+        """Sayaçları ve anlık göstergeleri tek bir sözlük olarak döndürür."""
+        with self.lock:
+            active_jobs = len(self.running_slots)
+            throughput = sum(event["speed"] or 0 for event in self.progress_events.values()
+                             if event["phase"] == "download")
+            batch_total, batch_done = self.batch_total, self.batch_done
+        snapshot = {
+            "time": round(time.time(), 3),
+            "active_jobs": active_jobs,
+            "queue_depth": len(self.scheduler),
+            "throughput_bytes_per_second": round(throughput, 1),
+            "batch_total": batch_total,
+            "batch_done": batch_done,
+            "bandwidth_limit": self.bandwidth.current_limit() or 0,
+        }
+        snapshot.update(self.metrics.snapshot())
+        return snapshot
+
+    def set_item_state(self, key, state, error=None, count_retry=False):
+        """Öğe durumunu kalıcı kuyruğa yazar ve dinleyiciye bildirir."""
+        if self.job_store:
+            self.job_store.set_state(key, state, error, count_retry)
+        if self.on_item_state:
+            self.on_item_state(key, state)
+
+    def _publish_progress(self, slot, url, event):
+        """Yuvanın son ilerleme olayını saklar; ara olaylar birleştirilir (sadece sonuncusu kalır)."""
+        self.metrics.observe(slot, event)
+        with self.lock:
+            previous = self.progress_events.get(slot)
+            if event["downloaded"] is None and previous:
+                # Aşama olayı: son bilinen bayt bilgisini koru
+                event = dict(previous, phase=event["phase"])
+            self.progress_events[slot] = event
+        now = time.monotonic()
+        if now - self.last_bandwidth_check >= BANDWIDTH_CHECK_SECONDS:
+            # Çizelgede aralık değiştiyse sınırlar yürüyen indirmelere de uygulanır
+            self.last_bandwidth_check = now
+            if self.bandwidth.per_job_limit(len(self.running_slots)) != self.applied_rate:
+                self.rebalance()
+        if event["downloaded"] is not None:
+            self._check_subprocess_rate(slot, now)
+        if self.on_progress:
+            self.on_progress(slot, url, event)
+
+    def _check_subprocess_rate(self, slot, now):
+        # Ayrı işleme sınır sadece başlangıçta (-r) verilebilir: sınır belirgin biçimde değiştiyse
+        # yuva yt-dlp'yi durdurur ve .part dosyasından devam edecek şekilde yeniden başlatır
+        with self.lock:
+            started = self.slot_rates.get(slot)
+            if started is None or slot in self.rate_restarts:
+                return
+            rate, started_at, budget = started
+            # Sınır sadece başka bir iş bittiği için gevşediyse kesilmez; boşalan payı sıradaki iş alır
+            allow_raise = self.bandwidth.current_limit() != budget
+            if (now - started_at >= RATE_RESTART_MIN_SECONDS and
+                    rate_restart_needed(rate, self.applied_rate, allow_raise)):
+                self.rate_restarts.add(slot)
+
+    def set_bandwidth(self, settings):
+        """Bant genişliği ayarlarını indirmeleri yeniden başlatmadan değiştirir."""
+        self.bandwidth.update(settings)
+        self.rebalance()
+
+    def rebalance(self):
+        """Toplam bütçeyi aktif yuvalara yeniden böler (iş başladığında/bittiğinde çağrılır)."""
+        with self.lock:
+            slots = sorted(self.running_slots)
+            rate = self.bandwidth.per_job_limit(len(slots))
+            changed = rate != self.applied_rate
+            self.applied_rate = rate
+        runner = self.runner or None
+        if runner:
+            for slot in slots:
+                runner.set_ratelimit(slot, rate)
+        if changed and slots:
+            if rate:
+                self.log(f"Bant genişliği: toplam {format_bytes(self.bandwidth.current_limit())}/s, "
+                         f"{len(slots)} iş için iş başına {format_bytes(rate)}/s")
+            else:
+                self.log("Bant genişliği sınırı kaldırıldı")
+
+    def download_item(self, url, slot=0):
+        """Bir URL'yi tur seçeneklerine göre indirir; başarılıysa True döner."""
+        download_dir = self.options["download_dir"]
+        if self.options.get("download_both"):
+            # Hem MP3 hem MP4: tek ağ indirmesi, MP3 yerelde MP4'ten üretilir
+            return self.download_single_format(url, download_dir, "mp4+mp3", slot)
+        # Seçili formatta indir
+        return self.download_single_format(url, download_dir, self.options["format"], slot)
+
+    def build_args(self, url, download_dir, format_to_download, quality, info_path=None):
+        """yt-dlp komut satırı argümanlarını (çalıştırılabilir dosya hariç) oluşturur.
+
+        info_path verilirse URL yerine önbellekteki bilgi JSON'u yüklenir.
+        """
+        args = get_quality_params(format_to_download, quality)
+        args.extend(self.options.get("performance_args", []))
+        if not self.runner and self.applied_rate:
+            # Ayrı işlemde sınır başlangıçta verilir; belirgin değişiklikte yuva yeniden başlatılır
+            args.extend(["-r", str(self.applied_rate)])
+        output_template = os.path.join(download_dir, "%(title)s.%(ext)s")
+        args.extend(["-o", output_template])
+        # Yarım kalan .part dosyalarından devam et
+        args.append("--continue")
+        # Yapılandırılmış ilerleme satırları (her güncelleme ayrı satır)
+        args.extend(["--newline", "--progress-template", PROGRESS_TEMPLATE])
+        if info_path:
+            args.extend(["--load-info-json", info_path])
+        else:
+            args.append(url)
+        return args
+
+    def download_single_format(self, url, download_dir, format_to_download, slot=0):
+        """Belirli bir format için tek bir indirme işlemini gerçekleştirir."""
+        key = video_key(url)
+        quality = self.options.get("quality")
+        try:
+            # Arşivde olan öğeler için yt-dlp başlatılmaz
+            if self.archive and self.archive.is_downloaded(key, format_to_download, quality):
+                self.log(f"[{slot + 1}] Arşivde mevcut, atlanıyor ({format_to_download.upper()}): {url}")
+                return True
+            
+            self.log(f"[{slot + 1}] İndiriliyor ({format_to_download.upper()}): {url}")
+            
+            info_path = self.metadata_cache.fresh_path(key) if self.metadata_cache else None
+            args = self.build_args(url, download_dir, format_to_download, quality, info_path)
+            tracker = OutputTracker()
+            start_time = time.time()
+            
+            def handle_event(event):
+                self._publish_progress(slot, url, event)
+                tracker.feed_event(event)
+            
+            def handle_line(line):
+                event = parse_progress_line(line)
+                if event:
+                    handle_event(event)
+                    if line.startswith(PROGRESS_PREFIX):
+                        # Ham ilerleme satırları konsola yazılmaz, sadece özet yazılır
+                        return
+                tracker.feed_line(line)
+                self.log(f"[{slot + 1}] {line}")
+            
+            should_stop = lambda: not self.is_downloading or url in self.interrupts
+            runner = self.get_runner()
+            if runner:
+                returncode = runner.download(slot, args, handle_line, handle_event, should_stop)
+            else:
+                while True:
+                    with self.lock:
+                        self.slot_rates[slot] = (self.applied_rate, time.monotonic(), self.bandwidth.current_limit())
+                    returncode = self._run_subprocess(
+                        slot, args, handle_line, lambda: should_stop() or slot in self.rate_restarts)
+                    with self.lock:
+                        restart = slot in self.rate_restarts
+                        self.rate_restarts.discard(slot)
+                    if returncode is not None or not restart or should_stop():
+                        break
+                    # Kesilen akışın yarım boyutu sayılmaz; devam eden yt-dlp toplamı yeniden bildirir
+                    tracker.last_event = None
+                    args = self.build_args(url, download_dir, format_to_download, quality, info_path)
+                    self.log(f"[{slot + 1}] Hız sınırı değişti, indirme kaldığı yerden yeniden başlatılıyor: {url}")
+            
+            if returncode is None or (returncode != 0 and should_stop()):
+                if self.interrupts.get(url) == "cancelled":
+                    # İptal: devam edilmeyecek yarım dosyalar silinir (duraklatmada .part korunur)
+                    self._remove_partial_files(tracker.downloaded_paths)
+                    self.log(f"[{slot + 1}] İndirme iptal edildi ({format_to_download.upper()}): {url}")
+                elif url in self.interrupts:
+                    self.log(f"[{slot + 1}] İndirme duraklatıldı ({format_to_download.upper()}): {url}")
+                else:
+                    self.log(f"[{slot + 1}] İndirme durduruldu ({format_to_download.upper()}): {url}")
+                return False
+            
+            if returncode == 0:
+                if format_to_download == "mp4+mp3" and tracker.merged_path:
+                    self._remove_intermediate_files(tracker.downloaded_paths, tracker.merged_path)
+                tracker.finish()
+                if self.archive:
+                    if format_to_download in ("mp4", "mp4+mp3"):
+                        self.archive.record(key, "mp4", quality, tracker.video_path)
+                    if format_to_download in ("mp3", "mp4+mp3"):
+                        self.archive.record(key, "mp3", quality, tracker.audio_path)
+                elapsed = time.time() - start_time
+                average_speed = tracker.total_bytes / elapsed if elapsed > 0 else 0
+                self.log(f"[{slot + 1}] İndirme tamamlandı ({format_to_download.upper()}): {url} - "
+                         f"{format_bytes(tracker.total_bytes)}, ort. {format_bytes(average_speed)}/s, {format_duration(elapsed)}")
+                return True
+            else:
+                failure_class = classify_failure(tracker.error_lines)
+                error = tracker.error_lines[-1] if tracker.error_lines else f"kod: {returncode}"
+                with self.lock:
+                    self.slot_failures[slot] = (failure_class, error)
+                self.log(f"[{slot + 1}] İndirme hatası ({format_to_download.upper()}): {url}, kod: {returncode}")
+                return False
+                
+        except Exception as e:
+            self.log(f"[{slot + 1}] Hata ({format_to_download.upper()} indirme - {url}): {str(e)}")
+            return False
+        finally:
+            with self.lock:
+                self.progress_events.pop(slot, None)
+                self.slot_rates.pop(slot, None)
+                self.rate_restarts.discard(slot)
+
+    def _run_subprocess(self, slot, args, handle_line, should_stop):
+        """yt-dlp'yi ayrı bir işlem olarak çalıştırır; durdurulursa None döner."""
+        # İşlem çalıştığı sürece yt-dlp güncellemesi kurulmaz (bitince kurulur)
+        with ytdlp_running(self.ytdlp_manager):
+            process = subprocess.Popen(
+                [self.yt_dlp_path] + args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding='utf-8',
+                errors='replace'
+            )
+            with self.lock:
+                self.current_processes[slot] = process
+            try:
+                for line in process.stdout:
+                    if should_stop():
+                        # İndirme veya bu öğe durdurulduysa, bu alt işlemi de durdur.
+                        if process.poll() is None: # Hala çalışıyorsa
+                            process.terminate()
+                            process.wait() # Sonlanmasını bekle
+                        return None
+                    handle_line(line.strip())
+                return process.wait()
+            finally:
+                with self.lock:
+                    self.current_processes.pop(slot, None)
+
+    def get_runner(self):
+        """Seçili arka uca göre süreç içi yt-dlp'yi veya işçi havuzunu döndürür; kullanılamıyorsa None (alt işlem)."""
+        if self.backend == "subprocess":
+            return None
+        with self.lock:
+            if self.runner is None:
+                if self.backend == "embedded":
+                    self.runner = EmbeddedBackend.load() or False
+                else:
+                    self.runner = WorkerPoolBackend.load() or False
+                if isinstance(self.runner, EmbeddedBackend):
+                    self.log("yt-dlp süreç içinde (gömülü) çalıştırılıyor")
+                elif self.runner:
+                    self.log("yt-dlp kalıcı işçi süreç havuzunda çalıştırılıyor")
+                elif self.backend != "auto":
+                    self.log("yt_dlp modülü bulunamadı, yt-dlp ayrı işlem olarak çalıştırılacak")
+            return self.runner or None
+
+    def shutdown(self):
+        """Motoru kapatır: indirmeleri durdurur ve işçi süreçlerini sonlandırır."""
+        self.stop()
+        self.wait()
+        if isinstance(self.runner, WorkerPoolBackend):
+            self.runner.shutdown()
+
+    def _remove_partial_files(self, downloaded_paths):
+        """İptal edilen indirmenin .part/.ytdl ve tüm .part-FragN dosyalarını siler."""
+        for path in downloaded_paths:
+            fragments = glob.glob(glob.escape(path) + ".part-Frag*")
+            for partial in [path + ".part", path + ".ytdl"] + fragments:
+                try:
+                    if os.path.exists(partial):
+                        os.remove(partial)
+                except OSError as e:
+                    self.log(f"Yarım dosya silinemedi: {partial} - {e}")
+
+    def _remove_intermediate_files(self, downloaded_paths, merged_path):
+        """Birleştirilmiş dosya dışındaki ara format dosyalarını siler."""
+        for path in downloaded_paths:
+            if os.path.abspath(path) == os.path.abspath(merged_path):
+                continue
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                self.log(f"Ara dosya silinemedi: {path} - {e}")
+
+    def _worker(self, slot):
+        """İndirme yuvası iş parçacığı. Kuyruk boşalana kadar sıradaki uygun URL'yi alır."""
+        while True:
+            while self.is_downloading:
+                url = self.scheduler.get(lambda: self.is_downloading)
+                if url is None:
+                    break
+                key = video_key(url)
+                self.set_item_state(key, "running")
+                success = False
+                failure_class, error = "unknown", None
+                with self.lock:
+                    generation = self.stop_generation
+                    self.running_slots.add(slot)
+                    self.slot_urls[slot] = url
+                self.rebalance()
+                self.metrics.start_item(slot)
+
+                try:
+                    success = self.download_item(url, slot)
+                except Exception as e:
+                    error = str(e)
+                    self.log(f"Hata: {error}")
+                finally:
+                    with self.lock:
+                        failure_class, error = self.slot_failures.pop(slot, (failure_class, error))
+                        self.running_slots.discard(slot)
+                        self.slot_urls.pop(slot, None)
+                        interrupt = self.interrupts.pop(url, None)
+                        stopped_item = generation != self.stop_generation or not self.is_downloading
+                    self.rebalance()
+                    throttled = not success and not stopped_item and failure_class == "throttled"
+                    requeue_delay = None
+                    if interrupt and not success:
+                        # Öğe duraklatıldı/iptal edildi: turdan çıkar, diğer öğeler sürer
+                        self.set_item_state(key, interrupt)
+                        self.metrics.finish_item(slot, interrupt)
+                        with self.lock:
+                            self.batch_total -= 1
+                    elif success:
+                        self.set_item_state(key, "done")
+                        self.metrics.finish_item(slot, "done")
+                        with self.lock:
+                            self.succeeded += 1
+                            self.batch_done += 1
+                    elif stopped_item:
+                        # Kullanıcı durdurdu: öğe bekleyen olarak kalır, sonraki başlatmada devam eder;
+                        # hata sayılmaz ve yeniden denenmez
+                        self.set_item_state(key, "pending")
+                        self.metrics.finish_item(slot, "stopped")
+                        with self.lock:
+                            self.batch_done += 1
+                    elif failure_class in RETRYABLE_FAILURES and self.retry_counts[url] < self.max_retries:
+                        self.metrics.finish_item(slot, "retried", failure_class)
+                        self.retry_counts[url] += 1
+                        self.set_item_state(key, "pending", error, count_retry=True)
+                        if throttled:
+                            # Bekleme hostun geri çekilme süresiyle sağlanır; öğe sırasını korur
+                            requeue_delay = 0
+                        else:
+                            delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (self.retry_counts[url] - 1))
+                            requeue_delay = delay = random.uniform(delay / 2, delay)
+                            self.log(f"[{slot + 1}] Geçici hata ({failure_class}), {format_duration(delay)} sonra "
+                                     f"yeniden denenecek ({self.retry_counts[url]}/{self.max_retries}): {url}")
+                    else:
+                        self.set_item_state(key, "failed", error, count_retry=True)
+                        self.metrics.finish_item(slot, "failed", failure_class)
+                        with self.lock:
+                            self.failed_urls.append(url)
+                            self.failures.append({"url": url, "class": failure_class, "error": error})
+                            self.batch_done += 1
+                    # Geri çekilme ve yeniden kuyruklama tek kilit altında yapılır
+                    delay = self.scheduler.task_done(url, success, throttled, requeue_delay)
+                    if delay:
+                        self.log(f"[{slot + 1}] {host_for(url)} istekleri kısıtladı (429/403), "
+                                 f"bu siteden {format_duration(delay)} boyunca yeni indirme başlatılmayacak")
+
+            # Son biten yuva bitişi bildirir
+            with self.lock:
+                if self.is_downloading and len(self.scheduler):
+                    # Kuyruk boşaldıktan hemen sonra add() ile eklenen işler
+                    continue
+                self.active_workers -= 1
+                last_worker = self.active_workers == 0
+                stopped = not self.is_downloading
+                if last_worker:
+                    self.is_downloading = False
+            break
+        if last_worker:
+            if self.on_finished:
+                self.on_finished({
+                    "total": self.batch_total,
+                    "done": self.succeeded,
+                    "failed": list(self.failed_urls),
+                    "failures": list(self.failures),
+                    "retries": sum(self.retry_counts.values()),
+                    "stopped": stopped,
+                })
+
+
+def load_settings(config_file):
+    """config.json'u salt okunur olarak yükler; yoksa veya bozuksa boş sözlük döner."""
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def get_int_setting(settings, name, default, minimum=0):
+    """Ayarı tam sayı olarak döndürür; geçersizse varsayılanı kullanır."""
+    try:
+        return max(minimum, int(settings.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def benchmark_profiles(yt_dlp_path, url, settings, format_choice="mp4", quality="high",
+                       backend="subprocess", profiles=PERFORMANCE_PROFILES, log=print):
+    """Aynı URL'yi her performans profiliyle geçici bir klasöre indirip süreleri karşılaştırır.
+
+    [{profile, ok, seconds, bytes, speed, relative}] döndürür; relative,
+    varsayılan profile göre hız oranıdır.
+    """
+    results = []
+    for profile in profiles:
+        with tempfile.TemporaryDirectory(prefix="ytd-bench-") as download_dir:
+            summary = {}
+            engine = DownloadEngine(yt_dlp_path, log=log, on_finished=summary.update,
+                                    backend=backend, max_retries=0)
+            options = {
+                "download_dir": download_dir,
+                "format": format_choice,
+                "quality": quality,
+                "performance_args": get_performance_args(profile, settings, log),
+            }
+            start_time = time.monotonic()
+            engine.start([url], options, 1)
+            engine.wait()
+            elapsed = time.monotonic() - start_time
+            engine.shutdown()
+            size = sum(os.path.getsize(os.path.join(root, name))
+                       for root, _, names in os.walk(download_dir) for name in names)
+        results.append({
+            "profile": profile,
+            "ok": summary.get("done") == 1,
+            "seconds": round(elapsed, 2),
+            "bytes": size,
+            "speed": round(size / elapsed) if elapsed > 0 else None,
+        })
+    baseline = next((r["speed"] for r in results if r["profile"] == "default" and r["ok"]), None)
+    for result in results:
+        result["relative"] = round(result["speed"] / baseline, 2) if baseline and result["speed"] else None
+    return results
+
+
+def read_url_lines(stream):
+    """Akıştan boş olmayan ve # ile başlamayan satırları URL olarak okur."""
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+# Komut satırı çıkış kodları: 0 = hepsi başarılı, 1..100 = başarısız öğe sayısı
+# (100 ile sınırlı), 101 = kurulum hatası (yt-dlp / klasör / URL yok), 130 = kesildi
+EXIT_SETUP_ERROR = 101
+EXIT_INTERRUPTED = 130
+MAX_FAILED_EXIT_CODE = 100
+
+
+def positive_int(value):
+    """argparse türü: 1 veya daha büyük tam sayı (aksi halde çıkış kodu 2)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"geçersiz tam sayı: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"en az 1 olmalı: {value}")
+    return number
+
+
+def main(argv=None):
+    """Arayüzsüz toplu indirme: URL'leri argümanlardan, dosyalardan veya stdin'den alır.
+
+    İlerleme ve olaylar stdout'a JSON satırları olarak yazılır.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m downloader_core",
+        description="YouTube Downloader - arayüzsüz (headless) toplu indirme"
+    )
+    parser.add_argument("urls", nargs="*", help="İndirilecek URL'ler")
+    parser.add_argument("-a", "--batch-file", action="append", default=[],
+                        help="Her satırında bir URL olan dosya ('-' = stdin); birden fazla verilebilir")
+    parser.add_argument("-o", "--output-dir", help="İndirme klasörü (varsayılan: config.json'daki download_dir)")
+    parser.add_argument("--format", choices=["mp4", "mp3", "both"], help="İndirme formatı")
+    parser.add_argument("--quality", choices=["high", "medium", "low"], default="high", help="Kalite")
+    parser.add_argument("-j", "--jobs", type=positive_int, help="Eşzamanlı indirme sayısı")
+    parser.add_argument("--config", default=get_config_path(), help="config.json yolu")
+    parser.add_argument("--yt-dlp", dest="yt_dlp_path", help="yt-dlp çalıştırılabilir dosyası")
+    parser.add_argument("--profile", choices=PERFORMANCE_PROFILES,
+                        help="Performans profili (varsayılan: config.json'daki performance_profile)")
+    parser.add_argument("--benchmark-profiles", action="store_true",
+                        help="İlk URL'yi her performans profiliyle indirip hızları karşılaştır")
+    parser.add_argument("--limit-rate",
+                        help="Toplam hız sınırı, ör. 2M veya 500K (varsayılan: config.json'daki bandwidth_limit)")
+    parser.add_argument("--per-host-limit", type=int,
+                        help="Aynı siteden eşzamanlı indirme sayısı, 0 = yalnızca yuva sayısı "
+                             "(varsayılan: config.json'daki per_host_limit)")
+    parser.add_argument("--retries", type=int,
+                        help="Geçici hatalarda öğe başına yeniden deneme sayısı (varsayılan: config.json'daki max_retries)")
+    parser.add_argument("--update-yt-dlp", action="store_true",
+                        help="yt-dlp'yi kur veya güncelle (config.json'daki ytdlp_mirror kullanılır); "
+                             "URL verilmezse sonra çık")
+    parser.add_argument("--no-archive", action="store_true", help="İndirme arşivini kullanma")
+    parser.add_argument("--backend", choices=["auto", "subprocess", "embedded", "pool"],
+                        help="yt-dlp'yi ayrı işlemde, süreç içinde veya kalıcı işçi havuzunda çalıştır")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="Video bilgilerini indirmelerden önce paralel olarak çekme")
+    parser.add_argument("--metrics-port", type=int,
+                        help="Metrikleri http://127.0.0.1:<port>/metrics adresinde yayınla "
+                             "(varsayılan: config.json'daki metrics_port, 0 = kapalı)")
+    parser.add_argument("--metrics-snapshot-file",
+                        help="Metriklerin periyodik olarak yazılacağı JSON dosyası "
+                             "(varsayılan: config.json'daki metrics_snapshot_file)")
+    parser.add_argument("--progress-interval", type=float, default=1.0,
+                        help="Bir yuva için ilerleme satırları arasındaki en kısa süre (sn)")
+    args = parser.parse_args(argv)
+
+    output_lock = threading.Lock()
+
+    def emit(event, **data):
+        data["event"] = event
+        data["time"] = round(time.time(), 3)
+        with output_lock:
+            sys.stdout.write(json.dumps(data, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+    settings = load_settings(args.config)
+
+    if args.update_yt_dlp:
+        manager = YtDlpManager(args.yt_dlp_path or get_default_ytdlp_path(), settings.get("ytdlp_mirror"),
+                               log=lambda message: emit("log", message=str(message)))
+        if not manager.install():
+            return EXIT_SETUP_ERROR
+        emit("ytdlp", path=manager.path, sha256=file_sha256(manager.path))
+        if not args.urls and not args.batch_file:
+            return 0
+
+    # URL'leri topla: argümanlar, dosyalar, stdin
+    urls = list(args.urls)
+    for batch_file in args.batch_file:
+        if batch_file == "-":
+            urls.extend(read_url_lines(sys.stdin))
+            continue
+        try:
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                urls.extend(read_url_lines(f))
+        except OSError as e:
+            emit("error", message=f"URL dosyası okunamadı: {batch_file} - {e}")
+            return EXIT_SETUP_ERROR
+    if not urls and not args.batch_file and not sys.stdin.isatty():
+        urls.extend(read_url_lines(sys.stdin))
+
+    # Tekrarları (extractor, id) anahtarıyla ele; geçersiz URL'ler atlanır
+    keyed_urls = {}
+    for url in reversed(urls):
+        try:
+            keyed_urls[video_key(url)] = url
+        except ValueError as e:
+            emit("log", message=str(e))
+    unique_urls = list(keyed_urls.values())[::-1]
+    if not unique_urls:
+        emit("error", message="İndirilecek URL yok")
+        return EXIT_SETUP_ERROR
+
+    yt_dlp_path = args.yt_dlp_path or get_default_ytdlp_path()
+    if not os.path.exists(yt_dlp_path):
+        yt_dlp_path = shutil.which("yt-dlp") or yt_dlp_path
+    if not os.path.exists(yt_dlp_path):
+        emit("error", message=f"yt-dlp bulunamadı: {yt_dlp_path}")
+        return EXIT_SETUP_ERROR
+
+    download_dir = args.output_dir or settings.get("download_dir") or os.getcwd()
+    if not os.path.isdir(download_dir):
+        emit("error", message=f"Geçersiz indirme klasörü: {download_dir}")
+        return EXIT_SETUP_ERROR
+
+    format_choice = args.format or ("both" if settings.get("download_both") else settings.get("default_format", "mp4"))
+    options = {
+        "download_dir": download_dir,
+        "format": "mp4" if format_choice == "both" else format_choice,
+        "download_both": format_choice == "both",
+        "quality": args.quality,
+        "performance_args": get_performance_args(
+            args.profile or settings.get("performance_profile", "default"), settings,
+            lambda message: emit("log", message=message)
+        ),
+    }
+
+    if args.benchmark_profiles:
+        results = benchmark_profiles(
+            yt_dlp_path, unique_urls[0], settings,
+            format_choice="mp4+mp3" if options["download_both"] else options["format"],
+            quality=args.quality, backend=args.backend or settings.get("backend", "auto"),
+            log=lambda message: emit("log", message=str(message))
+        )
+        for result in results:
+            emit("benchmark", url=unique_urls[0], **result)
+        return 0 if all(result["ok"] for result in results) else 1
+
+    archive = None
+    if not args.no_archive and settings.get("use_download_archive", True):
+        archive = DownloadArchive(os.path.join(os.path.dirname(os.path.abspath(args.config)), "archive.db"))
+
+    def bandwidth_settings(loaded):
+        if args.limit_rate is not None:
+            loaded = dict(loaded, bandwidth_limit=args.limit_rate)
+        return loaded
+
+    try:
+        bandwidth = BandwidthManager(bandwidth_settings(settings))
+    except ValueError as e:
+        emit("error", message=str(e))
+        return EXIT_SETUP_ERROR
+
+    metadata_cache = None
+    if settings.get("prefetch_metadata", True):
+        try:
+            metadata_cache = MetadataCache(
+                os.path.join(os.path.dirname(os.path.abspath(args.config)), "cache", "info"),
+                settings.get("info_cache_ttl", DEFAULT_INFO_CACHE_TTL)
+            )
+        except OSError as e:
+            emit("log", message=f"Bilgi önbelleği açılamadı: {e}")
+
+    last_progress = {}
+
+    def on_progress(slot, url, event):
+        now = time.time()
+        if now - last_progress.get(slot, 0) < args.progress_interval:
+            return
+        last_progress[slot] = now
+        emit("progress", slot=slot, url=url, **event)
+
+    summary = {}
+    engine = DownloadEngine(
+        yt_dlp_path,
+        archive=archive,
+        log=lambda message: emit("log", message=str(message)),
+        on_item_state=lambda key, state: emit("item", extractor=key[0], id=key[1], state=state),
+        on_progress=on_progress,
+        on_finished=summary.update,
+        backend=args.backend or settings.get("backend", "auto"),
+        metadata_cache=metadata_cache,
+        per_host_limit=args.per_host_limit if args.per_host_limit is not None else get_int_setting(
+            settings, "per_host_limit", DEFAULT_PER_HOST_LIMIT),
+        per_host_starts_per_minute=get_int_setting(
+            settings, "per_host_starts_per_minute", DEFAULT_PER_HOST_STARTS_PER_MINUTE),
+        max_retries=args.retries if args.retries is not None else get_int_setting(
+            settings, "max_retries", DEFAULT_MAX_RETRIES),
+        bandwidth=bandwidth,
+    )
+
+    metrics_exporter = create_metrics_exporter(
+        engine, settings, os.path.dirname(os.path.abspath(args.config)),
+        port=args.metrics_port,
+        snapshot_file=os.path.abspath(args.metrics_snapshot_file) if args.metrics_snapshot_file else None,
+        log=lambda message: emit("log", message=str(message))
+    )
+
+    def watch_config():
+        # Bant genişliği ayarları indirmeler sürerken config.json'dan güncellenebilir
+        try:
+            last_mtime = os.path.getmtime(args.config)
+        except OSError:
+            last_mtime = None
+        while engine.is_downloading:
+            time.sleep(CONFIG_WATCH_SECONDS)
+            try:
+                mtime = os.path.getmtime(args.config)
+            except OSError:
+                continue
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+            try:
+                engine.set_bandwidth(bandwidth_settings(load_settings(args.config)))
+                emit("bandwidth", limit=engine.bandwidth.current_limit())
+            except ValueError as e:
+                emit("log", message=str(e))
+
+    try:
+        jobs = args.jobs or int(settings.get("max_concurrent_downloads", 3))
+    except (TypeError, ValueError):
+        jobs = 1
+    emit("start", total=len(unique_urls), jobs=jobs, **options)
+
+    if metadata_cache and not args.no_prefetch:
+        # Kuyruğun ilerisindeki öğelerin bilgileri indirmelerle paralel çekilir
+        prefetcher = MetadataPrefetcher(
+            yt_dlp_path, metadata_cache,
+            on_info=lambda key, info: emit("metadata", extractor=key[0], id=key[1], **info),
+            log=lambda message: emit("log", message=str(message)),
+            # Süreç içi çıkarma sadece gömülü arka uçta: havuz arka ucunun süreç yalıtımı korunur
+            use_module=engine.backend == "embedded",
+            scheduler=engine.scheduler,
+        )
+        # İlk öğeleri yuvalar zaten hemen alır
+        prefetcher.submit([(video_key(url), url) for url in unique_urls[jobs:]])
+
+    try:
+        engine.start(unique_urls, options, jobs)
+        threading.Thread(target=watch_config, daemon=True).start()
+        engine.wait()
+    except KeyboardInterrupt:
+        engine.shutdown()
+        if metrics_exporter:
+            metrics_exporter.stop()
+        emit("summary", interrupted=True, **summary)
+        return EXIT_INTERRUPTED
+
+    engine.shutdown()
+    if metrics_exporter:
+        metrics_exporter.stop()
+    emit("summary", **summary)
+    return min(len(summary.get("failed", [])), MAX_FAILED_EXIT_CODE)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,681 @@
+"""downloader_core'un Tk'den bağımsız yardımcıları için birim testleri.
+
+Çalıştırma: python -m unittest discover tests  (veya python -m pytest -q)
+"""
+import functools
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from downloader_core import (
+    MIN_JOB_RATE,
+    PROGRESS_PREFIX,
+    THROTTLE_BACKOFF_BASE,
+    BandwidthManager,
+    DownloadArchive,
+    DownloadEngine,
+    HostScheduler,
+    JobStore,
+    YtDlpManager,
+    classify_failure,
+    format_metrics,
+    get_quality_params,
+    host_for,
+    main,
+    parse_checksums,
+    parse_progress_line,
+    parse_rate,
+    rate_restart_needed,
+    video_key,
+)
+
+VIDEO_ID = "dQw4w9WgXcQ"
+
+
+def local_timestamp(hour, minute):
+    """Bugünün yerel saatine karşılık gelen zaman damgası."""
+    today = time.localtime()
+    return time.mktime((today.tm_year, today.tm_mon, today.tm_mday, hour, minute, 0, 0, 0, -1))
+
+
+class VideoKeyTests(unittest.TestCase):
+    def test_youtube_variants_share_key(self):
+        urls = [
+            f"https://www.youtube.com/watch?v={VIDEO_ID}",
+            f"https://youtube.com/watch/?v={VIDEO_ID}",
+            f"https://m.youtube.com/watch?v={VIDEO_ID}&t=42s",
+            f"https://music.youtube.com/watch?v={VIDEO_ID}&list=PL123",
+            f"https://youtu.be/{VIDEO_ID}?si=abc",
+            f"https://www.youtube.com/shorts/{VIDEO_ID}",
+            f"youtube.com/embed/{VIDEO_ID}",
+            f"  https://www.youtube.com/watch?v={VIDEO_ID}  ",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(video_key(url), ("youtube", VIDEO_ID))
+
+    def test_watch_with_invalid_id_is_generic(self):
+        self.assertEqual(video_key("https://www.youtube.com/watch?v=short")[0], "generic")
+
+    def test_facebook_watch_page(self):
+        self.assertEqual(video_key("https://m.facebook.com/watch/?v=123456"), ("facebook", "123456"))
+
+    def test_playlist_urls_stay_distinct(self):
+        first = video_key("https://www.youtube.com/playlist?list=PLfirst")
+        second = video_key("https://youtube.com/playlist?list=PLsecond")
+        self.assertEqual(first, ("generic", "https://youtube.com/playlist?list=PLfirst"))
+        self.assertNotEqual(first, second)
+
+    def test_generic_url_is_normalized(self):
+        key = video_key("HTTPS://www.Example.com/videos/clip/?utm_source=x&b=2&a=1&fbclid=y#frag")
+        self.assertEqual(key, ("generic", "https://example.com/videos/clip?a=1&b=2"))
+
+    def test_blank_or_hostless_input_is_rejected(self):
+        for url in ("", "   ", "https://", "https:///path"):
+            with self.subTest(url=url):
+                with self.assertRaises(ValueError):
+                    video_key(url)
+
+
+class HostForTests(unittest.TestCase):
+    def test_known_sites_group_by_extractor(self):
+        self.assertEqual(host_for(f"https://youtu.be/{VIDEO_ID}"), "youtube")
+        self.assertEqual(host_for(f"https://m.youtube.com/watch/?v={VIDEO_ID}"), "youtube")
+
+    def test_non_video_pages_of_known_sites(self):
+        # Playlist sayfası da YouTube'un geri çekilmesine tabi olmalı
+        self.assertEqual(host_for("https://www.youtube.com/playlist?list=PL123"), "youtube")
+
+    def test_unknown_sites_group_by_hostname(self):
+        self.assertEqual(host_for("https://cdn.example.org:8080/a.mp4"), "cdn.example.org")
+        self.assertEqual(host_for("http://127.0.0.1:8765/media/a.mp4"), "127.0.0.1")
+
+    def test_blank_input_is_rejected(self):
+        with self.assertRaises(ValueError):
+            host_for("")
+
+
+class ParseProgressLineTests(unittest.TestCase):
+    def test_progress_template_line(self):
+        event = parse_progress_line(f"{PROGRESS_PREFIX} 512 2048 NA 1024.5 2")
+        self.assertEqual(event, {"phase": "download", "downloaded": 512, "total": 2048,
+                                 "speed": 1024.5, "eta": 2, "percent": 25.0})
+
+    def test_estimated_total_and_unknown_values(self):
+        event = parse_progress_line(f"{PROGRESS_PREFIX} 100 NA 400.0 NA NA")
+        self.assertEqual(event["total"], 400)
+        self.assertEqual(event["percent"], 25.0)
+        self.assertIsNone(event["speed"])
+        self.assertIsNone(event["eta"])
+
+    def test_unknown_total_has_no_percent(self):
+        event = parse_progress_line(f"{PROGRESS_PREFIX} 100 NA NA 10 NA")
+        self.assertIsNone(event["total"])
+        self.assertIsNone(event["percent"])
+
+    def test_percent_is_capped(self):
+        self.assertEqual(parse_progress_line(f"{PROGRESS_PREFIX} 300 200 NA 1 0")["percent"], 100.0)
+
+    def test_malformed_progress_line(self):
+        self.assertIsNone(parse_progress_line(f"{PROGRESS_PREFIX} 1 2 3"))
+
+    def test_phase_lines(self):
+        merge = parse_progress_line('[Merger] Merging formats into "a.mp4"')
+        self.assertEqual(merge["phase"], "merge")
+        self.assertIsNone(merge["downloaded"])
+        self.assertEqual(parse_progress_line("[ExtractAudio] Destination: a.mp3")["phase"], "extract")
+
+    def test_other_lines(self):
+        self.assertIsNone(parse_progress_line("[download] Destination: a.mp4"))
+        self.assertIsNone(parse_progress_line("[youtube] abc: Downloading webpage"))
+        self.assertIsNone(parse_progress_line(""))
+
+
+class ClassifyFailureTests(unittest.TestCase):
+    def test_classes(self):
+        cases = [
+            ("ERROR: unable to download video data: HTTP Error 429: Too Many Requests", "throttled"),
+            ("ERROR: [youtube] abc: HTTP Error 403: Forbidden", "throttled"),
+            ("ERROR: [youtube] abc: Sign in to confirm you're not a bot", "throttled"),
+            ("ERROR: [youtube] abc: Sign in to confirm you’re not a bot", "throttled"),
+            ("ERROR: [youtube] abc: Video unavailable", "permanent"),
+            ("ERROR: [youtube] abc: Sign in to confirm your age", "permanent"),
+            ("ERROR: [generic] Unsupported URL: https://example.com", "permanent"),
+            ("ERROR: Unable to download webpage: <urlopen error timed out>", "network"),
+            ("ERROR: [Errno 104] Connection reset by peer", "network"),
+            ("ERROR: fragment 12 not found, unable to continue", "network"),
+            ("ERROR: Giving up after 10 fragment retries", "network"),
+            ("ERROR: yt-dlp işçi süreci beklenmedik şekilde sonlandı (kod: -9)", "crashed"),
+            ("ERROR: [youtube] abc: fragmented MP4 muxing failed", "unknown"),
+            ("ERROR: something new went wrong", "unknown"),
+        ]
+        for line, expected in cases:
+            with self.subTest(line=line):
+                self.assertEqual(classify_failure([line]), expected)
+
+    def test_no_lines(self):
+        self.assertEqual(classify_failure([]), "unknown")
+
+    def test_throttling_wins_over_later_lines(self):
+        lines = ["ERROR: Video unavailable", "ERROR: HTTP Error 429: Too Many Requests"]
+        self.assertEqual(classify_failure(lines), "throttled")
+
+
+class HostSchedulerTests(unittest.TestCase):
+    @staticmethod
+    def once():
+        # get() tek tur dener: uygun iş yoksa en fazla bir bekleme sonrası None döner
+        calls = iter([True])
+        return lambda: next(calls, False)
+
+    def test_lowest_sort_key_first(self):
+        order = {"https://a.example/1": 3, "https://a.example/2": 1, "https://a.example/3": 2}
+        scheduler = HostScheduler(sort_key=order.get)
+        for url in order:
+            scheduler.put(url)
+        taken = [scheduler.get(lambda: True) for _ in order]
+        self.assertEqual(taken, ["https://a.example/2", "https://a.example/3", "https://a.example/1"])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_hosts_take_turns_on_ties(self):
+        scheduler = HostScheduler()
+        for url in ("https://a.example/1", "https://a.example/2", "https://b.example/1"):
+            scheduler.put(url)
+        first = scheduler.get(lambda: True)
+        second = scheduler.get(lambda: True)
+        self.assertEqual({host_for(first), host_for(second)}, {"a.example", "b.example"})
+
+    def test_per_host_limit(self):
+        scheduler = HostScheduler(per_host_limit=1)
+        scheduler.put("https://a.example/1")
+        scheduler.put("https://a.example/2")
+        first = scheduler.get(lambda: True)
+        self.assertIsNone(scheduler.get(self.once()))
+        scheduler.task_done(first, success=True)
+        self.assertEqual(scheduler.get(lambda: True), "https://a.example/2")
+
+    def test_no_per_host_limit_by_default(self):
+        scheduler = HostScheduler()
+        urls = [f"https://a.example/{index}" for index in range(4)]
+        for url in urls:
+            scheduler.put(url)
+        self.assertEqual(sorted(scheduler.get(lambda: True) for _ in urls), urls)
+
+    def test_throttled_host_backs_off(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.example/1")
+        url = scheduler.get(lambda: True)
+        delay = scheduler.task_done(url, throttled=True, requeue_delay=0)
+        self.assertGreaterEqual(delay, THROTTLE_BACKOFF_BASE / 2)
+        self.assertLessEqual(delay, THROTTLE_BACKOFF_BASE)
+        self.assertGreater(scheduler.backoff_remaining("https://a.example/other"), 0)
+        # Geri konan iş bekliyor ama host geri çekildiği için verilmez
+        self.assertEqual(len(scheduler), 1)
+        self.assertIsNone(scheduler.get(self.once()))
+
+    def test_backoff_grows_and_resets(self):
+        scheduler = HostScheduler()
+        url = "https://a.example/1"
+        delays = []
+        for _ in range(3):
+            scheduler.active["a.example"] += 1
+            delays.append(scheduler.task_done(url, throttled=True))
+        # Her seferinde üst sınır ikiye katlanır (jitter alt yarıda kalabilir)
+        self.assertGreater(delays[2], THROTTLE_BACKOFF_BASE)
+        scheduler.active["a.example"] += 1
+        scheduler.task_done(url, success=True)
+        self.assertEqual(scheduler.backoff_level["a.example"], 0)
+
+    def test_other_hosts_unaffected_by_backoff(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.example/1")
+        scheduler.task_done(scheduler.get(lambda: True), throttled=True, requeue_delay=0)
+        scheduler.put("https://b.example/1")
+        self.assertEqual(scheduler.get(self.once()), "https://b.example/1")
+
+    def test_delayed_retry(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.example/1", delay=0.05)
+        self.assertIsNone(scheduler.get(self.once()))
+        self.assertEqual(scheduler.get(lambda: True), "https://a.example/1")
+
+    def test_remove(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.example/1")
+        scheduler.put("https://a.example/2", delay=60)
+        self.assertTrue(scheduler.remove("https://a.example/2"))
+        self.assertTrue(scheduler.remove("https://a.example/1"))
+        self.assertFalse(scheduler.remove("https://a.example/1"))
+        self.assertEqual(len(scheduler), 0)
+
+    def test_empty_queue_returns_none(self):
+        self.assertIsNone(HostScheduler().get(lambda: True))
+
+    def test_update_repositions_single_item(self):
+        costs = {"https://a.example/1": 1, "https://a.example/2": 2, "https://a.example/3": 3}
+        scheduler = HostScheduler(sort_key=costs.get)
+        for url in costs:
+            scheduler.put(url)
+        costs["https://a.example/3"] = 0
+        scheduler.update("https://a.example/3")
+        self.assertEqual(len(scheduler), 3)
+        taken = [scheduler.get(lambda: True) for _ in costs]
+        self.assertEqual(taken, ["https://a.example/3", "https://a.example/1", "https://a.example/2"])
+        # Eski girdi ikinci kez verilmez
+        self.assertIsNone(scheduler.get(self.once()))
+
+    def test_update_ignores_items_not_queued(self):
+        scheduler = HostScheduler()
+        scheduler.update("https://a.example/1")
+        self.assertEqual(len(scheduler), 0)
+
+    def test_removed_and_duplicate_items(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.example/1")
+        scheduler.put("https://a.example/1")
+        scheduler.put("https://a.example/2")
+        self.assertEqual(len(scheduler), 2)
+        scheduler.update("https://a.example/1")
+        self.assertTrue(scheduler.remove("https://a.example/1"))
+        self.assertEqual(scheduler.get(lambda: True), "https://a.example/2")
+        scheduler.task_done("https://a.example/2", success=True)
+        self.assertIsNone(scheduler.get(lambda: True))
+
+
+class BandwidthManagerTests(unittest.TestCase):
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("2M"), 2 * 1024 ** 2)
+        self.assertEqual(parse_rate("500K"), 500 * 1024)
+        self.assertEqual(parse_rate("1.5m"), int(1.5 * 1024 ** 2))
+        self.assertEqual(parse_rate("1MiB/s"), 1024 ** 2)
+        self.assertEqual(parse_rate(""), 0)
+        self.assertEqual(parse_rate(4096), 4096)
+        with self.assertRaises(ValueError):
+            parse_rate("fast")
+
+    def test_budget_is_split_between_jobs(self):
+        manager = BandwidthManager({"bandwidth_limit": "3M"})
+        self.assertEqual(manager.per_job_limit(1), 3 * 1024 ** 2)
+        self.assertEqual(manager.per_job_limit(3), 1024 ** 2)
+        self.assertEqual(manager.per_job_limit(0), 3 * 1024 ** 2)
+
+    def test_split_has_a_floor(self):
+        manager = BandwidthManager({"bandwidth_limit": "64K"})
+        self.assertEqual(manager.per_job_limit(16), MIN_JOB_RATE)
+
+    def test_unlimited(self):
+        self.assertEqual(BandwidthManager().per_job_limit(4), 0)
+
+    def test_schedule(self):
+        manager = BandwidthManager({
+            "bandwidth_limit": "4M",
+            "bandwidth_schedule": [
+                {"from": "09:00", "to": "18:00", "limit": "1M"},
+                {"from": "22:00", "to": "06:00", "limit": 0},
+            ],
+        })
+        self.assertEqual(manager.current_limit(local_timestamp(12, 0)), 1024 ** 2)
+        self.assertEqual(manager.current_limit(local_timestamp(18, 0)), 4 * 1024 ** 2)
+        # Gece yarısını aşan aralık
+        self.assertEqual(manager.current_limit(local_timestamp(23, 30)), 0)
+        self.assertEqual(manager.current_limit(local_timestamp(5, 59)), 0)
+        self.assertEqual(manager.per_job_limit(2, local_timestamp(9, 0)), 512 * 1024)
+
+    def test_invalid_schedule_keeps_previous_settings(self):
+        manager = BandwidthManager({"bandwidth_limit": "1M"})
+        with self.assertRaises(ValueError):
+            manager.update({"bandwidth_limit": "2M", "bandwidth_schedule": [{"from": "9"}]})
+        self.assertEqual(manager.current_limit(), 1024 ** 2)
+
+    def test_rate_restart_needed(self):
+        self.assertTrue(rate_restart_needed(0, 1024 ** 2))
+        self.assertTrue(rate_restart_needed(2 * 1024 ** 2, 1024 ** 2))
+        self.assertFalse(rate_restart_needed(1100 * 1024, 1024 ** 2))
+        self.assertTrue(rate_restart_needed(1024 ** 2, 2 * 1024 ** 2))
+        self.assertFalse(rate_restart_needed(1024 ** 2, 2 * 1024 ** 2, allow_raise=False))
+        self.assertFalse(rate_restart_needed(1024 ** 2, 0, allow_raise=False))
+        self.assertFalse(rate_restart_needed(0, 0))
+
+
+class CommandLineTests(unittest.TestCase):
+    def test_jobs_must_be_positive(self):
+        for value in ("0", "-2", "x"):
+            with self.subTest(value=value):
+                stderr = io.StringIO()
+                with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                    main(["-j", value, "https://youtu.be/" + VIDEO_ID])
+                self.assertEqual(raised.exception.code, 2)
+                self.assertIn("-j/--jobs", stderr.getvalue())
+
+
+class ScriptedRunner:
+    """Verilen çıktı satırlarını yazıp dosyalarını oluşturan, başarıyla biten sahte arka uç."""
+
+    def __init__(self, lines, files):
+        self.lines = lines
+        self.files = files
+        self.calls = []
+
+    def download(self, slot, args, handle_line, handle_event, should_stop):
+        self.calls.append(args)
+        for path in self.files:
+            with open(path, "wb") as f:
+                f.write(b"x")
+        for line in self.lines:
+            handle_line(line)
+        return 0
+
+    def set_ratelimit(self, slot, rate):
+        pass
+
+
+class Mp4Mp3Tests(unittest.TestCase):
+    URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+    def test_single_invocation_keeps_video(self):
+        args = get_quality_params("mp4+mp3", "high")
+        self.assertEqual(args[:2], get_quality_params("mp4", "high"))
+        for option in ("-x", "-k"):
+            self.assertEqual(args.count(option), 1)
+        audio_format = args.index("--audio-format")
+        self.assertEqual(args[audio_format + 1], "mp3")
+        self.assertEqual(args[args.index("--audio-quality") + 1], "0")
+
+    def test_intermediate_files_removed_after_merge(self):
+        download_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, download_dir, True)
+        base = os.path.join(download_dir, "video")
+        video, audio = base + ".f137.mp4", base + ".f140.m4a"
+        merged, mp3 = base + ".mp4", base + ".mp3"
+        runner = ScriptedRunner([
+            f"[download] Destination: {video}",
+            f"[download] Destination: {audio}",
+            f'[Merger] Merging formats into "{merged}"',
+            f"[ExtractAudio] Destination: {mp3}",
+        ], [video, audio, merged, mp3])
+        engine = DownloadEngine("yt-dlp", log=lambda message: None, backend="subprocess")
+        engine.get_runner = lambda: runner
+        engine.start([self.URL], {"download_dir": download_dir, "format": "mp4+mp3", "quality": "high"}, 1)
+        engine.wait()
+        self.assertEqual(len(runner.calls), 1)
+        self.assertEqual(sorted(os.listdir(download_dir)), ["video.mp3", "video.mp4"])
+
+
+class DownloadArchiveTests(unittest.TestCase):
+    KEY = ("youtube", VIDEO_ID)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.path = os.path.join(self.directory, "archive.db")
+        self.video = os.path.join(self.directory, "video.mp4")
+        with open(self.video, "wb") as f:
+            f.write(b"x")
+
+    def open_archive(self):
+        archive = DownloadArchive(self.path)
+        self.addCleanup(archive.conn.close)
+        return archive
+
+    def test_record_survives_reopen(self):
+        self.open_archive().record(self.KEY, "mp4", "high", self.video)
+        archive = self.open_archive()
+        self.assertTrue(archive.is_downloaded(self.KEY, "mp4", "high"))
+        self.assertFalse(archive.is_downloaded(self.KEY, "mp4", "low"))
+        self.assertFalse(archive.is_downloaded(self.KEY, "mp3", "high"))
+        self.assertFalse(archive.is_downloaded(("youtube", "other"), "mp4", "high"))
+
+    def test_deleted_file_is_downloaded_again(self):
+        archive = self.open_archive()
+        archive.record(self.KEY, "mp4", "high", self.video)
+        os.remove(self.video)
+        self.assertFalse(archive.is_downloaded(self.KEY, "mp4", "high"))
+
+    def test_combined_format_needs_both_records(self):
+        archive = self.open_archive()
+        archive.record(self.KEY, "mp4", "high", self.video)
+        self.assertFalse(archive.is_downloaded(self.KEY, "mp4+mp3", "high"))
+        archive.record(self.KEY, "mp3", "high", None)
+        self.assertTrue(archive.is_downloaded(self.KEY, "mp4+mp3", "high"))
+
+    def test_engine_skips_archived_items(self):
+        archive = self.open_archive()
+        archive.record(self.KEY, "mp4", "high", self.video)
+        runner = ScriptedRunner([], [])
+        engine = DownloadEngine("yt-dlp", archive=archive, log=lambda message: None, backend="subprocess")
+        engine.get_runner = lambda: runner
+        url = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+        engine.start([url], {"download_dir": self.directory, "format": "mp4", "quality": "high"}, 1)
+        engine.wait()
+        self.assertEqual(runner.calls, [])
+        self.assertEqual(engine.succeeded, 1)
+
+
+class JobStoreTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.path = os.path.join(directory, "jobs.db")
+        self.items = [(("youtube", f"video{i}"), f"https://youtu.be/video{i}") for i in range(3)]
+
+    def open_store(self):
+        store = JobStore(self.path)
+        self.addCleanup(store.conn.close)
+        return store
+
+    def test_round_trip(self):
+        store = self.open_store()
+        store.add_many(self.items)
+        store.set_state(self.items[0][0], "done")
+        store.set_state(self.items[1][0], "failed", "HTTP Error 404", count_retry=True)
+        store.set_priority(self.items[2][0], 2)
+        self.assertEqual(self.open_store().load(), [
+            (("youtube", "video0"), "https://youtu.be/video0", "done", 0, 0),
+            (("youtube", "video1"), "https://youtu.be/video1", "failed", 1, 0),
+            (("youtube", "video2"), "https://youtu.be/video2", "pending", 0, 2),
+        ])
+
+    def test_order_remove_and_duplicates(self):
+        store = self.open_store()
+        store.add_many(self.items)
+        store.add_many(self.items[:1])
+        store.reorder([key for key, url in reversed(self.items)])
+        store.remove(self.items[1][0])
+        self.assertEqual([key for key, *rest in self.open_store().load()],
+                         [("youtube", "video2"), ("youtube", "video0")])
+
+    def test_downloads_resume_partial_files(self):
+        engine = DownloadEngine("yt-dlp", log=lambda message: None, backend="subprocess")
+        args = engine.build_args(f"https://youtu.be/{VIDEO_ID}", "/tmp", "mp4", "high")
+        self.assertIn("--continue", args)
+        self.assertNotIn("--no-continue", args)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class YtDlpManagerTests(unittest.TestCase):
+    ARTIFACT = "yt-dlp_test"
+
+    def setUp(self):
+        self.mirror_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.mirror_dir, True)
+        install_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, install_dir, True)
+        handler = functools.partial(QuietHandler, directory=self.mirror_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.manager = YtDlpManager(os.path.join(install_dir, "yt-dlp"),
+                                    f"http://127.0.0.1:{server.server_port}/", log=lambda message: None)
+        self.manager.artifact = self.ARTIFACT
+
+    def publish(self, content, checksum=None):
+        with open(os.path.join(self.mirror_dir, self.ARTIFACT), "wb") as f:
+            f.write(content)
+        checksum = checksum or hashlib.sha256(content).hexdigest()
+        with open(os.path.join(self.mirror_dir, "SHA2-256SUMS"), "w") as f:
+            f.write(f"{'0' * 64}  yt-dlp.exe\n{checksum}  {self.ARTIFACT}\n")
+
+    def installed(self):
+        with open(self.manager.path, "rb") as f:
+            return f.read()
+
+    def test_parse_checksums(self):
+        self.assertEqual(parse_checksums("ABC  yt-dlp\ndef *yt-dlp.exe\n\nbroken line here\n"),
+                         {"yt-dlp": "abc", "yt-dlp.exe": "def"})
+
+    def test_install_verifies_checksum(self):
+        self.publish(b"release 1")
+        self.assertTrue(self.manager.install())
+        self.assertEqual(self.installed(), b"release 1")
+        self.assertFalse(self.manager.has_staged_update())
+        # Aynı sürüm tekrar indirilmez
+        self.assertFalse(self.manager.stage_update())
+
+    def test_checksum_mismatch_is_rejected(self):
+        self.publish(b"tampered", checksum=hashlib.sha256(b"release 1").hexdigest())
+        self.assertFalse(self.manager.install())
+        self.assertFalse(os.path.exists(self.manager.path))
+        self.assertEqual(os.listdir(os.path.dirname(self.manager.path)), [])
+
+    def test_missing_artifact_is_rejected(self):
+        self.publish(b"release 1")
+        self.manager.artifact = "yt-dlp_other"
+        self.assertFalse(self.manager.install())
+        self.assertFalse(os.path.exists(self.manager.path))
+
+    def test_staged_update_waits_for_running_processes(self):
+        self.publish(b"release 1")
+        self.manager.install()
+        self.publish(b"release 2")
+        with self.manager.running():
+            self.assertTrue(self.manager.stage_update())
+            self.assertFalse(self.manager.apply_update())
+            self.assertEqual(self.installed(), b"release 1")
+        # Son işlem bitince hazırlanan sürüm kurulur
+        self.assertEqual(self.installed(), b"release 2")
+        self.assertFalse(self.manager.has_staged_update())
+
+    def test_no_process_starts_during_swap(self):
+        self.publish(b"release 1")
+        self.manager.install()
+        self.publish(b"release 2")
+        self.manager.stage_update()
+        started = threading.Event()
+        with self.manager.usage:
+            self.manager.replacing = True
+        thread = threading.Thread(target=lambda: (self.manager.acquire(), started.set()))
+        thread.start()
+        self.assertFalse(started.wait(0.2))
+        with self.manager.usage:
+            self.manager.replacing = False
+            self.manager.usage.notify_all()
+        self.assertTrue(started.wait(5))
+        thread.join()
+        self.assertEqual(self.manager.users, 1)
+        self.manager.release()
+        self.assertEqual(self.installed(), b"release 2")
+
+
+class StalledRunner:
+    """Yarım dosyalarını yazıp durdurulana kadar bekleyen sahte indirme arka ucu."""
+
+    def __init__(self, destination):
+        self.destination = destination
+        self.started = threading.Event()
+
+    def download(self, slot, args, handle_line, handle_event, should_stop):
+        handle_line(f"[download] Destination: {self.destination}")
+        for suffix in (".part", ".ytdl", ".part-Frag1", ".part-Frag2", ".part-Frag17"):
+            with open(self.destination + suffix, "wb") as f:
+                f.write(b"x")
+        self.started.set()
+        while not should_stop():
+            time.sleep(0.01)
+        return 1
+
+    def set_ratelimit(self, slot, rate):
+        pass
+
+
+class PartialFileTests(unittest.TestCase):
+    URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+    def setUp(self):
+        self.download_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.download_dir, True)
+        # Köşeli parantezler glob deseni olarak yorumlanmamalı
+        self.destination = os.path.join(self.download_dir, "video [1080p].mp4")
+
+    def run_interrupted(self, interrupt):
+        runner = StalledRunner(self.destination)
+        engine = DownloadEngine("yt-dlp", log=lambda message: None, backend="subprocess")
+        engine.get_runner = lambda: runner
+        engine.start([self.URL], {"download_dir": self.download_dir, "format": "mp4", "quality": "high"}, 1)
+        self.assertTrue(runner.started.wait(5))
+        self.assertTrue(getattr(engine, interrupt)(self.URL))
+        engine.wait()
+        return sorted(os.listdir(self.download_dir))
+
+    def test_cancel_removes_every_fragment(self):
+        self.assertEqual(self.run_interrupted("cancel"), [])
+
+    def test_pause_keeps_partial_files(self):
+        remaining = self.run_interrupted("pause")
+        self.assertIn("video [1080p].mp4.part", remaining)
+        self.assertIn("video [1080p].mp4.part-Frag17", remaining)
+        self.assertEqual(len(remaining), 5)
+
+
+class FormatMetricsTests(unittest.TestCase):
+    def snapshot(self, **changes):
+        snapshot = {
+            "active_jobs": 2,
+            "queue_depth": 5,
+            "throughput_bytes_per_second": 1536.5,
+            "batch_total": 10,
+            "batch_done": 3,
+            "bandwidth_limit": 0,
+            "bytes_downloaded_total": 4096,
+            "items_total": {"done": 3, "retried": 1},
+            "failures_total": {"network": 1},
+            "retries_total": 1,
+            "phase_seconds": {"download": {"sum": 12.5, "count": 3}},
+            "uptime_seconds": 60.0,
+        }
+        snapshot.update(changes)
+        return snapshot
+
+    def test_prometheus_text(self):
+        lines = format_metrics(self.snapshot()).splitlines()
+        self.assertIn("# TYPE ytd_active_jobs gauge", lines)
+        self.assertIn("ytd_active_jobs 2", lines)
+        self.assertIn("ytd_queue_depth 5", lines)
+        self.assertIn('ytd_batch_items{state="done"} 3', lines)
+        self.assertIn('ytd_items_total{result="retried"} 1', lines)
+        self.assertIn('ytd_failures_total{class="network"} 1', lines)
+        self.assertIn('ytd_phase_duration_seconds_sum{phase="download"} 12.5', lines)
+        self.assertIn('ytd_phase_duration_seconds_count{phase="download"} 3', lines)
+        self.assertIn("# TYPE ytd_phase_duration_seconds summary", lines)
+
+    def test_output_ends_with_newline(self):
+        self.assertTrue(format_metrics(self.snapshot()).endswith("\n"))
+
+    def test_label_values_are_escaped(self):
+        text = format_metrics(self.snapshot(failures_total={'a\\b"c\nd': 1}))
+        self.assertIn('ytd_failures_total{class="a\\\\b\\"c\\nd"} 1', text.splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()
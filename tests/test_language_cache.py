@@ -0,0 +1,85 @@
+"""Derlenmiş dil önbelleği ve yedek dil için birim testleri (pencere açılmaz)."""
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from youtube_downloader import FALLBACK_LANGUAGE, YoutubeDownloader
+except ImportError:  # tkinter olmayan Python kurulumları
+    YoutubeDownloader = None
+
+LANGUAGES = {
+    "en": ("English", {"ready": "Ready", "download": "Download", "language": "Language"}),
+    "de": ("Deutsch", {"ready": "Bereit"}),
+}
+
+
+@unittest.skipIf(YoutubeDownloader is None, "tkinter yok")
+class LanguageCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.lang_dir = os.path.join(self.directory, "lang")
+        os.makedirs(self.lang_dir)
+        for code, (name, translations) in LANGUAGES.items():
+            with open(self.lang_path(code), "w", encoding="utf-8") as f:
+                f.write(f"{name}\n")
+                for key, value in translations.items():
+                    f.write(f"{key}={value}\n")
+
+    def lang_path(self, code):
+        return os.path.join(self.lang_dir, f"{code}.txt")
+
+    def make_app(self):
+        """Sadece dil alanları kurulmuş, Tk penceresi olmayan bir örnek."""
+        app = YoutubeDownloader.__new__(YoutubeDownloader)
+        app.config_file = os.path.join(self.directory, "config.json")
+        app.language_cache_dir = os.path.join(self.directory, "cache", "lang")
+        app.language_bundle = None
+        app.available_languages = {}
+        app.language_names = {}
+        cached = app._read_language_index().get("languages", {})
+        app.language_index = {}
+        for code, (name, translations) in LANGUAGES.items():
+            entry = cached.get(code) or {
+                "name": name, "stamp": app._file_stamp(self.lang_path(code)), "compiled": False}
+            app.language_index[code] = dict(entry, path=self.lang_path(code))
+        return app
+
+    def test_missing_keys_fall_back_to_english(self):
+        translations = self.make_app().resolve_translations("de")
+        self.assertEqual(translations["ready"], "Bereit")
+        self.assertEqual(translations["download"], "Download")
+        self.assertNotIn("app_title", translations)
+
+    def test_fallback_language_alone(self):
+        self.assertEqual(self.make_app().resolve_translations(FALLBACK_LANGUAGE), LANGUAGES["en"][1])
+
+    def test_unknown_language_uses_fallback(self):
+        self.assertEqual(self.make_app().resolve_translations("xx"), LANGUAGES["en"][1])
+
+    def test_compiled_catalog_is_reused(self):
+        self.make_app().load_language("de")
+        app = self.make_app()
+        self.assertTrue(app.language_index["de"]["compiled"])
+        self.assertFalse(app.language_index["en"]["compiled"])
+        # Kaynak dosya okunmadan önbellekten yüklenir
+        os.remove(self.lang_path("de"))
+        self.assertEqual(app.load_language("de"), {"ready": "Bereit"})
+
+    def test_corrupt_catalog_is_recompiled(self):
+        self.make_app().load_language("de")
+        with open(os.path.join(self.directory, "cache", "lang", "de.marshal"), "wb") as f:
+            f.write(b"\x00broken")
+        self.assertEqual(self.make_app().load_language("de"), {"ready": "Bereit"})
+
+    def test_index_of_other_version_is_ignored(self):
+        app = self.make_app()
+        app.load_language("de")
+        app._write_language_cache_file("index.marshal", {"version": -1, "languages": {}})
+        self.assertEqual(app._read_language_index(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,10 +10,79 @@ import re
 import json
 import locale
 import gettext
+import marshal
 import shutil
+import time
+import sqlite3
+import logging
+import logging.handlers
+import multiprocessing
+from collections import deque
+
+# Açılış süresi ölçümünün başlangıcı (downloader_core içe aktarımı dahil)
+STARTUP_STARTED = time.perf_counter()
+
+from downloader_core import (
+    BandwidthManager,
+    DownloadArchive,
+    DownloadEngine,
+    JobStore,
+    MetadataCache,
+    MetadataPrefetcher,
+    YtDlpManager,
+    create_metrics_exporter,
+    DEFAULT_INFO_CACHE_TTL,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PER_HOST_LIMIT,
+    DEFAULT_PER_HOST_STARTS_PER_MINUTE,
+    format_bytes,
+    format_duration,
+    get_config_path,
+    get_default_ytdlp_path,
+    get_int_setting,
+    get_performance_args,
+    parse_rate,
+    video_key,
+)
+
+# config.json'daki bant genişliği değişikliklerinin kontrol aralığı (ms)
+CONFIG_WATCH_MS = 2000
+# Arayüzün ilerleme bilgisini yenileme aralığı (ms)
+PROGRESS_REFRESH_MS = 250
+# Arayüz kuyruğunun boşaltılma aralığı (ms) ve bir turda işlenecek en fazla olay
+UI_QUEUE_REFRESH_MS = 100
+UI_QUEUE_BATCH_LIMIT = 2000
+# Konsolda tutulacak varsayılan satır sayısı; tam günlük diske yazılır
+DEFAULT_CONSOLE_MAX_LINES = 2000
+# Disk günlüğü dönüşüm ayarları
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+# Playlist içe aktarımında arayüze gönderilen grup boyutu ve en uzun bekleme süresi
+PLAYLIST_IMPORT_BATCH_SIZE = 50
+PLAYLIST_IMPORT_FLUSH_SECONDS = 0.5
+# Liste satırlarının durumlarına göre yazı renkleri ("" = tema rengi)
+ITEM_STATE_COLORS = {
+    "pending": "",
+    "running": "#1e90ff",
+    "done": "#808080",
+    "failed": "#d9534f",
+    "paused": "#f0ad4e",
+    "cancelled": "#a9a9a9",
+}
+# Günlük aramasında gösterilecek en fazla sonuç
+LOG_SEARCH_RESULT_LIMIT = 1000
+# "Hataya git" için kullanılan desen (arama büyük/küçük harfe duyarsızdır)
+ERROR_LINE_PATTERN = r"hata|error"
+# Derlenmiş dil kataloğu önbelleğinin biçim sürümü (biçim değişince artırılır)
+LANGUAGE_CACHE_VERSION = 1
+# Seçili dilde eksik olan çeviriler için başvurulan dil
+FALLBACK_LANGUAGE = "en"
 
 class YoutubeDownloader:
     def __init__(self, root):
+        # Açılış aşamalarının süreleri [(aşama, ms)]; ilk çizimden sonra günlüğe yazılır
+        self.startup_marks = []
+        self.mark_startup("içe aktarma")
         self.root = root
         self.root.title("YouTube Downloader")
         self.root.geometry("800x700")  # Yüksekliği artırdık
@@ -29,10 +98,20 @@ class YoutubeDownloader:
         
         # Ayarları yükle
         self.config_file = self.get_config_path()
+        self.file_logger = self.setup_file_logger()
         self.settings = self.load_settings()
+        # archive.db, jobs.db ve bilgi önbelleği ilk çizimden sonra açılır (open_storage)
+        self.archive = None
+        self.job_store = None
+        self.metadata_cache = None
+        self.prefetcher = None
+        self.mark_startup("ayarlar")
         
         # Console başlangıçta None olarak tanımla
         self.console = None
+        # İş parçacıklarından gelen log ve arayüz güncellemeleri bu kuyrukta birikir,
+        # ana döngü bunları toplu olarak işler (Tk'ye sadece ana iş parçacığı dokunur)
+        self.ui_queue = queue.SimpleQueue()
         
         # Tema renklerini tanımla
         self.dark_colors = {
@@ -69,14 +148,19 @@ class YoutubeDownloader:
         self.current_theme = self.settings.get("theme", "light")
         self.current_lang = self.settings.get("language", "tr")
         
-        # Dil dosyalarını bulalım
+        # Dil dosyalarını bulalım: sadece adlar ve seçili dil yüklenir,
+        # diğer diller menüden seçildiğinde derlenmiş önbellekten okunur
         self.available_languages = {}
         self.language_names = {}
+        self.language_index = {}
+        self.translations = {}
         self.load_language_files()
         
         # Dil seçimi doğrulama - eğer ayarlanan dil yoksa varsayılan "tr" kullan
-        if self.current_lang not in self.available_languages:
+        if self.current_lang not in self.language_names:
             self.current_lang = "tr"
+        self.translations = self.resolve_translations(self.current_lang)
+        self.mark_startup("diller")
             
         # "Hem MP3 hem MP4" ayarını yükle
         self.download_both_formats = tk.BooleanVar(
@@ -95,21 +179,46 @@ class YoutubeDownloader:
         # Kalite ayarı
         self.quality_var = tk.StringVar(value="high")
         
-        # İndirme işlemi değişkenleri
-        self.download_thread = None
-        self.downloads_queue = queue.Queue()
-        self.is_downloading = False
-        self.current_process = None
-        
-        # yt-dlp yolu - PyInstaller için düzeltme
-        if getattr(sys, 'frozen', False):
-            # PyInstaller ile derlenen sürüm
-            bundle_dir = os.path.dirname(sys.executable)
-            self.yt_dlp_path = os.path.join(bundle_dir, "appdata", "bin", "yt-dlp.exe")
-        else:
-            # Normal Python sürümü - Türkçe karakter sorununu önlemek için ASCII karakterli isim kullan
-            bin_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "appdata", "bin")
-            self.yt_dlp_path = os.path.join(bin_dir, "yt-dlp.exe")
+        # Toplam hız sınırı ("2M", "500K"; boş = sınırsız)
+        self.bandwidth_var = tk.StringVar(value=str(self.settings.get("bandwidth_limit") or ""))
+        
+        # Performans profili (default / fast / aria2c)
+        self.performance_var = tk.StringVar(value=self.settings.get("performance_profile", "default"))
+        
+        # yt-dlp yolu - PyInstaller için düzeltme downloader_core içinde
+        self.yt_dlp_path = get_default_ytdlp_path()
+        # yt-dlp kurulumu/güncellemesi (ytdlp_mirror ile yerel bir yansı kullanılabilir)
+        self.ytdlp_manager = YtDlpManager(self.yt_dlp_path, self.settings.get("ytdlp_mirror"), log=self.log)
+        
+        # İndirme motoru ve metrik yayını ilk çizimden sonra oluşturulur (create_engine)
+        self.engine = None
+        self.metrics_exporter = None
+        # En kısa iş önce: ön yüklenen süreye göre kısa öğeler öne alınır
+        self.sjf_var = tk.BooleanVar(value=self.settings.get("shortest_job_first", False))
+        # config.json dışarıdan değiştirildiğinde bant genişliği ayarları yeniden okunur
+        self.config_mtime = self.get_config_mtime()
+        
+        # İndirme listesi modeli: {anahtar: url} (ekleme sırası korunur) ve
+        # listbox satırlarıyla aynı sıradaki anahtarlar. Tekrar kontrolü O(1)'dir.
+        self.url_items = {}
+        self.url_keys = []
+        # {anahtar: listbox satırı}; satır araması O(1) olsun diye ekleme/silme/taşımada güncellenir
+        self.key_rows = {}
+        # Öğe durumları {anahtar: pending|running|done|failed} - jobs.db ile eşlenir
+        self.item_states = {}
+        # Ön yüklenen video bilgileri {anahtar: {title, duration, size}}
+        self.item_info = {}
+        # Kullanıcı öncelikleri {anahtar: tam sayı} (0 varsayılan, büyük önce indirilir)
+        self.item_priorities = {}
+        # Sürükle-bırak durumu
+        self.drag_index = None
+        self.drag_moved = False
+        
+        # Playlist içe aktarma durumu
+        self.playlist_import_thread = None
+        self.playlist_import_process = None
+        self.playlist_cancel_event = threading.Event()
+        self.playlist_import_count = 0
         
         # Stil nesnesini başlat
         self.style = ttk.Style()
@@ -125,19 +234,378 @@ class YoutubeDownloader:
         # Tema ve dil ayarlarını uygula
         self.setup_style()
         self.update_ui_texts()
+        self.mark_startup("arayüz")
+        
+        # İlk çizim için gerekmeyen işler pencere göründükten sonra yapılır
+        self.root.after_idle(self.finish_startup)
+
+    def mark_startup(self, stage):
+        """Açılış aşamasının başlangıçtan bu yana geçen süresini kaydeder."""
+        self.startup_marks.append((stage, (time.perf_counter() - STARTUP_STARTED) * 1000))
+
+    def finish_startup(self):
+        """Pencere çizildikten sonra iş kuyruğunu geri yükler ve yt-dlp'yi kontrol eder."""
+        self.root.update_idletasks()
+        self.mark_startup("ilk çizim")
+        
+        # İndirme motoru ve metrik sunucusunun soket açılışı ilk çizimi geciktirmesin
+        self.create_engine()
+        self.mark_startup("motor")
         
-        # Başlangıç kontrolü
+        # SQLite dosyaları ve bilgi önbelleği ilk çizimi geciktirmesin
+        self.open_storage()
+        self.mark_startup("veritabanları")
+        
+        # Önceki oturumdan kalan iş kuyruğunu geri yükle
+        self.restore_jobs()
+        self.mark_startup("geri yükleme")
+        
+        # Motoru okuyan periyodik işler motor oluşturulduktan sonra başlar
+        self.root.after(PROGRESS_REFRESH_MS, self._refresh_progress)
+        self.root.after(CONFIG_WATCH_MS, self._watch_config)
+        
+        # Başlangıç kontrolü (yt-dlp yoksa arka planda indirilir)
         self.check_ytdlp()
+        
+        # Açılış süreleri; gerilemeleri fark etmek için günlüğe yazılır
+        self.log("Açılış süreleri (ms): " + ", ".join(
+            f"{stage} {elapsed:.0f}" for stage, elapsed in self.startup_marks))
+
+    def create_engine(self):
+        """İndirme motorunu ve isteğe bağlı metrik yayınını oluşturur."""
+        # İndirme motoru (Tk'den bağımsız); geri çağırmalar yuva iş parçacıklarından gelir
+        self.engine = DownloadEngine(
+            self.yt_dlp_path,
+            log=self.log,
+            on_item_state=self._on_engine_item_state,
+            on_finished=lambda summary: self.post_ui(self._on_batch_finished, summary),
+            backend=self.settings.get("backend", "auto"),
+            per_host_limit=get_int_setting(self.settings, "per_host_limit", DEFAULT_PER_HOST_LIMIT),
+            per_host_starts_per_minute=get_int_setting(
+                self.settings, "per_host_starts_per_minute", DEFAULT_PER_HOST_STARTS_PER_MINUTE),
+            max_retries=get_int_setting(self.settings, "max_retries", DEFAULT_MAX_RETRIES),
+            bandwidth=self.create_bandwidth_manager(),
+            ytdlp_manager=self.ytdlp_manager
+        )
+        self.engine.set_shortest_job_first(self.sjf_var.get())
+        # İsteğe bağlı metrik yayını (metrics_port / metrics_snapshot_file)
+        self.metrics_exporter = create_metrics_exporter(
+            self.engine, self.settings, os.path.dirname(self.config_file), log=self.log)
 
     def get_config_path(self):
         """Yapılandırma dosyasının yolunu döndürür."""
-        if getattr(sys, 'frozen', False):
-            # PyInstaller ile derlenmişse exe'nin yanına
-            app_dir = os.path.dirname(sys.executable)
+        return get_config_path()
+
+    def setup_file_logger(self):
+        """Tam konsol günlüğünü config.json'un yanındaki logs/ klasörüne dönüşümlü olarak yazar."""
+        self.log_dir = os.path.join(os.path.dirname(self.config_file), "logs")
+        self.log_file = os.path.join(self.log_dir, "downloader.log")
+        logger = logging.getLogger("youtube_downloader")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        if not logger.handlers:
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    self.log_file,
+                    maxBytes=LOG_FILE_MAX_BYTES,
+                    backupCount=LOG_FILE_BACKUP_COUNT,
+                    encoding='utf-8'
+                )
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+            except OSError as e:
+                print(f"Günlük dosyası açılamadı: {e}")
+        return logger
+
+    def open_storage(self):
+        """Arşivi, iş kuyruğunu ve bilgi önbelleğini açıp motora bağlar."""
+        self.archive = self.engine.archive = self.open_archive()
+        self.job_store = self.engine.job_store = self.open_job_store()
+        self.metadata_cache = self.engine.metadata_cache = self.open_metadata_cache()
+        # Video bilgisi ön yükleme (başlık, süre, boyut); sonuçlar ana iş parçacığına aktarılır
+        if self.metadata_cache:
+            self.prefetcher = MetadataPrefetcher(
+                self.yt_dlp_path,
+                self.metadata_cache,
+                on_info=lambda key, info: self.post_ui(self._show_item_info, key, info),
+                log=self.log,
+                # Süreç içi çıkarma sadece gömülü arka uçta: arayüzle GIL için yarışmasın,
+                # havuz arka ucunun süreç yalıtımı korunsun
+                use_module=self.engine.backend == "embedded",
+                scheduler=self.engine.scheduler,
+                ytdlp_manager=self.ytdlp_manager
+            )
+
+    def open_archive(self):
+        """config.json'un yanındaki indirme arşivini açar (use_download_archive kapalıysa None)."""
+        if not self.settings.get("use_download_archive", True):
+            return None
+        archive_path = os.path.join(os.path.dirname(self.config_file), "archive.db")
+        try:
+            return DownloadArchive(archive_path)
+        except sqlite3.Error as e:
+            self.log(f"İndirme arşivi açılamadı: {e}")
+            return None
+
+    def open_job_store(self):
+        """config.json'un yanındaki kalıcı iş kuyruğunu açar."""
+        jobs_path = os.path.join(os.path.dirname(self.config_file), "jobs.db")
+        try:
+            return JobStore(jobs_path)
+        except sqlite3.Error as e:
+            self.log(f"İş kuyruğu açılamadı: {e}")
+            return None
+
+    def open_metadata_cache(self):
+        """config.json'un yanındaki bilgi JSON önbelleğini açar (prefetch_metadata kapalıysa None)."""
+        if not self.settings.get("prefetch_metadata", True):
+            return None
+        cache_dir = os.path.join(os.path.dirname(self.config_file), "cache", "info")
+        try:
+            cache = MetadataCache(cache_dir, self.settings.get("info_cache_ttl", DEFAULT_INFO_CACHE_TTL))
+        except OSError as e:
+            self.log(f"Bilgi önbelleği açılamadı: {e}")
+            return None
+        # Süresi dolan kayıtlar açılışı geciktirmeden arka planda silinir
+        threading.Thread(target=cache.prune, daemon=True).start()
+        return cache
+
+    def prefetch_metadata(self, items):
+        """[(anahtar, url)] öğelerinin bilgilerini arka planda çeker."""
+        if not self.prefetcher or not items:
+            return
+        if not self.prefetcher.use_module and not os.path.exists(self.yt_dlp_path):
+            return
+        self.prefetcher.yt_dlp_path = self.yt_dlp_path
+        self.prefetcher.submit(items)
+
+    def restore_jobs(self):
+        """Önceki oturumdan kalan listeyi ve iş durumlarını geri yükler."""
+        if not self.job_store:
+            return
+        jobs = self.job_store.load()
+        if not jobs:
+            return
+        interrupted = 0
+        for key, url, state, retries, priority in jobs:
+            if priority:
+                self.item_priorities[key] = priority
+                self.engine.priorities[url] = priority
+            if state == "running":
+                # Çökme/kapatma sırasında yarım kalmış: .part dosyasından devam edilecek
+                state = "pending"
+            if state == "pending":
+                interrupted += 1
+            self.url_items[key] = url
+            self.key_rows[key] = len(self.url_keys)
+            self.url_keys.append(key)
+            self.item_states[key] = state
+        self.job_store.set_states([key for key, state in self.item_states.items() if state == "pending"], "pending")
+        self.url_listbox.insert(tk.END, *[self._item_label(key) for key in self.url_keys])
+        for index, key in enumerate(self.url_keys):
+            self._show_item_state(key, index)
+        # Önbellekteki bilgiler arka planda okunur; sadece kaydı olmayan veya süresi dolan öğeler çekilir
+        items = [(key, self.url_items[key]) for key in self.url_keys if self.item_states[key] != "done"]
+        if self.metadata_cache and items:
+            threading.Thread(target=self._load_cached_info, args=(items,), daemon=True).start()
+        self.log(f"{len(jobs)} öğe geri yüklendi, {interrupted} tanesi bekliyor")
+        if interrupted and interrupted < len(jobs):
+            self.status_var.set(f"{interrupted} iş yarım kaldı - devam etmek için indirmeyi başlatın")
+
+    def _load_cached_info(self, items):
+        """Önbellekteki özetleri okur (iş parçacığı); eksik olanları ön yüklemeye bırakır."""
+        cached = []
+        missing = []
+        for key, url in items:
+            summary = self.metadata_cache.load_summary(key)
+            if summary:
+                cached.append((key, summary))
+            else:
+                missing.append((key, url))
+        self.post_ui(self._show_cached_info, cached, missing)
+
+    def _show_cached_info(self, cached, missing):
+        """Önbellekten okunan bilgileri listeye yansıtır, eksikleri çeker (ana iş parçacığı)."""
+        for key, info in cached:
+            self._show_item_info(key, info)
+        self.prefetch_metadata(missing)
+
+    def _reindex_rows(self, start=0, end=None):
+        """url_keys[start:end] aralığındaki satır numaralarını key_rows'a yazar."""
+        for index in range(start, len(self.url_keys) if end is None else end):
+            self.key_rows[self.url_keys[index]] = index
+
+    def _show_item_state(self, key, index=None):
+        """Listbox satırını öğenin durumuna göre renklendirir (ana iş parçacığı)."""
+        if index is None:
+            index = self.key_rows.get(key)
+            if index is None:
+                return
+        color = ITEM_STATE_COLORS.get(self.item_states.get(key), "")
+        self.url_listbox.itemconfig(index, foreground=color)
+
+    def _item_label(self, key):
+        """Listbox satır metni: bilgi geldiyse başlık, süre ve boyut; yoksa URL.
+
+        Varsayılandan farklı öncelikler satırın başında gösterilir (ör. [+2]).
+        """
+        priority = self.item_priorities.get(key, 0)
+        prefix = f"[{priority:+d}] " if priority else ""
+        info = self.item_info.get(key)
+        if not info or not info.get("title"):
+            return prefix + self.url_items[key]
+        details = []
+        if info.get("duration"):
+            details.append(format_duration(info["duration"]))
+        if info.get("size"):
+            details.append("~" + format_bytes(info["size"]))
+        if details:
+            return f"{prefix}{info['title']} [{', '.join(details)}]"
+        return prefix + info["title"]
+
+    def _refresh_item_row(self, key, index=None):
+        """Listbox satırının metnini ve rengini yeniler, seçimi korur (ana iş parçacığı)."""
+        if index is None:
+            index = self.key_rows.get(key)
+            if index is None:
+                return
+        selected = self.url_listbox.selection_includes(index)
+        self.url_listbox.delete(index)
+        self.url_listbox.insert(index, self._item_label(key))
+        self._show_item_state(key, index)
+        if selected:
+            self.url_listbox.selection_set(index)
+
+    def _show_item_info(self, key, info):
+        """Ön yüklenen bilgiyi listbox satırına ve sıralamaya yansıtır (ana iş parçacığı)."""
+        if key not in self.url_items:
+            return
+        self.item_info[key] = info
+        # En kısa iş önce modu için tahmini süre; süre yoksa boyut 1 MiB/s varsayımıyla çevrilir
+        cost = info.get("duration") or (info["size"] / 1048576 if info.get("size") else None)
+        if cost is not None:
+            self.engine.set_cost(self.url_items[key], cost)
+        self._refresh_item_row(key)
+
+    def change_priority(self, delta):
+        """Seçili öğenin önceliğini artırır/azaltır; yürüyen turdaki sırayı da değiştirir."""
+        selection = self.url_listbox.curselection()
+        if not selection:
+            return
+        index = selection[0]
+        key = self.url_keys[index]
+        priority = self.item_priorities.get(key, 0) + delta
+        if priority:
+            self.item_priorities[key] = priority
         else:
-            # Normal script ise scriptin yanına
-            app_dir = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(app_dir, "config.json")
+            self.item_priorities.pop(key, None)
+        self.engine.set_priority(self.url_items[key], priority)
+        if self.job_store:
+            self.job_store.set_priority(key, priority)
+        self._refresh_item_row(key, index)
+
+    def _selected_key(self):
+        selection = self.url_listbox.curselection()
+        return self.url_keys[selection[0]] if selection else None
+
+    def pause_selected(self):
+        """Seçili öğeyi duraklatır; yarım dosyası (.part) devam için saklanır."""
+        self._interrupt_selected("paused", self.engine.pause)
+
+    def cancel_selected(self):
+        """Seçili öğeyi iptal eder; diğer indirmeler sürer."""
+        self._interrupt_selected("cancelled", self.engine.cancel)
+
+    def _interrupt_selected(self, state, engine_action):
+        key = self._selected_key()
+        if key is None or self.item_states.get(key) == "done":
+            return
+        if not engine_action(self.url_items[key]):
+            # Öğe yürüyen turda değil: sadece durumu işaretlenir
+            self.item_states[key] = state
+            if self.job_store:
+                self.job_store.set_state(key, state)
+            self._show_item_state(key)
+
+    def resume_selected(self):
+        """Duraklatılan, iptal edilen veya başarısız olan öğeyi devam ettirir; tur çalışıyorsa hemen kuyruğa girer."""
+        key = self._selected_key()
+        if key is None or self.item_states.get(key) not in ("paused", "cancelled", "failed"):
+            return
+        if not self.engine.resume(self.url_items[key]):
+            self.item_states[key] = "pending"
+            if self.job_store:
+                self.job_store.set_state(key, "pending")
+            self._show_item_state(key)
+
+    def move_item(self, old_index, new_index):
+        """Listbox satırını ve model sırasını taşır (kalıcı kayıt ayrıca yapılır)."""
+        key = self.url_keys.pop(old_index)
+        self.url_keys.insert(new_index, key)
+        self._reindex_rows(min(old_index, new_index), max(old_index, new_index) + 1)
+        self.url_listbox.delete(old_index)
+        self.url_listbox.insert(new_index, self._item_label(key))
+        self._show_item_state(key, new_index)
+        self.url_listbox.selection_clear(0, tk.END)
+        self.url_listbox.selection_set(new_index)
+
+    def commit_order(self):
+        """Liste sırasını jobs.db'ye ve indirme motoruna yansıtır."""
+        if self.job_store:
+            self.job_store.reorder(self.url_keys)
+        self.engine.set_order([self.url_items[key] for key in self.url_keys])
+
+    def move_selected_to_top(self):
+        selection = self.url_listbox.curselection()
+        if selection and selection[0] > 0:
+            self.move_item(selection[0], 0)
+            self.commit_order()
+
+    def _on_list_press(self, event):
+        self.drag_index = self.url_listbox.nearest(event.y)
+        self.drag_moved = False
+
+    def _on_list_drag(self, event):
+        """Sürükle-bırak: satır imlecin üzerinde olduğu konuma taşınır."""
+        if self.drag_index is None:
+            return
+        index = self.url_listbox.nearest(event.y)
+        if index != self.drag_index and 0 <= index < len(self.url_keys):
+            self.move_item(self.drag_index, index)
+            self.drag_index = index
+            self.drag_moved = True
+
+    def _on_list_release(self, event):
+        if self.drag_moved:
+            self.commit_order()
+        self.drag_index = None
+        self.drag_moved = False
+
+    def _show_list_menu(self, event):
+        index = self.url_listbox.nearest(event.y)
+        if index < 0 or index >= len(self.url_keys):
+            return
+        self.url_listbox.selection_clear(0, tk.END)
+        self.url_listbox.selection_set(index)
+        self.list_menu.tk_popup(event.x_root, event.y_root)
+
+    def on_sjf_toggle(self):
+        """En kısa iş önce modunu açar/kapatır ve kaydeder."""
+        self.settings["shortest_job_first"] = self.sjf_var.get()
+        self.save_settings()
+        self.engine.set_shortest_job_first(self.sjf_var.get())
+
+    def _on_engine_item_state(self, key, state):
+        """Motorun öğe durumu bildirimi (yuva iş parçacığından); kalıcı kayıt motorda yapılır."""
+        self.post_ui(self._apply_item_state, key, state)
+
+    def _apply_item_state(self, key, state):
+        """Bildirilen durumu modele yazar (ana iş parçacığı); listeden silinen öğe geri eklenmez."""
+        if key not in self.url_items:
+            return
+        self.item_states[key] = state
+        self._show_item_state(key)
 
     def load_settings(self):
         """Ayarları yapılandırma dosyasından yükler."""
@@ -156,7 +624,9 @@ class YoutubeDownloader:
                     "theme": "light",
                     "download_both": False,
                     "default_format": "mp4",
-                    "language": "tr"
+                    "language": "tr",
+                    "max_concurrent_downloads": 3,
+                    "use_download_archive": True
                 }
                 self.save_settings(default_settings) # İlk çalıştırmada dosyayı oluştur
                 return default_settings
@@ -168,13 +638,15 @@ class YoutubeDownloader:
     def save_settings(self, settings_to_save=None):
         """Mevcut ayarları yapılandırma dosyasına kaydeder."""
         if settings_to_save is None:
-             settings_to_save = {
+             # Arayüzde karşılığı olmayan ayarlar (ör. max_concurrent_downloads) korunur
+             settings_to_save = dict(self.settings)
+             settings_to_save.update({
                 "download_dir": self.dir_var.get(),
                 "theme": self.current_theme,
                 "download_both": self.download_both_formats.get(),
                 "default_format": self.format_var.get(),
                 "language": self.current_lang
-            }
+            })
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(settings_to_save, f, indent=4, ensure_ascii=False)
@@ -183,17 +655,20 @@ class YoutubeDownloader:
             messagebox.showwarning("Uyarı", f"Ayarlar kaydedilemedi:\n{e}")
 
     def check_ytdlp(self):
-        """yt-dlp dosyasının var olduğunu kontrol et"""
+        """yt-dlp dosyasının var olduğunu kontrol et; yoksa arka planda indir"""
         if not os.path.exists(self.yt_dlp_path):
             self.log("Uyarı: yt-dlp bulunamadı!")
-            if not self.download_ytdlp():
-                messagebox.showerror("Hata", 
-                    "yt-dlp bulunamadı ve otomatik olarak indirilemedi.\n"
-                    "İndirme özelliklerini kullanmak için lütfen yt-dlp'yi manuel olarak yükleyin:\n"
-                    "1. https://github.com/yt-dlp/yt-dlp/releases adresinden indirin\n"
-                    "2. İndirdiğiniz dosyayı appdata/bin klasörüne kopyalayın")
+            self.show_loading_screen()
         else:
             self.log(f"{self.get_translation('ytdlp_found')} {self.yt_dlp_path}")
+            # Yeni sürüm arka planda indirilir; mevcut dosya bu sırada kullanılmaya devam eder
+            if self.settings.get("auto_update_ytdlp", True):
+                self.ytdlp_manager.update_in_background(
+                    on_staged=lambda: self.post_ui(self.apply_ytdlp_update))
+
+    def apply_ytdlp_update(self):
+        """Hazırlanan yt-dlp güncellemesini kurar; yt-dlp çalışıyorsa son işlem bitince kurulur."""
+        self.ytdlp_manager.apply_update()
     
     def setup_style(self):
         """Tema ayarlarını yapılandırır."""
@@ -310,10 +785,42 @@ class YoutubeDownloader:
     def add_url(self):
         url = self.url_var.get().strip()
         if url:
-            if url not in [self.url_listbox.get(i) for i in range(self.url_listbox.size())]:
-                self.url_listbox.insert(tk.END, url)
+            if self.add_urls([url]):
                 self.url_var.set("")
     
+    def add_urls(self, urls):
+        """URL'leri tekrarları eleyerek listeye ekler; eklenen sayısını döndürür.
+        
+        Tekrar kontrolü model üzerinden sabit zamanda yapılır ve listbox tek
+        bir toplu insert ile güncellenir.
+        """
+        new_items = []
+        for url in urls:
+            url = url.strip()
+            if not url:
+                continue
+            try:
+                key = video_key(url)
+            except ValueError as e:
+                self.log(str(e))
+                continue
+            if key in self.url_items:
+                continue
+            self.url_items[key] = url
+            self.key_rows[key] = len(self.url_keys)
+            self.url_keys.append(key)
+            self.item_states[key] = "pending"
+            new_items.append((key, url))
+        if new_items:
+            self.url_listbox.insert(tk.END, *[url for _, url in new_items])
+            if self.job_store:
+                self.job_store.add_many(new_items)
+            self.prefetch_metadata(new_items)
+            # Yürüyen tura start_download çağrılmadan eklenir
+            if self.engine.add([url for _, url in new_items]):
+                self.log(f"{len(new_items)} öğe yürüyen indirme kuyruğuna eklendi")
+        return len(new_items)
+    
     def bulk_add_urls(self):
         """Toplu URL ekleme iletişim kutusu göster"""
         bulk_window = tk.Toplevel(self.root)
@@ -330,13 +837,7 @@ class YoutubeDownloader:
         def add_bulk():
             text = text_area.get("1.0", tk.END).strip()
             if text:
-                urls = text.split("\n")
-                count = 0
-                for url in urls:
-                    url = url.strip()
-                    if url and url not in [self.url_listbox.get(i) for i in range(self.url_listbox.size())]:
-                        self.url_listbox.insert(tk.END, url)
-                        count += 1
+                count = self.add_urls(text.split("\n"))
                 
                 messagebox.showinfo("Bilgi", f"{count} URL başarıyla eklendi.")
                 bulk_window.destroy()
@@ -344,7 +845,12 @@ class YoutubeDownloader:
         ttk.Button(bulk_window, text="Ekle", command=add_bulk).pack(pady=10)
     
     def add_playlist(self):
-        """Playlist URL'sinden tüm videoları içe aktarma"""
+        """Playlist URL'sinden tüm videoları arka planda, akış halinde içe aktarma"""
+        # İçe aktarma sürüyorsa buton iptal görevi görür
+        if self.playlist_import_thread and self.playlist_import_thread.is_alive():
+            self.cancel_playlist_import()
+            return
+        
         playlist_url = self.url_var.get().strip()
         if not playlist_url:
             messagebox.showinfo("Uyarı", "Lütfen önce bir playlist URL'si girin!")
@@ -356,15 +862,38 @@ class YoutubeDownloader:
         
         self.log(f"Playlist ayrıştırılıyor: {playlist_url}")
         
+        self.playlist_import_count = 0
+        self.playlist_cancel_event = threading.Event()
+        self.playlist_import_thread = threading.Thread(
+            target=self._import_playlist_worker,
+            args=(playlist_url,)
+        )
+        self.playlist_import_thread.daemon = True
+        self.playlist_import_thread.start()
+        self.playlist_button.config(text=self.get_translation("cancel_import", "İçe Aktarmayı İptal Et"))
+    
+    def cancel_playlist_import(self):
+        """Süren playlist içe aktarımını durdurur; o ana kadar eklenenler listede kalır."""
+        self.playlist_cancel_event.set()
+        process = self.playlist_import_process
+        if process and process.poll() is None:
+            process.terminate()
+        self.log("Playlist içe aktarımı iptal ediliyor...")
+    
+    def _import_playlist_worker(self, playlist_url):
+        """yt-dlp çıktısını satır satır okuyup URL'leri gruplar halinde arayüze gönderir."""
+        # Her girdinin gerçek sayfa adresi kullanılır (YouTube dışındaki siteler için de doğru)
+        cmd = [
+            self.yt_dlp_path,
+            "--flat-playlist",
+            "--print", "%(webpage_url,url)s",
+            playlist_url
+        ]
+        
+        returncode = None
+        # İçe aktarma sürerken yt-dlp güncellemesi kurulmaz (işlem bitince kurulur)
+        self.ytdlp_manager.acquire()
         try:
-            # Playlist'teki video URL'lerini al
-            cmd = [
-                self.yt_dlp_path,
-                "--flat-playlist",
-                "--get-id",
-                playlist_url
-            ]
-            
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -373,43 +902,89 @@ class YoutubeDownloader:
                 encoding='utf-8',
                 errors='replace'
             )
+            self.playlist_import_process = process
             
-            video_ids = []
+            batch = []
+            last_flush = time.time()
             for line in process.stdout:
-                video_id = line.strip()
-                if video_id:
-                    video_ids.append(video_id)
+                if self.playlist_cancel_event.is_set():
+                    break
+                line = line.strip()
+                if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', line):
+                    batch.append(line)
+                elif line:
+                    self.log(line)
+                
+                # Gruplar halinde gönder: arayüz her URL için ayrı ayrı güncellenmez
+                if batch and (len(batch) >= PLAYLIST_IMPORT_BATCH_SIZE or
+                              time.time() - last_flush >= PLAYLIST_IMPORT_FLUSH_SECONDS):
+                    self.post_ui(self._add_imported_urls, batch)
+                    batch = []
+                    last_flush = time.time()
             
-            process.wait()
+            if batch and not self.playlist_cancel_event.is_set():
+                self.post_ui(self._add_imported_urls, batch)
             
-            if process.returncode == 0:
-                # URL'leri listeye ekle
-                count = 0
-                for video_id in video_ids:
-                    video_url = f"https://www.youtube.com/watch?v={video_id}"
-                    if video_url not in [self.url_listbox.get(i) for i in range(self.url_listbox.size())]:
-                        self.url_listbox.insert(tk.END, video_url)
-                        count += 1
-                
-                self.log(f"Playlist'ten {count} video URL'si eklendi")
-                messagebox.showinfo("Bilgi", f"Playlist'ten {count} video URL'si başarıyla eklendi.")
-            else:
-                self.log("Playlist ayrıştırma hatası!")
-                messagebox.showerror("Hata", "Playlist ayrıştırılamadı. Geçerli bir playlist URL'si girdiğinizden emin olun.")
-                
+            if process.poll() is None and self.playlist_cancel_event.is_set():
+                process.terminate()
+            returncode = process.wait()
         except Exception as e:
             self.log(f"Hata: {str(e)}")
-            messagebox.showerror("Hata", f"Playlist ayrıştırma hatası: {str(e)}")
+        finally:
+            self.playlist_import_process = None
+            self.ytdlp_manager.release()
+            self.post_ui(self._finish_playlist_import, returncode, self.playlist_cancel_event.is_set())
+    
+    def _add_imported_urls(self, urls):
+        """İçe aktarılan URL grubunu listeye ekler (ana iş parçacığı)."""
+        self.playlist_import_count += self.add_urls(urls)
+        self.status_var.set(f"Playlist: {self.playlist_import_count} video eklendi...")
+    
+    def _finish_playlist_import(self, returncode, cancelled):
+        """İçe aktarma bittiğinde butonu ve durum bilgisini günceller (ana iş parçacığı)."""
+        self.playlist_button.config(text=self.get_translation("add_playlist"))
+        count = self.playlist_import_count
+        if cancelled:
+            self.log(f"Playlist içe aktarımı iptal edildi, {count} video URL'si eklendi")
+            self.status_var.set(f"Playlist içe aktarımı iptal edildi ({count})")
+        elif returncode == 0:
+            self.log(f"Playlist'ten {count} video URL'si eklendi")
+            self.status_var.set(self.get_translation("ready"))
+            messagebox.showinfo("Bilgi", f"Playlist'ten {count} video URL'si başarıyla eklendi.")
+        else:
+            self.log("Playlist ayrıştırma hatası!")
+            self.status_var.set(self.get_translation("ready"))
+            messagebox.showerror("Hata", "Playlist ayrıştırılamadı. Geçerli bir playlist URL'si girdiğinizden emin olun.")
     
     def delete_selected(self):
         try:
             selected_index = self.url_listbox.curselection()[0]
+            # Yürüyen turdaysa önce indirmesi iptal edilir
+            self.engine.cancel(self.url_items[self.url_keys[selected_index]])
             self.url_listbox.delete(selected_index)
+            key = self.url_keys.pop(selected_index)
+            self.key_rows.pop(key, None)
+            # Silinen satırın altındakiler bir yukarı kayar
+            self._reindex_rows(selected_index)
+            self.url_items.pop(key, None)
+            self.item_states.pop(key, None)
+            self.item_info.pop(key, None)
+            self.item_priorities.pop(key, None)
+            if self.job_store:
+                self.job_store.remove(key)
         except (IndexError, TypeError):
             messagebox.showinfo("Uyarı", "Silinecek öğe seçilmedi!")
     
     def clear_list(self):
         self.url_listbox.delete(0, tk.END)
+        self.url_items.clear()
+        self.url_keys.clear()
+        self.key_rows.clear()
+        self.item_states.clear()
+        self.item_info.clear()
+        self.item_priorities.clear()
+        if self.job_store:
+            self.job_store.clear()
     
     def browse_directory(self):
         """İndirme klasörünü seçer ve kaydeder."""
@@ -425,56 +1000,16 @@ class YoutubeDownloader:
             self.save_settings()
     
     def download_ytdlp(self):
-        """yt-dlp dosyasını indir"""
-        try:
-            print("yt-dlp indiriliyor, lütfen bekleyin...")
-            
-            # Dizini oluştur
-            if getattr(sys, 'frozen', False):
-                # PyInstaller ile paketlenmiş sürüm
-                bin_dir = os.path.join(os.path.dirname(sys.executable), "appdata", "bin")
-            else:
-                # Normal Python sürümü - Türkçe karakter sorununu önlemek için ASCII karakterli isim kullan
-                bin_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "appdata", "bin")
-            
-            # Klasörün var olduğundan emin ol
-            os.makedirs(bin_dir, exist_ok=True)
-            
-            # yt-dlp dosya yolunu güncelle
-            self.yt_dlp_path = os.path.join(bin_dir, "yt-dlp.exe")
-            
-            # Windows için yt-dlp URL'si
-            ytdlp_url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
-            
-            print(f"İndiriliyor: {ytdlp_url}")
-            print(f"Kaydedilecek yer: {self.yt_dlp_path}")
-            
-            # Klasör yolunun doğru formatlanmış olduğundan emin ol
-            bin_dir = bin_dir.replace("\\", "\\\\")
-            yt_dlp_path_escaped = self.yt_dlp_path.replace("\\", "\\\\")
-            
-            # PowerShell ile indir - çift tırnak ve tek tırnak kullanımına dikkat et
-            download_cmd = f'powershell -Command "(New-Object System.Net.WebClient).DownloadFile(\'{ytdlp_url}\', \'{yt_dlp_path_escaped}\')"'
-            
-            print(f"Çalıştırılan komut: {download_cmd}")
-            subprocess.run(download_cmd, shell=True, check=True)
-            
-            # Dosyanın indirilip indirilmediğini kontrol et
-            if os.path.exists(self.yt_dlp_path):
-                print(f"yt-dlp başarıyla indirildi: {self.yt_dlp_path}")
-                return True
-            else:
-                print(f"Hata: İndirme başarılı görünüyor ancak dosya bulunamadı: {self.yt_dlp_path}")
-                return False
-                
-        except Exception as e:
-            print(f"Hata: yt-dlp indirilemedi: {str(e)}")
-            messagebox.showerror("Hata", f"yt-dlp indirilemedi: {str(e)}\nLütfen manuel olarak indirin.")
-            return False
+        """yt-dlp'yi bu sistem için indirir ve SHA2-256SUMS ile doğrular (arka plan iş parçacığı)"""
+        def progress(downloaded, total):
+            if total:
+                self.post_ui(self.loading_status.set,
+                             f"{self.get_translation('ytdlp_downloading')} %{downloaded * 100 // total}")
+        return self.ytdlp_manager.install(progress)
     
     def start_download(self):
         """İndirme işlemini başlatır."""
-        if not self.url_listbox.size():
+        if not self.url_items:
             messagebox.showwarning("Uyarı", "Lütfen en az bir URL ekleyin.")
             return
         
@@ -482,61 +1017,102 @@ class YoutubeDownloader:
             messagebox.showerror("Hata", "Geçersiz indirme klasörü!")
             return
         
-        self.is_downloading = True
+        # Bitmemiş öğeleri kuyruğa ekle (duraklatılan/iptal edilenler hariç);
+        # hepsi bitmişse yeni bir tur başlat
+        keys = [key for key in self.url_keys
+                if self.item_states.get(key) not in ("done", "paused", "cancelled")]
+        if not keys:
+            if any(self.item_states.get(key) != "done" for key in self.url_keys):
+                messagebox.showinfo("Bilgi", "Bekleyen öğe yok. Duraklatılan veya iptal edilen öğeleri "
+                                             "sağ tık menüsünden devam ettirebilirsiniz.")
+                return
+            keys = list(self.url_keys)
+        
         self.download_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         
-        # URL'leri kuyruğa ekle
-        for i in range(self.url_listbox.size()):
-            url = self.url_listbox.get(i)
-            self.downloads_queue.put(url)
-        
-        # İndirme iş parçacığını başlat
-        self.download_thread = threading.Thread(target=self.download_worker)
-        self.download_thread.daemon = True
-        self.download_thread.start()
-    
+        for key in keys:
+            self.item_states[key] = "pending"
+            self._show_item_state(key, self.key_rows[key])
+        if self.job_store:
+            self.job_store.set_states(keys, "pending")
+
+        # Yuvalar Tk değişkenlerine dokunmaz: seçeneklerin anlık kopyası verilir
+        options = {
+            "download_dir": self.dir_var.get(),
+            "format": self.format_var.get(),
+            "download_both": self.download_both_formats.get(),
+            "quality": self.quality_var.get(),
+            "performance_args": get_performance_args(self.performance_var.get(), self.settings, self.log),
+        }
+        self.progress_var.set(0)
+        self.engine.yt_dlp_path = self.yt_dlp_path
+        self.engine.set_order([self.url_items[key] for key in self.url_keys])
+        self.engine.start([self.url_items[key] for key in keys], options, self.get_worker_count())
+
+    def get_worker_count(self):
+        """config.json'daki eşzamanlı indirme sayısını döndürür (en az 1)."""
+        try:
+            return max(1, int(self.settings.get("max_concurrent_downloads", 3)))
+        except (TypeError, ValueError):
+            return 1
+
     def stop_download(self):
         """İndirme işlemini durdur"""
-        if not self.is_downloading:
+        if not self.engine.is_downloading:
             return
-            
-        self.is_downloading = False
-        
-        # Mevcut işlemi sonlandır
-        if self.current_process and self.current_process.poll() is None:
-            self.current_process.terminate()
-        
-        # Kuyruk temizle
-        while not self.downloads_queue.empty():
-            self.downloads_queue.get()
-        
-        # Arayüzü güncelle
-        self.download_button.config(state=tk.NORMAL)
+
+        self.engine.stop()
+
+        # Arayüzü güncelle; Başlat düğmesi yuvalar bitince (_on_batch_finished) açılır
         self.stop_button.config(state=tk.DISABLED)
         self.progress_var.set(0)
-        self.status_var.set("İndirme durduruldu")
-        
+        self.status_var.set("İndirme durduruluyor...")
+
         self.log("İndirme kullanıcı tarafından durduruldu")
-    
-    def get_quality_params(self, format_choice):
-        """Seçilen kaliteye göre yt-dlp parametrelerini döndür"""
-        quality = self.quality_var.get()
-        
-        if format_choice == "mp3":
-            if quality == "high":
-                return ["-x", "--audio-format", "mp3", "--audio-quality", "0"]
-            elif quality == "medium":
-                return ["-x", "--audio-format", "mp3", "--audio-quality", "5"]
-            else:  # low
-                return ["-x", "--audio-format", "mp3", "--audio-quality", "9"]
-        else:  # mp4
-            if quality == "high":
-                return ["-f", "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"]
-            elif quality == "medium":
-                return ["-f", "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]/best"]
-            else:  # low
-                return ["-f", "bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480][ext=mp4]/best"]
+
+    def _reset_ui(self):
+        """İndirme bittiğinde butonları ve durum bilgisini sıfırlar."""
+        self.download_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.status_var.set(self.get_translation("ready"))
+
+    def _on_batch_finished(self, summary):
+        """Motor turu bitirdiğinde çağrılır (ana iş parçacığı)."""
+        self._reset_ui()
+        if summary["stopped"]:
+            self.status_var.set("İndirme durduruldu")
+            return
+        self.log(f"İndirme turu bitti: {summary['done']}/{summary['total']} başarılı, "
+                 f"{len(summary['failed'])} başarısız, {summary['retries']} yeniden deneme")
+        # Yeniden denenmeyen veya deneme hakkı biten öğelerin raporu
+        for failure in summary["failures"]:
+            self.log(f"  Başarısız ({failure['class']}): {failure['url']} - {failure['error']}")
+        if summary["failures"]:
+            self.status_var.set(f"{len(summary['failures'])} öğe indirilemedi - ayrıntılar konsolda")
+
+    def _refresh_progress(self):
+        """İlerleme çubuğunu ve durum satırını sabit aralıkla günceller (ana iş parçacığı)."""
+        if self.engine.is_downloading:
+            events, done, total = self.engine.progress_snapshot()
+
+            running = sum((e["percent"] or 0) / 100.0 for e in events)
+            if total:
+                self.progress_var.set(min(100.0, (done + running) * 100.0 / total))
+
+            speed = sum(e["speed"] or 0 for e in events if e["phase"] == "download")
+            etas = [e["eta"] for e in events if e["phase"] == "download" and e["eta"] is not None]
+            phases = {e["phase"] for e in events}
+            status = f"{done}/{total} - {format_bytes(speed)}/s"
+            if etas:
+                status += f", ETA {format_duration(max(etas))}"
+            if "merge" in phases:
+                status += " - birleştiriliyor"
+            if "extract" in phases:
+                status += " - ses çıkarılıyor"
+            self.status_var.set(status)
+
+        self.root.after(PROGRESS_REFRESH_MS, self._refresh_progress)
     
     def on_format_change(self):
         """Format radyo butonu değiştiğinde ayarları kaydeder."""
@@ -545,6 +1121,68 @@ class YoutubeDownloader:
             self.settings["default_format"] = self.format_var.get()
             self.save_settings()
 
+    def create_bandwidth_manager(self):
+        """Ayarlardaki bant genişliği bütçesini ve çizelgesini yükler; geçersizse sınırsız kullanılır."""
+        try:
+            return BandwidthManager(self.settings)
+        except ValueError as e:
+            self.log(f"Bant genişliği ayarı yok sayıldı: {e}")
+            return BandwidthManager()
+
+    def apply_bandwidth_limit(self):
+        """Girilen hız sınırını kaydeder ve yürüyen indirmelere uygular."""
+        value = self.bandwidth_var.get().strip()
+        try:
+            parse_rate(value)
+        except ValueError:
+            messagebox.showerror("Hata", "Geçersiz hız sınırı! Örnek: 2M, 500K (boş = sınırsız)")
+            return
+        self.settings["bandwidth_limit"] = value
+        self.save_settings()
+        self.config_mtime = self.get_config_mtime()
+        self._apply_bandwidth_settings()
+
+    def _apply_bandwidth_settings(self):
+        try:
+            self.engine.set_bandwidth(self.settings)
+        except ValueError as e:
+            self.log(f"Bant genişliği ayarı uygulanamadı: {e}")
+            return
+        limit = self.engine.bandwidth.current_limit()
+        self.log(f"Hız sınırı: {format_bytes(limit) + '/s' if limit else 'sınırsız'}")
+
+    def get_config_mtime(self):
+        try:
+            return os.path.getmtime(self.config_file)
+        except OSError:
+            return None
+
+    def _watch_config(self):
+        """config.json'daki bant genişliği değişikliklerini indirmeleri durdurmadan uygular."""
+        mtime = self.get_config_mtime()
+        if mtime != self.config_mtime:
+            self.config_mtime = mtime
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    loaded_settings = json.load(f)
+            except (OSError, ValueError):
+                loaded_settings = None
+            if loaded_settings is not None:
+                changed = False
+                for name in ("bandwidth_limit", "bandwidth_schedule"):
+                    if loaded_settings.get(name) != self.settings.get(name):
+                        self.settings[name] = loaded_settings.get(name)
+                        changed = True
+                if changed:
+                    self.bandwidth_var.set(str(self.settings.get("bandwidth_limit") or ""))
+                    self._apply_bandwidth_settings()
+        self.root.after(CONFIG_WATCH_MS, self._watch_config)
+
+    def on_performance_change(self):
+        """Performans profili değiştiğinde ayarları kaydeder."""
+        self.settings["performance_profile"] = self.performance_var.get()
+        self.save_settings()
+
     def on_both_formats_toggle(self):
         """"Hem MP3 hem MP4" onay kutusu durumu değiştiğinde çağrılır."""
         self.settings["download_both"] = self.download_both_formats.get()
@@ -559,81 +1197,6 @@ class YoutubeDownloader:
         #     self.mp4_radio.config(state=tk.NORMAL)
         #     self.mp3_radio.config(state=tk.NORMAL)
 
-    def _download_single_format(self, url, download_dir, format_to_download, original_url_for_log):
-        """Belirli bir format için tek bir indirme işlemini gerçekleştirir."""
-        try:
-            self.log(f"İndiriliyor ({format_to_download.upper()}): {original_url_for_log}")
-            
-            cmd = [self.yt_dlp_path]
-            cmd.extend(self.get_quality_params(format_to_download))
-            
-            # Çıktı dosya adını formatla belirginleştir (isteğe bağlı ama karışıklığı önler)
-            # Örneğin: VideoAdi_mp3.mp3, VideoAdi_mp4.mp4
-            # Ancak yt-dlp zaten uzantıyı doğru ayarlayacaktır. Şimdilik %(title)s.%(ext)s kullanalım.
-            output_template = os.path.join(download_dir, "%(title)s.%(ext)s")
-            cmd.extend(["-o", output_template])
-            cmd.append(url)
-            
-            self.current_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            for line in self.current_process.stdout:
-                if not self.is_downloading:
-                    # Eğer genel indirme durdurulduysa, bu alt işlemi de durdur.
-                    if self.current_process.poll() is None: # Hala çalışıyorsa
-                        self.current_process.terminate()
-                        self.current_process.wait() # Sonlanmasını bekle
-                    self.log(f"İndirme durduruldu ({format_to_download.upper()}): {original_url_for_log}")
-                    return False # Başarısız oldu veya durduruldu
-                
-                self.log(line.strip()) 
-                self.root.update_idletasks()
-            
-            self.current_process.wait()
-            
-            if self.current_process.returncode == 0:
-                self.log(f"İndirme tamamlandı ({format_to_download.upper()}): {original_url_for_log}")
-                return True
-            else:
-                self.log(f"İndirme hatası ({format_to_download.upper()}): {original_url_for_log}, kod: {self.current_process.returncode}")
-                return False
-                
-        except Exception as e:
-            self.log(f"Hata ({format_to_download.upper()} indirme - {original_url_for_log}): {str(e)}")
-            return False
-
-    def download_worker(self):
-        """İndirme iş parçacığı."""
-        while not self.downloads_queue.empty() and self.is_downloading:
-            url = self.downloads_queue.get()
-            download_dir = self.dir_var.get()
-
-            try:
-                if self.download_both_formats.get():
-                    # Hem MP3 hem MP4 indir
-                    self._download_single_format(url, download_dir, "mp4", url)
-                    if self.is_downloading:  # MP4 indirme başarılı olduysa MP3'ü indir
-                        self._download_single_format(url, download_dir, "mp3", url)
-                else:
-                    # Seçili formatta indir
-                    format_choice = self.format_var.get()
-                    self._download_single_format(url, download_dir, format_choice, url)
-                    
-            except Exception as e:
-                self.log(f"Hata: {str(e)}")
-                
-            finally:
-                self.downloads_queue.task_done()
-                
-        self.is_downloading = False
-        self.root.after(0, self._reset_ui)
-
     def setup_language(self):
         """Dil ayarlarını yapılandırır."""
         self.current_lang = self.settings.get("language", "tr")
@@ -679,7 +1242,10 @@ class YoutubeDownloader:
             self.clear_button.config(text=self.get_translation("clear_list"))
         
         if hasattr(self, 'playlist_button'):
-            self.playlist_button.config(text=self.get_translation("add_playlist"))
+            if self.playlist_import_thread and self.playlist_import_thread.is_alive():
+                self.playlist_button.config(text=self.get_translation("cancel_import", "İçe Aktarmayı İptal Et"))
+            else:
+                self.playlist_button.config(text=self.get_translation("add_playlist"))
         
         if hasattr(self, 'format_label'):
             self.format_label.config(text=self.get_translation("format"))
@@ -696,6 +1262,23 @@ class YoutubeDownloader:
         if hasattr(self, 'low_radio'):
             self.low_radio.config(text=self.get_translation("low"))
         
+        if hasattr(self, 'performance_label'):
+            self.performance_label.config(text=self.get_translation("performance", "Performans:"))
+            self.perf_default_radio.config(text=self.get_translation("perf_default", "Standart"))
+            self.perf_fast_radio.config(text=self.get_translation("perf_fast", "Hızlı (paralel parça)"))
+            self.perf_aria2c_radio.config(text=self.get_translation("perf_aria2c", "aria2c (çoklu bağlantı)"))
+            self.bandwidth_label.config(text=self.get_translation("bandwidth_limit", "Hız sınırı:"))
+            self.apply_bandwidth_button.config(text=self.get_translation("apply", "Uygula"))
+        
+        if hasattr(self, 'sjf_checkbox'):
+            self.sjf_checkbox.config(text=self.get_translation("shortest_first", "Kısa videolar önce"))
+            self.list_menu.entryconfig(0, label=self.get_translation("priority_up", "Önceliği Artır"))
+            self.list_menu.entryconfig(1, label=self.get_translation("priority_down", "Önceliği Azalt"))
+            self.list_menu.entryconfig(2, label=self.get_translation("move_to_top", "En Başa Taşı"))
+            self.list_menu.entryconfig(4, label=self.get_translation("pause_item", "Duraklat"))
+            self.list_menu.entryconfig(5, label=self.get_translation("resume_item", "Devam Et"))
+            self.list_menu.entryconfig(6, label=self.get_translation("cancel_item", "İptal Et"))
+        
         if hasattr(self, 'download_folder_label'):
             self.download_folder_label.config(text=self.get_translation("download_folder"))
         
@@ -714,6 +1297,9 @@ class YoutubeDownloader:
         if hasattr(self, 'both_formats_checkbox'):
             self.both_formats_checkbox.config(text=self.get_translation("both_formats"))
         
+        if hasattr(self, 'search_log_button'):
+            self.search_log_button.config(text=self.get_translation("search_log", "Günlükte Ara"))
+        
         # LabelFrame başlıklarını güncelle - doğrudan referansla
         for widget in self.root.winfo_children():
             if isinstance(widget, ttk.LabelFrame) or isinstance(widget, tk.LabelFrame):
@@ -753,26 +1339,195 @@ class YoutubeDownloader:
             self.status_var.set(self.get_translation("ready"))
 
     def log(self, message):
-        """Konsola çıktı yaz"""
+        """Konsola çıktı yaz (herhangi bir iş parçacığından çağrılabilir)"""
+        # Tam günlük her zaman diske yazılır; konsol sadece son satırları tutar
+        if getattr(self, 'file_logger', None):
+            self.file_logger.info(message)
+
         # Konsol henüz oluşturulmadıysa, mesajı standart çıktıya yazdır
-        if self.console is None:
+        if getattr(self, 'console', None) is None:
             print(message)
             return
             
-        self.console.config(state=tk.NORMAL)
-        self.console.insert(tk.END, str(message) + "\n")
-        self.console.see(tk.END)
-        self.console.config(state=tk.DISABLED)
-        
-        # Arayüzü güncelle
-        self.root.update_idletasks()
+        self.ui_queue.put(("log", str(message)))
+
+    def get_console_max_lines(self):
+        """Konsolda tutulacak en fazla satır sayısını döndürür."""
+        try:
+            return max(100, int(self.settings.get("console_max_lines", DEFAULT_CONSOLE_MAX_LINES)))
+        except (TypeError, ValueError):
+            return DEFAULT_CONSOLE_MAX_LINES
+
+    def get_log_files(self):
+        """Disk günlüğü dosyalarını en eskiden en yeniye sıralı döndürür."""
+        files = [f"{self.log_file}.{i}" for i in range(LOG_FILE_BACKUP_COUNT, 0, -1)]
+        files.append(self.log_file)
+        return [path for path in files if os.path.exists(path)]
+
+    def search_log_files(self, pattern, limit=LOG_SEARCH_RESULT_LIMIT):
+        """Disk günlüğünü satır satır tarar; eşleşen (dosya, satır no, metin) listesini döndürür.
+
+        Dosyalar belleğe tamamen yüklenmez, en yeni sonuçlar korunur.
+        """
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+
+        results = deque(maxlen=limit)
+        for path in self.get_log_files():
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line_no, line in enumerate(f, 1):
+                        if regex.search(line):
+                            results.append((path, line_no, line.rstrip("\n")))
+            except OSError as e:
+                self.log(f"Günlük dosyası okunamadı: {path} - {e}")
+        return list(results)
+
+    def read_log_context(self, path, line_no, radius=5):
+        """Günlük dosyasındaki bir satırın çevresini döndürür."""
+        start = max(1, line_no - radius)
+        context = []
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for current, line in enumerate(f, 1):
+                if current < start:
+                    continue
+                if current > line_no + radius:
+                    break
+                marker = ">> " if current == line_no else "   "
+                context.append(marker + line.rstrip("\n"))
+        return "\n".join(context)
+
+    def show_log_search(self):
+        """Disk günlüğünde arama / hataya gitme penceresi."""
+        search_window = tk.Toplevel(self.root)
+        search_window.title(self.get_translation("search_log", "Günlükte Ara"))
+        search_window.geometry("700x450")
+        search_window.transient(self.root)
+
+        top_frame = ttk.Frame(search_window)
+        top_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        pattern_var = tk.StringVar()
+        pattern_entry = ttk.Entry(top_frame, textvariable=pattern_var)
+        pattern_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        result_list = tk.Listbox(search_window, height=12)
+        result_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        context_text = scrolledtext.ScrolledText(search_window, wrap=tk.NONE, height=8)
+        context_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        status_var = tk.StringVar()
+        ttk.Label(search_window, textvariable=status_var).pack(fill=tk.X, padx=10)
+
+        results = []
+        # Son başlatılan aramanın numarası; eski aramaların sonuçları atılır
+        current_search = [0]
+
+        def run_search(pattern):
+            if not pattern:
+                return
+            # Günlükler onlarca MiB olabilir: tarama arka planda yapılır, arayüz donmaz
+            current_search[0] += 1
+            search_id = current_search[0]
+            status_var.set("Aranıyor...")
+            threading.Thread(target=lambda: self.post_ui(show_results, search_id, self.search_log_files(pattern)),
+                             daemon=True).start()
+
+        def show_results(search_id, found):
+            if search_id != current_search[0] or not search_window.winfo_exists():
+                return
+            status_var.set(f"{len(found)} eşleşme")
+            results[:] = found
+            result_list.delete(0, tk.END)
+            result_list.insert(tk.END, *[text for _, _, text in results])
+            if results:
+                # En son eşleşmeye git
+                result_list.see(tk.END)
+                result_list.selection_set(tk.END)
+                show_context()
+            else:
+                messagebox.showinfo("Bilgi", "Eşleşme bulunamadı.", parent=search_window)
+
+        def show_context(event=None):
+            selection = result_list.curselection()
+            if not selection:
+                return
+            path, line_no, _ = results[selection[0]]
+            # Bağlam için dosya eşleşen satıra kadar okunur; bu da arka planda yapılır
+            threading.Thread(target=lambda: self.post_ui(show_context_text, path, line_no, read_context(path, line_no)),
+                             daemon=True).start()
+
+        def read_context(path, line_no):
+            try:
+                return self.read_log_context(path, line_no)
+            except OSError as e:
+                return str(e)
+
+        def show_context_text(path, line_no, context):
+            if not search_window.winfo_exists():
+                return
+            # Bu arada başka bir sonuç seçildiyse eski bağlam gösterilmez
+            selection = result_list.curselection()
+            if not selection or results[selection[0]][:2] != (path, line_no):
+                return
+            context_text.delete("1.0", tk.END)
+            context_text.insert(tk.END, f"{os.path.basename(path)}:{line_no}\n" + context)
+
+        result_list.bind("<<ListboxSelect>>", show_context)
+        pattern_entry.bind("<Return>", lambda e: run_search(pattern_var.get().strip()))
+
+        ttk.Button(top_frame, text="Ara", command=lambda: run_search(pattern_var.get().strip())).pack(side=tk.LEFT, padx=5)
+        ttk.Button(top_frame, text="Hatalara Git", command=lambda: run_search(ERROR_LINE_PATTERN)).pack(side=tk.LEFT, padx=5)
+        pattern_entry.focus_set()
+
+    def post_ui(self, callback, *args):
+        """Bir arayüz güncellemesini ana iş parçacığında çalıştırılmak üzere kuyruğa ekler."""
+        self.ui_queue.put(("call", callback, args))
+
+    def _process_ui_queue(self):
+        """Kuyruktaki log satırlarını ve arayüz güncellemelerini toplu olarak uygular."""
+        lines = []
+        calls = []
+        for _ in range(UI_QUEUE_BATCH_LIMIT):
+            try:
+                item = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "log":
+                lines.append(item[1])
+            else:
+                calls.append(item)
+
+        if lines:
+            # Tüm satırlar tek bir insert/see ile yazılır
+            self.console.config(state=tk.NORMAL)
+            self.console.insert(tk.END, "\n".join(lines) + "\n")
+            # Halka tampon: en eski satırları sil
+            line_count = int(self.console.index("end-1c").split(".")[0]) - 1
+            excess = line_count - self.get_console_max_lines()
+            if excess > 0:
+                self.console.delete("1.0", f"{excess + 1}.0")
+            self.console.see(tk.END)
+            self.console.config(state=tk.DISABLED)
+
+        for _, callback, args in calls:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Arayüz güncelleme hatası: {e}")
+
+        self.root.after(UI_QUEUE_REFRESH_MS, self._process_ui_queue)
 
     def change_language(self, lang_code):
         """Dil ayarını değiştirir."""
-        if self.current_lang == lang_code or lang_code not in self.available_languages:
+        if self.current_lang == lang_code or lang_code not in self.language_names:
             return
             
         self.current_lang = lang_code
+        self.translations = self.resolve_translations(lang_code)
         self.settings["language"] = lang_code
         self.save_settings()
         
@@ -781,7 +1536,7 @@ class YoutubeDownloader:
 
 
     def show_loading_screen(self):
-        """yt-dlp kontrol edilirken loading ekranı gösterir."""
+        """yt-dlp indirilirken loading ekranı gösterir."""
         # Loading penceresi
         self.loading_window = tk.Toplevel(self.root)
         self.loading_window.title(self.get_translation("loading"))
@@ -804,7 +1559,7 @@ class YoutubeDownloader:
         frame.pack(fill=tk.BOTH, expand=True)
         
         # Başlık
-        label = ttk.Label(frame, text=self.get_translation("checking_ytdlp"), font=("Arial", 12))
+        label = ttk.Label(frame, text=self.get_translation("ytdlp_downloading"), font=("Arial", 12))
         label.pack(pady=10)
         
         # Progress bar
@@ -813,46 +1568,39 @@ class YoutubeDownloader:
         progress.start(10)
         
         # Status label
-        self.loading_status = tk.StringVar(value=self.get_translation("checking_ytdlp"))
+        self.loading_status = tk.StringVar(value=self.get_translation("ytdlp_downloading"))
         status_label = ttk.Label(frame, textvariable=self.loading_status)
         status_label.pack(pady=5)
         
-        # Loading işlemi başlat
-        self.root.after(100, self.check_ytdlp_with_loading)
-        
-    def check_ytdlp_with_loading(self):
-        """Loading ekranı ile yt-dlp kontrol et ve gerekirse indir."""
-        # yt-dlp'nin olup olmadığına bak
-        if os.path.exists(self.yt_dlp_path):
-            self.loading_status.set(self.get_translation("ytdlp_ready"))
-            self.root.after(1000, self.close_loading_screen)
-        else:
-            # yt-dlp yoksa indirmeye başla
-            self.loading_status.set(self.get_translation("ytdlp_downloading"))
-            
-            # Ayrı bir thread'de indir
-            download_thread = threading.Thread(target=self.download_ytdlp_with_loading)
-            download_thread.daemon = True
-            download_thread.start()
+        # Ayrı bir thread'de indir; arayüz bu sırada donmaz
+        download_thread = threading.Thread(target=self.download_ytdlp_with_loading)
+        download_thread.daemon = True
+        download_thread.start()
     
     def download_ytdlp_with_loading(self):
         """Loading ekranı gösterirken yt-dlp indir."""
         success = self.download_ytdlp()
-        if success:
-            self.loading_status.set(self.get_translation("ytdlp_ready"))
-            self.root.after(1000, self.close_loading_screen)
-        else:
-            # İndirme başarısız olduysa yine de loading ekranını kapat
-            self.root.after(3000, self.close_loading_screen)
+        self.post_ui(self.close_loading_screen, success)
     
-    def close_loading_screen(self):
-        """Loading ekranını kapat."""
+    def close_loading_screen(self, success=True):
+        """Loading ekranını kapat; indirme başarısızsa kullanıcıyı bilgilendir."""
         if hasattr(self, 'loading_window'):
             self.loading_window.grab_release()
             self.loading_window.destroy()
+        if success:
+            self.log(f"{self.get_translation('ytdlp_ready')} {self.yt_dlp_path}")
+        else:
+            messagebox.showerror("Hata", 
+                "yt-dlp bulunamadı ve otomatik olarak indirilemedi.\n"
+                "İndirme özelliklerini kullanmak için lütfen yt-dlp'yi manuel olarak yükleyin:\n"
+                "1. https://github.com/yt-dlp/yt-dlp/releases adresinden indirin\n"
+                "2. İndirdiğiniz dosyayı appdata/bin klasörüne kopyalayın")
 
     def load_language_files(self):
-        """Mevcut dil dosyalarını lang/ klasöründen yükler ve eksikleri oluşturur"""
+        """Dil dosyalarının adlarını ve derlenmiş önbellek kayıtlarını yükler, eksikleri oluşturur.
+
+        Çeviriler burada okunmaz; load_language bir dili ilk kullanıldığında yükler.
+        """
         try:
             # Kaynak ve dağıtım dizinlerini belirle
             if getattr(sys, 'frozen', False):
@@ -862,53 +1610,149 @@ class YoutubeDownloader:
                 resources_dir = os.path.dirname(os.path.abspath(__file__))
                 dist_dir = resources_dir
 
-            # İkon dosyasını paket kaynağından kullanıcı dizinine kopyala
-            icon_src = os.path.join(resources_dir, 'youtube_icon.ico')
-            icon_dst = os.path.join(dist_dir, 'youtube_icon.ico')
-            if os.path.exists(icon_src) and not os.path.exists(icon_dst):
-                shutil.copy(icon_src, icon_dst)
-
-            resources_lang_dir = os.path.join(resources_dir, 'lang')
+            self.language_cache_dir = os.path.join(os.path.dirname(self.config_file), "cache", "lang")
+            index = self._read_language_index()
             dist_lang_dir = os.path.join(dist_dir, 'lang')
 
-            # Varsayılan dil dosyalarını paket kaynağından kullanıcı klasörüne kopyala
-            if os.path.exists(resources_lang_dir):
-                if not os.path.exists(dist_lang_dir):
-                    shutil.copytree(resources_lang_dir, dist_lang_dir)
-                else:
-                    # Eksik dosyaları kopyala
-                    for file in os.listdir(resources_lang_dir):
-                        if file.endswith('.txt'):
-                            src = os.path.join(resources_lang_dir, file)
-                            dst = os.path.join(dist_lang_dir, file)
-                            if not os.path.exists(dst):
-                                shutil.copy(src, dst)
-            else:
-                os.makedirs(dist_lang_dir, exist_ok=True)
+            # Paket kaynaklarını kullanıcı dizinine kopyalama kontrolü sadece
+            # exe değiştiğinde yapılır (kaynaktan çalışırken dizinler aynıdır)
+            bundle = self.language_bundle = None
+            if resources_dir != dist_dir:
+                bundle = self.language_bundle = self._file_stamp(sys.executable)
+                if index.get("bundle") != bundle:
+                    self._install_resource_files(resources_dir, dist_dir)
+            os.makedirs(dist_lang_dir, exist_ok=True)
 
-            # Kullanıcı dizinindeki dil dosyalarını tara ve yükle
-            for lang_file in os.listdir(dist_lang_dir):
-                if not lang_file.endswith('.txt'):
-                    continue
-                lang_code = lang_file.rsplit('.', 1)[0]
-                lang_path = os.path.join(dist_lang_dir, lang_file)
-                try:
-                    with open(lang_path, 'r', encoding='utf-8') as f:
-                        lang_name = f.readline().strip()
-                        self.language_names[lang_code] = lang_name
-                        translations = {}
-                        for line in f:
-                            line = line.strip()
-                            if not line or '=' not in line:
-                                continue
-                            key, value = line.split('=', 1)
-                            translations[key.strip()] = value.strip()
-                        self.available_languages[lang_code] = translations
-                except Exception as e:
-                    print(f"Dil dosyası yüklenirken hata: {lang_path} - {e}")
+            # Kullanıcı dizinindeki dil dosyalarını tara; değişmeyenlerin adı önbellekten gelir
+            cached_languages = index.get("languages", {})
+            changed = index.get("bundle") != bundle
+            with os.scandir(dist_lang_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.txt'):
+                        continue
+                    lang_code = entry.name.rsplit('.', 1)[0]
+                    stamp = self._file_stamp(entry.path)
+                    cached = cached_languages.get(lang_code)
+                    if cached is None or cached.get("stamp") != stamp:
+                        try:
+                            with open(entry.path, 'r', encoding='utf-8') as f:
+                                lang_name = f.readline().strip()
+                        except Exception as e:
+                            print(f"Dil dosyası yüklenirken hata: {entry.path} - {e}")
+                            continue
+                        cached = {"name": lang_name, "stamp": stamp, "compiled": False}
+                        changed = True
+                    cached["path"] = entry.path
+                    self.language_index[lang_code] = cached
+                    self.language_names[lang_code] = cached["name"]
+            if changed or len(cached_languages) != len(self.language_index):
+                self._save_language_index()
         except Exception as e:
             print(f"Dil dosyaları yüklenirken hata oluştu: {e}")
             self._create_default_translations()
+
+    def _install_resource_files(self, resources_dir, dist_dir):
+        """İkonu ve eksik dil dosyalarını paket kaynağından kullanıcı dizinine kopyalar."""
+        icon_src = os.path.join(resources_dir, 'youtube_icon.ico')
+        icon_dst = os.path.join(dist_dir, 'youtube_icon.ico')
+        if os.path.exists(icon_src) and not os.path.exists(icon_dst):
+            shutil.copy(icon_src, icon_dst)
+
+        resources_lang_dir = os.path.join(resources_dir, 'lang')
+        dist_lang_dir = os.path.join(dist_dir, 'lang')
+        if os.path.exists(resources_lang_dir):
+            if not os.path.exists(dist_lang_dir):
+                shutil.copytree(resources_lang_dir, dist_lang_dir)
+            else:
+                # Eksik dosyaları kopyala
+                for file in os.listdir(resources_lang_dir):
+                    if file.endswith('.txt'):
+                        src = os.path.join(resources_lang_dir, file)
+                        dst = os.path.join(dist_lang_dir, file)
+                        if not os.path.exists(dst):
+                            shutil.copy(src, dst)
+
+    @staticmethod
+    def _file_stamp(path):
+        """Önbellek geçerliliği için dosyanın (mtime_ns, boyut) damgası."""
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_language_index(self):
+        """Derlenmiş dil önbelleğinin dizinini okur; yoksa veya eskiyse boş döner."""
+        try:
+            with open(os.path.join(self.language_cache_dir, "index.marshal"), 'rb') as f:
+                index = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != LANGUAGE_CACHE_VERSION:
+            return {}
+        return index
+
+    def _write_language_cache_file(self, name, data):
+        """Önbellek dosyasını geçici dosya üzerinden atomik olarak yazar."""
+        try:
+            os.makedirs(self.language_cache_dir, exist_ok=True)
+            path = os.path.join(self.language_cache_dir, name)
+            with open(path + ".tmp", 'wb') as f:
+                marshal.dump(data, f)
+            os.replace(path + ".tmp", path)
+        except (OSError, ValueError) as e:
+            print(f"Dil önbelleği yazılamadı: {e}")
+
+    def _save_language_index(self):
+        languages = {
+            code: {"name": entry["name"], "stamp": entry["stamp"], "compiled": entry["compiled"]}
+            for code, entry in self.language_index.items()
+        }
+        self._write_language_cache_file("index.marshal", {
+            "version": LANGUAGE_CACHE_VERSION,
+            "bundle": self.language_bundle,
+            "languages": languages,
+        })
+
+    def load_language(self, lang_code):
+        """Bir dilin çevirilerini döndürür; derlenmiş önbellek eskiyse dil dosyasını yeniden derler."""
+        if lang_code in self.available_languages:
+            return self.available_languages[lang_code]
+        entry = self.language_index.get(lang_code)
+        if entry is None:
+            return {}
+        translations = None
+        cache_name = f"{lang_code}.marshal"
+        if entry["compiled"]:
+            try:
+                with open(os.path.join(self.language_cache_dir, cache_name), 'rb') as f:
+                    translations = marshal.load(f)
+            except (OSError, EOFError, ValueError, TypeError):
+                translations = None
+        if not isinstance(translations, dict):
+            translations = {}
+            try:
+                with open(entry["path"], 'r', encoding='utf-8') as f:
+                    f.readline()  # Dil adı
+                    for line in f:
+                        line = line.strip()
+                        if not line or '=' not in line:
+                            continue
+                        key, value = line.split('=', 1)
+                        translations[key.strip()] = value.strip()
+            except Exception as e:
+                print(f"Dil dosyası yüklenirken hata: {entry['path']} - {e}")
+                return {}
+            self._write_language_cache_file(cache_name, translations)
+            entry["compiled"] = True
+            self._save_language_index()
+        self.available_languages[lang_code] = translations
+        return translations
+
+    def resolve_translations(self, lang_code):
+        """Seçili dil ve yedek dilden tek bir düz çeviri tablosu oluşturur."""
+        translations = {}
+        if lang_code != FALLBACK_LANGUAGE:
+            translations.update(self.load_language(FALLBACK_LANGUAGE))
+        translations.update(self.load_language(lang_code))
+        return translations
     
     def create_default_language_files(self, lang_dir):
         """Varsayılan dil dosyalarını oluşturur"""
@@ -980,7 +1824,22 @@ class YoutubeDownloader:
             "ytdlp_downloading": "yt-dlp indiriliyor...",
             "ytdlp_ready": "yt-dlp hazır",
             "language_changed": "Dil değiştirildi",
-            "ytdlp_found": "yt-dlp bulundu:"
+            "ytdlp_found": "yt-dlp bulundu:",
+            "search_log": "Günlükte Ara",
+            "cancel_import": "İçe Aktarmayı İptal Et",
+            "performance": "Performans:",
+            "perf_default": "Standart",
+            "perf_fast": "Hızlı (paralel parça)",
+            "perf_aria2c": "aria2c (çoklu bağlantı)",
+            "bandwidth_limit": "Hız sınırı:",
+            "apply": "Uygula",
+            "shortest_first": "Kısa videolar önce",
+            "priority_up": "Önceliği Artır",
+            "priority_down": "Önceliği Azalt",
+            "move_to_top": "En Başa Taşı",
+            "pause_item": "Duraklat",
+            "resume_item": "Devam Et",
+            "cancel_item": "İptal Et"
         }
         
         # İngilizce çeviriler
@@ -1015,7 +1874,22 @@ class YoutubeDownloader:
             "ytdlp_downloading": "Downloading yt-dlp...",
             "ytdlp_ready": "yt-dlp ready",
             "language_changed": "Language changed",
-            "ytdlp_found": "yt-dlp found:"
+            "ytdlp_found": "yt-dlp found:",
+            "search_log": "Search Log",
+            "cancel_import": "Cancel Import",
+            "performance": "Performance:",
+            "perf_default": "Standard",
+            "perf_fast": "Fast (parallel fragments)",
+            "perf_aria2c": "aria2c (multi-connection)",
+            "bandwidth_limit": "Speed limit:",
+            "apply": "Apply",
+            "shortest_first": "Shortest videos first",
+            "priority_up": "Raise Priority",
+            "priority_down": "Lower Priority",
+            "move_to_top": "Move to Top",
+            "pause_item": "Pause",
+            "resume_item": "Resume",
+            "cancel_item": "Cancel"
         }
 
         # Arapça çeviriler
@@ -1149,19 +2023,8 @@ class YoutubeDownloader:
         }
 
     def get_translation(self, key, default=""):
-        """Mevcut dilde çeviriyi döndürür, yoksa varsayılanı kullanır"""
-        if self.current_lang not in self.available_languages:
-            # Varsayılan dile geri dön
-            if "tr" in self.available_languages:
-                self.current_lang = "tr"
-            elif "en" in self.available_languages:
-                self.current_lang = "en"
-            else:
-                # Mevcut diller listesi boşsa veya geçersizse
-                return default
-                
-        translations = self.available_languages[self.current_lang]
-        return translations.get(key, default)
+        """Mevcut dilde çeviriyi döndürür; yoksa yedek dili, o da yoksa varsayılanı kullanır"""
+        return self.translations.get(key, default)
 
     def create_ui(self):
         """Kullanıcı arayüzünü oluşturur."""
@@ -1214,6 +2077,20 @@ class YoutubeDownloader:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.url_listbox.config(yscrollcommand=scrollbar.set)
         
+        # Sürükle-bırak ile sıralama ve sağ tık menüsü (öncelik)
+        self.url_listbox.bind("<Button-1>", self._on_list_press)
+        self.url_listbox.bind("<B1-Motion>", self._on_list_drag)
+        self.url_listbox.bind("<ButtonRelease-1>", self._on_list_release)
+        self.url_listbox.bind("<Button-3>", self._show_list_menu)
+        self.list_menu = tk.Menu(self.url_listbox, tearoff=0)
+        self.list_menu.add_command(label=self.get_translation("priority_up", "Önceliği Artır"), command=lambda: self.change_priority(1))
+        self.list_menu.add_command(label=self.get_translation("priority_down", "Önceliği Azalt"), command=lambda: self.change_priority(-1))
+        self.list_menu.add_command(label=self.get_translation("move_to_top", "En Başa Taşı"), command=self.move_selected_to_top)
+        self.list_menu.add_separator()
+        self.list_menu.add_command(label=self.get_translation("pause_item", "Duraklat"), command=self.pause_selected)
+        self.list_menu.add_command(label=self.get_translation("resume_item", "Devam Et"), command=self.resume_selected)
+        self.list_menu.add_command(label=self.get_translation("cancel_item", "İptal Et"), command=self.cancel_selected)
+        
         # Liste kontrol butonları
         list_control_frame = ttk.Frame(main_frame)
         list_control_frame.pack(fill=tk.X, pady=5)
@@ -1227,6 +2104,14 @@ class YoutubeDownloader:
         self.playlist_button = ttk.Button(list_control_frame, text=self.get_translation("add_playlist"), command=self.add_playlist)
         self.playlist_button.pack(side=tk.LEFT, padx=5)
         
+        self.sjf_checkbox = ttk.Checkbutton(
+            list_control_frame,
+            text=self.get_translation("shortest_first", "Kısa videolar önce"),
+            variable=self.sjf_var,
+            command=self.on_sjf_toggle
+        )
+        self.sjf_checkbox.pack(side=tk.RIGHT, padx=5)
+        
         # İndirme ayarları
         settings_frame = ttk.LabelFrame(main_frame, text=self.get_translation("download_settings"), padding="5")
         settings_frame.pack(fill=tk.X, pady=5)
@@ -1269,6 +2154,32 @@ class YoutubeDownloader:
         self.low_radio = ttk.Radiobutton(quality_frame, text=self.get_translation("low"), variable=self.quality_var, value="low")
         self.low_radio.pack(side=tk.LEFT, padx=5)
         
+        # Performans profili
+        performance_frame = ttk.Frame(settings_frame)
+        performance_frame.pack(fill=tk.X, pady=5)
+        
+        self.performance_label = ttk.Label(performance_frame, text=self.get_translation("performance", "Performans:"))
+        self.performance_label.pack(side=tk.LEFT, padx=5)
+        
+        self.perf_default_radio = ttk.Radiobutton(performance_frame, text=self.get_translation("perf_default", "Standart"), variable=self.performance_var, value="default", command=self.on_performance_change)
+        self.perf_default_radio.pack(side=tk.LEFT, padx=5)
+        
+        self.perf_fast_radio = ttk.Radiobutton(performance_frame, text=self.get_translation("perf_fast", "Hızlı (paralel parça)"), variable=self.performance_var, value="fast", command=self.on_performance_change)
+        self.perf_fast_radio.pack(side=tk.LEFT, padx=5)
+        
+        self.perf_aria2c_radio = ttk.Radiobutton(performance_frame, text=self.get_translation("perf_aria2c", "aria2c (çoklu bağlantı)"), variable=self.performance_var, value="aria2c", command=self.on_performance_change)
+        self.perf_aria2c_radio.pack(side=tk.LEFT, padx=5)
+        
+        self.apply_bandwidth_button = ttk.Button(performance_frame, text=self.get_translation("apply", "Uygula"), command=self.apply_bandwidth_limit)
+        self.apply_bandwidth_button.pack(side=tk.RIGHT, padx=5)
+        
+        bandwidth_entry = ttk.Entry(performance_frame, textvariable=self.bandwidth_var, width=8)
+        bandwidth_entry.pack(side=tk.RIGHT, padx=5)
+        bandwidth_entry.bind("<Return>", lambda e: self.apply_bandwidth_limit())
+        
+        self.bandwidth_label = ttk.Label(performance_frame, text=self.get_translation("bandwidth_limit", "Hız sınırı:"))
+        self.bandwidth_label.pack(side=tk.RIGHT, padx=5)
+        
         # İndirme klasörü
         dir_frame = ttk.Frame(settings_frame)
         dir_frame.pack(fill=tk.X, pady=5)
@@ -1310,25 +2221,26 @@ class YoutubeDownloader:
         console_frame = ttk.LabelFrame(main_frame, text=self.get_translation("console_output"), padding="5")
         console_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
+        self.search_log_button = ttk.Button(console_frame, text=self.get_translation("search_log", "Günlükte Ara"), command=self.show_log_search)
+        self.search_log_button.pack(anchor=tk.E, pady=(0, 5))
+        
         self.console = scrolledtext.ScrolledText(console_frame, wrap=tk.WORD, height=12)
         self.console.pack(fill=tk.BOTH, expand=True)
         self.console.config(state=tk.DISABLED)
 
+        # Arayüz kuyruğunu sabit aralıkla işle (ilerleme ve config izleme finish_startup'ta başlar)
+        self.root.after(UI_QUEUE_REFRESH_MS, self._process_ui_queue)
+
 if __name__ == "__main__":
+    # Paketlenmiş exe'de yt-dlp işçi süreçlerinin başlatılabilmesi için
+    multiprocessing.freeze_support()
+
     # Global _ fonksiyonunu tanımla (gettext'in sağladığı)
     # Başlangıçta, hiçbir çeviri yüklenmemişse, sadece orijinal metni döndürür.
     _ = gettext.gettext
 
     root = tk.Tk()
+    # Pencere ilk olay döngüsü turunda çizilir; yt-dlp kontrolü ve iş kuyruğu
+    # bundan sonra yapılır (finish_startup)
     app = YoutubeDownloader(root)
-    # Ana pencereyi gizle ve loading ekranını göster
-    root.withdraw()
-    app.show_loading_screen()
-    # Loading ekranı kapandığında ana pencereyi göster
-    def show_main_window():
-        if not hasattr(app, 'loading_window') or not app.loading_window.winfo_exists():
-            root.deiconify()
-        else:
-            root.after(100, show_main_window)
-    root.after(500, show_main_window)
     root.mainloop()